@@ -1,7 +1,27 @@
 #Input Validation Helpers
 
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from fractions import Fraction
+from functools import wraps
+from hashlib import blake2b
+from heapq import heapify, heappop, heappush
+from itertools import chain
+from math import exp, gcd, hypot, isqrt
+import json
+import random
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def validate_matrix(matrix, name="matrix"):
     
+    if isinstance(matrix, Matrix):
+        return matrix.shape
     if not matrix:
         raise ValueError(f"Invalid input: {name} cannot be empty")
     if not isinstance(matrix, list):
@@ -33,6 +53,484 @@ def validate_vector(vector, name="vector"):
         raise ValueError(f"Invalid input: {name} must be a list")
     return len(vector)
 
+# Compact Matrix Type
+
+class Matrix:
+    # row-major packed doubles; transpose() of a Matrix is a view that swaps strides
+    __slots__ = ("data", "shape", "strides", "_structure")
+
+    def __init__(self, rows):
+        num_rows, num_cols = validate_matrix(rows)
+        data = array("d")
+        for row in rows:
+            data.extend(row)
+        self.data = data
+        self.shape = (num_rows, num_cols)
+        self.strides = (num_cols, 1)
+        self._structure = None
+
+    @classmethod
+    def from_buffer(cls, data, num_rows, num_cols, strides=None):
+        if num_rows <= 0 or num_cols <= 0:
+            raise ValueError("Invalid input: matrix cannot be empty")
+        if len(data) < num_rows * num_cols:
+            raise ValueError(f"Invalid input: buffer too small for a {num_rows}x{num_cols} matrix")
+        M = cls.__new__(cls)
+        M.data = data if isinstance(data, array) and data.typecode == "d" else array("d", data)
+        M.shape = (num_rows, num_cols)
+        M.strides = strides if strides is not None else (num_cols, 1)
+        M._structure = None
+        return M
+
+    @classmethod
+    def zeros(cls, num_rows, num_cols):
+        return cls.from_buffer(array("d", bytes(8 * num_rows * num_cols)), num_rows, num_cols)
+
+    def is_contiguous(self):
+        return self.strides == (self.shape[1], 1)
+
+    def row(self, i):
+        num_rows, num_cols = self.shape
+        if i < 0:
+            i += num_rows
+        if not 0 <= i < num_rows:
+            raise IndexError("row index out of range")
+        s0, s1 = self.strides
+        start = i * s0
+        if s1 == 1:
+            return self.data[start:start + num_cols].tolist()
+        return self.data[start:start + s1 * (num_cols - 1) + 1:s1].tolist()
+
+    def tolist(self):
+        return [self.row(i) for i in range(self.shape[0])]
+
+    def copy(self):
+        if self.is_contiguous():
+            num_rows, num_cols = self.shape
+            return Matrix.from_buffer(self.data[:num_rows * num_cols], num_rows, num_cols)
+        return Matrix(self.tolist())
+
+    def transpose(self):
+        num_rows, num_cols = self.shape
+        s0, s1 = self.strides
+        return Matrix.from_buffer(self.data, num_cols, num_rows, (s1, s0))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        for i in range(self.shape[0]):
+            yield self.row(i)
+
+    def _offset(self, i, j):
+        num_rows, num_cols = self.shape
+        if i < 0:
+            i += num_rows
+        if j < 0:
+            j += num_cols
+        if not (0 <= i < num_rows and 0 <= j < num_cols):
+            raise IndexError("matrix index out of range")
+        return i * self.strides[0] + j * self.strides[1]
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            return self.data[self._offset(*index)]
+        return self.row(index)
+
+    def __setitem__(self, index, value):
+        self.data[self._offset(*index)] = value
+        self._structure = None
+
+    def __eq__(self, other):
+        if isinstance(other, Matrix):
+            return self.shape == other.shape and self.tolist() == other.tolist()
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Matrix({self.tolist()})"
+
+def _rows_of(matrix):
+    if isinstance(matrix, Matrix):
+        return matrix.tolist()
+    return [row[:] for row in matrix]
+
+def _packed(result):
+    # array("d") cannot hold complex entries (eigenvectors of a rotation), so those results stay lists
+    try:
+        return Matrix(result)
+    except TypeError:
+        return result
+
+def _like(template, result):
+    if isinstance(template, Matrix):
+        return _packed(result)
+    return result
+
+def _like_any(templates, result):
+    for template in templates:
+        if isinstance(template, Matrix):
+            return _packed(result)
+    return result
+
+# NumPy Backend
+
+# below this size the conversion to and from ndarrays costs more than the pure-Python kernels
+NUMPY_MIN_SIZE = 8
+
+_backend = "auto"
+
+def set_backend(name):
+    global _backend
+    if name not in ("auto", "python", "numpy"):
+        raise ValueError(f"Invalid input: unknown backend '{name}' (expected auto, python or numpy)")
+    if name == "numpy" and np is None:
+        raise ValueError("Invalid input: numpy backend requested but numpy is not installed")
+    _backend = name
+
+def get_backend():
+    if _backend == "auto":
+        return "numpy" if np is not None else "python"
+    return _backend
+
+def _use_numpy(size):
+    if np is None or _backend == "python":
+        return False
+    return _backend == "numpy" or size >= NUMPY_MIN_SIZE
+
+def _float_entries(*matrices):
+    # float64 is only a faithful stand-in when the Python result would be float anyway; int-only,
+    # Fraction and complex input stays on the exact Python kernels
+    types = set()
+    for M in matrices:
+        if isinstance(M, Matrix):
+            types.add(float)
+        else:
+            types.update(map(type, chain.from_iterable(M)))
+    return float in types and types <= {int, float}
+
+def _to_numpy(matrix):
+    if isinstance(matrix, Matrix):
+        num_rows, num_cols = matrix.shape
+        s0, s1 = matrix.strides
+        flat = np.frombuffer(matrix.data, dtype=np.float64)
+        return np.lib.stride_tricks.as_strided(flat, (num_rows, num_cols), (s0 * 8, s1 * 8)).copy()
+    try:
+        return np.array(matrix, dtype=np.float64)
+    except TypeError:
+        # A - lambda I for a complex eigenvalue, and the eigenvector bases built from it
+        return np.array(matrix, dtype=np.complex128)
+
+def _from_numpy(template, result):
+    if isinstance(template, Matrix) and result.dtype.kind != "c":
+        num_rows, num_cols = result.shape
+        data = array("d")
+        data.frombytes(np.ascontiguousarray(result, dtype=np.float64).tobytes())
+        return Matrix.from_buffer(data, num_rows, num_cols)
+    return result.tolist()
+
+def _np_rref(A):
+    num_rows, num_cols = A.shape
+    current_row = 0
+    pivot_cols = []
+    for c in range(num_cols):
+        candidates = np.nonzero(np.abs(A[current_row:, c]) > 1e-10)[0]
+        if not candidates.size:
+            continue
+        pivot_row = current_row + candidates[0]
+        A[[current_row, pivot_row]] = A[[pivot_row, current_row]]
+        A[current_row] /= A[current_row, c]
+        factors = A[:, c].copy()
+        factors[current_row] = 0.0
+        A -= np.outer(factors, A[current_row])
+        pivot_cols.append(c)
+        current_row += 1
+        if current_row >= num_rows:
+            break
+    return A, pivot_cols
+
+def _np_lu(A):
+    n = A.shape[0]
+    L = np.eye(n)
+    U = np.zeros((n, n))
+    for i in range(n):
+        U[i, i:] = A[i, i:] - L[i, :i] @ U[:i, i:]
+        if abs(U[i, i]) < 1e-10:
+            raise ValueError("Matrix requires pivoting for LU decomposition (zero pivot encountered)")
+        L[i + 1:, i] = (A[i + 1:, i] - L[i + 1:, :i] @ U[:i, i]) / U[i, i]
+    return L, U
+
+def _np_qr(A):
+    Q, R = np.linalg.qr(A)
+    signs = np.where(np.diag(R) < 0, -1.0, 1.0)
+    return Q * signs, R * signs[:, None]
+
+def _np_cholesky(A):
+    # lower triangular L as rows, or None under the same "not safely positive" pivot test as _cholesky_factor
+    try:
+        L = np.linalg.cholesky(A)
+    except np.linalg.LinAlgError:
+        return None
+    if not (np.diag(L) ** 2 > 1e-10 * np.abs(np.diag(A))).all():
+        return None
+    return L.tolist()
+
+def _np_gauss_jordan(A, B):
+    # partial-pivoting elimination of [A | B], same 1e-10 singularity test as inverse()
+    n = A.shape[0]
+    augment = np.hstack((A, B))
+    for i in range(n):
+        pivot_row = i + int(np.argmax(np.abs(augment[i:, i])))
+        if pivot_row != i:
+            augment[[i, pivot_row]] = augment[[pivot_row, i]]
+        pivot = augment[i, i]
+        if abs(pivot) < 1e-10:
+            raise ValueError("matrix is singular")
+        augment[i] /= pivot
+        factors = augment[:, i].copy()
+        factors[i] = 0.0
+        augment -= np.outer(factors, augment[i])
+    return augment[:, n:]
+
+def _np_det(A):
+    n = A.shape[0]
+    total = 1.0
+    for i in range(n):
+        pivot_row = i + int(np.argmax(np.abs(A[i:, i])))
+        if pivot_row != i:
+            A[[i, pivot_row]] = A[[pivot_row, i]]
+            total *= -1
+        if abs(A[i, i]) < 1e-10:
+            return 0.0
+        A[i + 1:, i:] -= np.outer(A[i + 1:, i] / A[i, i], A[i, i:])
+        total *= A[i, i]
+    return float(total)
+
+def _np_eigenvalues(A, tol):
+    if np.allclose(A, A.T, rtol=0.0, atol=1e-10):
+        return _np_symmetric_eigen(A)[0]
+    values = np.linalg.eigvals(A)
+    values = values[np.argsort(-np.abs(values), kind="stable")]
+    if np.all(np.abs(values.imag) < tol):
+        return values.real.tolist()
+    return [complex(x) if abs(x.imag) >= tol else float(x.real) for x in values]
+
+def _np_symmetric_eigen(A):
+    values, vectors = np.linalg.eigh(A)
+    order = np.argsort(-np.abs(values), kind="stable")
+    return values[order].tolist(), vectors[:, order].T.tolist()
+
+# Result Cache
+
+_MISSING = object()
+
+class _ResultCache:
+    # LRU keyed on argument digests, bounded by entry count and by approximate key + result size
+    __slots__ = ("entries", "max_entries", "max_bytes", "nbytes", "hits", "misses")
+
+    def __init__(self, max_entries, max_bytes):
+        self.entries = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return _MISSING
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value):
+        # keys are digests, so they add a small fixed cost rather than a copy of the input
+        size = _approx_nbytes(value) + _approx_nbytes(key)
+        if size > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1]
+        self.entries[key] = (value, size)
+        self.nbytes += size
+        while len(self.entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.nbytes -= evicted
+
+_cache = None
+
+def enable_cache(max_entries=256, max_bytes=64 * 1024 * 1024):
+    global _cache
+    if max_entries <= 0 or max_bytes <= 0:
+        raise ValueError("Invalid input: cache limits must be positive")
+    _cache = _ResultCache(max_entries, max_bytes)
+
+def disable_cache():
+    global _cache
+    _cache = None
+
+def clear_cache():
+    if _cache is not None:
+        _cache.entries.clear()
+        _cache.nbytes = 0
+        _cache.hits = 0
+        _cache.misses = 0
+
+def cache_info():
+    if _cache is None:
+        return {"enabled": False, "hits": 0, "misses": 0, "entries": 0, "bytes": 0,
+                "max_entries": 0, "max_bytes": 0}
+    return {"enabled": True, "hits": _cache.hits, "misses": _cache.misses,
+            "entries": len(_cache.entries), "bytes": _cache.nbytes,
+            "max_entries": _cache.max_entries, "max_bytes": _cache.max_bytes}
+
+def _content_key(value):
+    # fixed 16-byte blake2b digest, so an entry never keeps a copy of its input alive. Element types
+    # are hashed too (float buffers are tagged, anything else goes in by repr), so 1, 1.0 and
+    # Fraction(1) never share an entry
+    if isinstance(value, Matrix):
+        num_rows, num_cols = value.shape
+        data = value.data[:num_rows * num_cols] if value.is_contiguous() else value.copy().data
+        header, buffers = ("M", value.shape), (data,)
+    elif isinstance(value, SparseMatrix):
+        header, buffers = ("S", value.shape), (value.indptr, value.indices, value.values)
+    elif isinstance(value, BandMatrix):
+        header, buffers = ("B", value.size, value.lower, value.upper), (value.data,)
+    elif isinstance(value, list):
+        nested = bool(value) and isinstance(value[0], list)
+        flat = list(chain.from_iterable(value)) if nested else value
+        if flat and set(map(type, flat)) == {float} and (not nested or all(len(row) == len(value[0]) for row in value)):
+            header, buffers = ("F", nested, len(value), len(flat)), (array("d", flat),)
+        else:
+            header, buffers = ("R",), (repr(value).encode(),)
+    else:
+        return (type(value), value)
+    h = blake2b(repr(header).encode(), digest_size=16)
+    for buffer in buffers:
+        h.update(buffer)
+    return h.digest()
+
+def _copy_result(value):
+    if isinstance(value, list):
+        return [_copy_result(x) for x in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_result(x) for x in value)
+    if isinstance(value, (Matrix, SparseMatrix)):
+        return value.copy()
+    return value
+
+def _approx_nbytes(value):
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_approx_nbytes(x) for x in value)
+    if isinstance(value, Matrix):
+        return 64 + value.data.itemsize * len(value.data)
+    if isinstance(value, SparseMatrix):
+        return 64 + sum(a.itemsize * len(a) for a in (value.indptr, value.indices, value.values))
+    return sys.getsizeof(value)
+
+def _cached(func):
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _cache
+        if cache is None:
+            return func(*args, **kwargs)
+        try:
+            key = (name, tuple(map(_content_key, args)), tuple((k, _content_key(v)) for k, v in sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        result = cache.get(key)
+        if result is not _MISSING:
+            return _copy_result(result)
+        result = func(*args, **kwargs)
+        cache.put(key, _copy_result(result))
+        return result
+
+    return wrapper
+
+# Fixed-Size Kernels
+
+# closed-form det/inverse for n <= 4 on a flat row-major list; no copies, pivot searches or loops
+SMALL_KERNEL_MAX = 4
+
+def _det_small(a, n):
+    if n == 1:
+        return 1.0 * a[0]
+    if n == 2:
+        return 1.0 * (a[0] * a[3] - a[1] * a[2])
+    if n == 3:
+        return 1.0 * (a[0] * (a[4] * a[8] - a[5] * a[7])
+                      - a[1] * (a[3] * a[8] - a[5] * a[6])
+                      + a[2] * (a[3] * a[7] - a[4] * a[6]))
+    s0 = a[0] * a[5] - a[4] * a[1]
+    s1 = a[0] * a[6] - a[4] * a[2]
+    s2 = a[0] * a[7] - a[4] * a[3]
+    s3 = a[1] * a[6] - a[5] * a[2]
+    s4 = a[1] * a[7] - a[5] * a[3]
+    s5 = a[2] * a[7] - a[6] * a[3]
+    c5 = a[10] * a[15] - a[14] * a[11]
+    c4 = a[9] * a[15] - a[13] * a[11]
+    c3 = a[9] * a[14] - a[13] * a[10]
+    c2 = a[8] * a[15] - a[12] * a[11]
+    c1 = a[8] * a[14] - a[12] * a[10]
+    c0 = a[8] * a[13] - a[12] * a[9]
+    return 1.0 * (s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0)
+
+def _small_is_singular(a, n, d):
+    # |det| relative to the Hadamard bound (product of row norms), so scaling the matrix does not matter
+    bound = 1.0
+    for i in range(0, n * n, n):
+        bound *= hypot(*map(abs, a[i:i + n]))
+    return abs(d) <= 1e-10 * bound
+
+def _inverse_small(a, n):
+    # returns the flat inverse, or None when the matrix is singular
+    d = _det_small(a, n)
+    if d == 0 or _small_is_singular(a, n, d):
+        return None
+    r = 1.0 / d
+    if n == 1:
+        return [r]
+    if n == 2:
+        return [a[3] * r, -a[1] * r, -a[2] * r, a[0] * r]
+    if n == 3:
+        return [(a[4] * a[8] - a[5] * a[7]) * r, (a[2] * a[7] - a[1] * a[8]) * r, (a[1] * a[5] - a[2] * a[4]) * r,
+                (a[5] * a[6] - a[3] * a[8]) * r, (a[0] * a[8] - a[2] * a[6]) * r, (a[2] * a[3] - a[0] * a[5]) * r,
+                (a[3] * a[7] - a[4] * a[6]) * r, (a[1] * a[6] - a[0] * a[7]) * r, (a[0] * a[4] - a[1] * a[3]) * r]
+    s0 = a[0] * a[5] - a[4] * a[1]
+    s1 = a[0] * a[6] - a[4] * a[2]
+    s2 = a[0] * a[7] - a[4] * a[3]
+    s3 = a[1] * a[6] - a[5] * a[2]
+    s4 = a[1] * a[7] - a[5] * a[3]
+    s5 = a[2] * a[7] - a[6] * a[3]
+    c5 = a[10] * a[15] - a[14] * a[11]
+    c4 = a[9] * a[15] - a[13] * a[11]
+    c3 = a[9] * a[14] - a[13] * a[10]
+    c2 = a[8] * a[15] - a[12] * a[11]
+    c1 = a[8] * a[14] - a[12] * a[10]
+    c0 = a[8] * a[13] - a[12] * a[9]
+    return [(a[5] * c5 - a[6] * c4 + a[7] * c3) * r, (-a[1] * c5 + a[2] * c4 - a[3] * c3) * r,
+            (a[13] * s5 - a[14] * s4 + a[15] * s3) * r, (-a[9] * s5 + a[10] * s4 - a[11] * s3) * r,
+            (-a[4] * c5 + a[6] * c2 - a[7] * c1) * r, (a[0] * c5 - a[2] * c2 + a[3] * c1) * r,
+            (-a[12] * s5 + a[14] * s2 - a[15] * s1) * r, (a[8] * s5 - a[10] * s2 + a[11] * s1) * r,
+            (a[4] * c4 - a[5] * c2 + a[7] * c0) * r, (-a[0] * c4 + a[1] * c2 - a[3] * c0) * r,
+            (a[12] * s4 - a[13] * s2 + a[15] * s0) * r, (-a[8] * s4 + a[9] * s2 - a[11] * s0) * r,
+            (-a[4] * c3 + a[5] * c1 - a[6] * c0) * r, (a[0] * c3 - a[1] * c1 + a[2] * c0) * r,
+            (-a[12] * s3 + a[13] * s1 - a[14] * s0) * r, (a[8] * s3 - a[9] * s1 + a[10] * s0) * r]
+
+def _flatten(matrix):
+    if isinstance(matrix, Matrix):
+        return matrix.copy().data.tolist()
+    return [x for row in matrix for x in row]
+
 # functions
 
 def get_matrix():
@@ -55,11 +553,27 @@ def get_vector():
     v = list(map(float, input(f"Vector: ").split()))
     return v
 
-def rref(matrix):
+@_cached
+def rref(matrix, exact=None):
+    if isinstance(matrix, SparseMatrix):
+        reduced, _ = _sparse_rref(matrix)
+        return SparseMatrix._from_row_dicts(reduced, matrix.shape)
     num_rows, num_cols = validate_matrix(matrix)
-    A = [row[:] for row in matrix]
+    rows = _exact_rows(matrix, exact)
+    if rows is not None:
+        return _exact_rref(rows)[0]
+    if _use_numpy(max(num_rows, num_cols)):
+        return _from_numpy(matrix, _np_rref(_to_numpy(matrix))[0])
+    A, _ = _rref_pivots(_rows_of(matrix))
 
+    return _like(matrix, A)
+
+def _rref_pivots(A):
+    # in-place Gauss-Jordan; returns the reduced rows and the pivot column of each nonzero row
+    num_rows = len(A)
+    num_cols = len(A[0])
     current_row = 0
+    pivot_cols = []
 
     for c in range(num_cols):
         pivot_row = None
@@ -76,44 +590,1897 @@ def rref(matrix):
         pivot = A[current_row][c]
         A[current_row] = [x / pivot for x in A[current_row]]
 
+        pivot_row = A[current_row]
         for r in range(num_rows):
             if r != current_row:
                 factor = A[r][c]
-                A[r] = [A[r][i] - factor * A[current_row][i] for i in range(num_cols)]
+                if factor:
+                    A[r] = [x - factor * y for x, y in zip(A[r], pivot_row)]
 
+        pivot_cols.append(c)
         current_row += 1
         if current_row >= num_rows:
             break
 
-    return A
+    return A, pivot_cols
+
+# Exact Arithmetic
+
+def _exact_rows(matrix, exact, extra=None):
+    # integer/Fraction rows for exact mode, or None for the float path. exact=None switches on by
+    # itself when Fraction entries appear; plain integers stay on the float path unless asked
+    if exact is False:
+        return None
+    if isinstance(matrix, Matrix):
+        if exact:
+            raise ValueError("Invalid input: exact mode needs integer or Fraction entries, not a packed float Matrix")
+        return None
+    types = set(map(type, chain.from_iterable(matrix)))
+    if extra is not None:
+        types.update(map(type, extra))
+    if exact is None and Fraction not in types:
+        return None
+    if not types <= {int, Fraction}:
+        if exact:
+            raise ValueError("Invalid input: exact mode needs integer or Fraction entries")
+        return None
+    return [list(row) for row in matrix]
+
+def _integer_rows(rows):
+    # clearing each row's denominators leaves rank, pivots and the RREF unchanged; scales are kept to undo it
+    scaled, scales = [], []
+    for row in rows:
+        m = 1
+        for x in row:
+            if isinstance(x, Fraction):
+                m = m * x.denominator // gcd(m, x.denominator)
+        scaled.append([int(x * m) for x in row])
+        scales.append(m)
+    return scaled, scales
+
+def _bareiss(A, width, jordan=True):
+    # fraction-free elimination over the integers on the first `width` columns (later columns ride along).
+    # Every entry stays a minor of the input, so dividing by the previous pivot is exact and sizes stay
+    # polynomial. jordan=False only clears below the pivots, which is enough for det and rank
+    num_rows = len(A)
+    previous = 1
+    sign = 1
+    pivot_cols = []
+    r = 0
+    for c in range(width):
+        pivot_row = next((i for i in range(r, num_rows) if A[i][c]), None)
+        if pivot_row is None:
+            continue
+        if pivot_row != r:
+            A[r], A[pivot_row] = A[pivot_row], A[r]
+            sign = -sign
+        pivot_row = A[r]
+        pivot = pivot_row[c]
+        for i in (range(num_rows) if jordan else range(r + 1, num_rows)):
+            if i != r:
+                row = A[i]
+                factor = row[c]
+                A[i] = [(pivot * x - factor * y) // previous for x, y in zip(row, pivot_row)]
+        previous = pivot
+        pivot_cols.append(c)
+        r += 1
+        if r == num_rows:
+            break
+    return A, pivot_cols, previous, sign
+
+def _exact_rref(rows):
+    A, pivot_cols, _, _ = _bareiss(_integer_rows(rows)[0], len(rows[0]))
+    zero = Fraction(0)
+    reduced = [[Fraction(x, A[i][c]) for x in A[i]] for i, c in enumerate(pivot_cols)]
+    reduced += [[zero] * len(rows[0]) for _ in range(len(rows) - len(pivot_cols))]
+    return reduced, pivot_cols
+
+def _exact_det(rows, workers=None):
+    A, scales = _integer_rows(rows)
+    n = len(A)
+    scale = 1
+    for m in scales:
+        scale *= m
+    # vectorised or parallel residues beat one big-integer Bareiss pass; serial pure Python does not
+    if workers or _use_numpy(n):
+        total = Fraction(_multimodular_det(A, workers), scale)
+    else:
+        A, pivot_cols, last, sign = _bareiss(A, n, jordan=False)
+        total = Fraction(sign * last, scale) if len(pivot_cols) == n else Fraction(0)
+    # integral determinants come back as int, which JSON and callers comparing types expect
+    return total.numerator if total.denominator == 1 else total
+
+def _exact_inverse(rows):
+    n = len(rows)
+    A, scales = _integer_rows(rows)
+    A = [row + [1 if i == j else 0 for j in range(n)] for i, row in enumerate(A)]
+    A, pivot_cols, last, _ = _bareiss(A, n)
+    if len(pivot_cols) < n:
+        raise ValueError("matrix is singular")
+    # (S A)^-1 = A^-1 S^-1, so column j of the scaled inverse is multiplied back by its row scale
+    return [[Fraction(A[i][n + j] * scales[j], last) for j in range(n)] for i in range(n)]
+
+def _exact_solve(rows, b):
+    n = len(rows)
+    A, _ = _integer_rows([row + [b_i] for row, b_i in zip(rows, b)])
+    A, pivot_cols, last, _ = _bareiss(A, n)
+    if len(pivot_cols) < n:
+        raise ValueError("matrix is singular")
+    return [Fraction(A[i][n], last) for i in range(n)]
+
+# Modular Arithmetic
+
+# deterministic Miller-Rabin witnesses: exact for every n < 3.3e24, far past machine-sized primes
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def _is_prime(n):
+    if n < 2:
+        return False
+    for q in _MILLER_RABIN_BASES:
+        if n % q == 0:
+            return n == q
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def random_prime(bits=31, rng=None):
+    # primes below 2^31 keep every product of two residues inside a signed 64-bit integer
+    if bits < 2:
+        raise ValueError(f"Invalid input: a prime needs at least 2 bits (got {bits})")
+    rng = rng or random
+    while True:
+        n = rng.randrange(1 << (bits - 1), 1 << bits) | 1
+        if _is_prime(n):
+            return n
+
+def _residue_rows(matrix, p):
+    if not _is_prime(p):
+        raise ValueError(f"Invalid input: modulus must be prime (got {p})")
+    if isinstance(matrix, Matrix) or not set(map(type, chain.from_iterable(matrix))) <= {int, Fraction}:
+        raise ValueError("Invalid input: modular elimination needs integer or Fraction entries")
+    rows = []
+    for row in matrix:
+        residues = []
+        for x in row:
+            if isinstance(x, Fraction):
+                if x.denominator % p == 0:
+                    raise ValueError(f"Invalid input: denominator {x.denominator} is divisible by {p}")
+                residues.append(x.numerator * pow(x.denominator, -1, p) % p)
+            else:
+                residues.append(x % p)
+        rows.append(residues)
+    return rows
+
+def _rref_mod_p(A, p, jordan=True):
+    # Gauss-Jordan over GF(p) in place. Entries left of a pivot are already zero, so only the tail of each row is rebuilt.
+    # jordan=False clears below the pivots only (enough for rank)
+    num_rows, num_cols = len(A), len(A[0])
+    if _use_numpy(max(num_rows, num_cols)):
+        reduced, pivot_cols = _np_rref_mod_p(np.array(A, dtype=np.int64), p, jordan)
+        return reduced.tolist(), pivot_cols
+    pivot_cols = []
+    r = 0
+    for c in range(num_cols):
+        pivot_row = next((i for i in range(r, num_rows) if A[i][c]), None)
+        if pivot_row is None:
+            continue
+        A[r], A[pivot_row] = A[pivot_row], A[r]
+        inv = pow(A[r][c], -1, p)
+        A[r][c:] = [x * inv % p for x in A[r][c:]]
+        tail = A[r][c:]
+        for i in (range(num_rows) if jordan else range(r + 1, num_rows)):
+            if i != r:
+                factor = A[i][c]
+                if factor:
+                    A[i][c:] = [(x - factor * y) % p for x, y in zip(A[i][c:], tail)]
+        pivot_cols.append(c)
+        r += 1
+        if r == num_rows:
+            break
+    return A, pivot_cols
+
+def _np_rref_mod_p(A, p, jordan):
+    # p < 2^31, so factor * entry < 2^62 and every update fits in int64 before the reduction
+    num_rows, num_cols = A.shape
+    A %= p
+    pivot_cols = []
+    r = 0
+    for c in range(num_cols):
+        nonzero = np.flatnonzero(A[r:, c])
+        if not nonzero.size:
+            continue
+        pivot_row = r + int(nonzero[0])
+        if pivot_row != r:
+            A[[r, pivot_row]] = A[[pivot_row, r]]
+        A[r, c:] = A[r, c:] * pow(int(A[r, c]), -1, p) % p
+        if jordan:
+            targets = np.flatnonzero(A[:, c])
+            targets = targets[targets != r]
+        else:
+            targets = np.flatnonzero(A[r + 1:, c]) + r + 1
+        if targets.size:
+            A[targets, c:] = (A[targets, c:] - np.outer(A[targets, c], A[r, c:])) % p
+        pivot_cols.append(c)
+        r += 1
+        if r == num_rows:
+            break
+    return A, pivot_cols
+
+def _check_modulus(p):
+    if not isinstance(p, int) or p >= 1 << 31:
+        raise ValueError(f"Invalid input: modulus must be an integer prime below 2^31 (got {p})")
+
+def rank_mod_p(matrix, p):
+    validate_matrix(matrix)
+    _check_modulus(p)
+    return len(_rref_mod_p(_residue_rows(matrix, p), p, jordan=False)[1])
+
+def rref_mod_p(matrix, p):
+    validate_matrix(matrix)
+    _check_modulus(p)
+    return _rref_mod_p(_residue_rows(matrix, p), p)[0]
+
+def null_space_mod_p(matrix, p):
+    # basis as row vectors of residues, in the same layout as null_space()
+    num_cols = validate_matrix(matrix)[1]
+    _check_modulus(p)
+    reduced, pivot_cols = _rref_mod_p(_residue_rows(matrix, p), p)
+    pivot_set = set(pivot_cols)
+    free_cols = [j for j in range(num_cols) if j not in pivot_set]
+    if not free_cols:
+        return [[0] * num_cols]
+    basis = []
+    for free_col in free_cols:
+        v = [0] * num_cols
+        v[free_col] = 1
+        for i, pivot_col in enumerate(pivot_cols):
+            v[pivot_col] = -reduced[i][free_col] % p
+        basis.append(v)
+    return basis
 
+def modular_rank(matrix, primes=3, seed=None):
+    # rank over Q is at least the rank mod any prime, and only drops mod p when p divides every maximal
+    # nonzero minor, so the best of a few random 31-bit primes is the exact rank with overwhelming probability
+    validate_matrix(matrix)
+    rows = _exact_rows(matrix, True)
+    rows, _ = _integer_rows(rows)
+    rng = random.Random(seed)
+    best = 0
+    for _ in range(primes):
+        p = random_prime(31, rng)
+        best = max(best, len(_rref_mod_p([[x % p for x in row] for row in rows], p, jordan=False)[1]))
+        if best == min(len(rows), len(rows[0])):
+            break
+    return best
+
+# Multi-Modular Determinant
+
+# descending primes below 2^31, extended on demand and shared by every exact determinant
+_DET_PRIMES = []
+
+def _det_primes(bound):
+    # smallest prefix of _DET_PRIMES whose product exceeds bound
+    primes = []
+    modulus = 1
+    k = 0
+    while modulus <= bound:
+        if k == len(_DET_PRIMES):
+            n = _DET_PRIMES[-1] - 2 if _DET_PRIMES else (1 << 31) - 1
+            while not _is_prime(n):
+                n -= 2
+            _DET_PRIMES.append(n)
+        primes.append(_DET_PRIMES[k])
+        modulus *= _DET_PRIMES[k]
+        k += 1
+    return primes
+
+def _det_mod_p(A, p):
+    # forward elimination over GF(p) in place; det is the signed product of the pivots
+    n = len(A)
+    det = 1
+    for c in range(n):
+        pivot_row = next((i for i in range(c, n) if A[i][c]), None)
+        if pivot_row is None:
+            return 0
+        if pivot_row != c:
+            A[c], A[pivot_row] = A[pivot_row], A[c]
+            det = -det
+        pivot = A[c][c]
+        det = det * pivot % p
+        inv = pow(pivot, -1, p)
+        tail = A[c][c + 1:]
+        for i in range(c + 1, n):
+            factor = A[i][c] * inv % p
+            if factor:
+                A[i][c + 1:] = [(x - factor * y) % p for x, y in zip(A[i][c + 1:], tail)]
+    return det % p
+
+def _np_det_mod_primes(rows, primes):
+    # one elimination over a (primes, n, n) int64 stack, each layer reduced by its own prime
+    n = len(rows)
+    P = np.array(primes, dtype=np.int64)
+    if all(-(1 << 62) < x < 1 << 62 for row in rows for x in row):
+        A = np.array(rows, dtype=np.int64)[None, :, :] % P[:, None, None]
+    else:
+        A = np.array([[[x % p for x in row] for row in rows] for p in primes], dtype=np.int64)
+    layers = np.arange(len(primes))
+    det = np.ones(len(primes), dtype=np.int64)
+    for c in range(n):
+        # a layer with no pivot gets pivot 0, which zeroes its determinant and leaves its rows untouched
+        pivot_rows = c + np.argmax(A[:, c:, c] != 0, axis=1)
+        swapped = pivot_rows != c
+        if swapped.any():
+            top = A[layers, c].copy()
+            A[layers, c] = A[layers, pivot_rows]
+            A[layers, pivot_rows] = top
+            det[swapped] = P[swapped] - det[swapped]
+        pivots = A[:, c, c]
+        det = det * pivots % P
+        inv = np.array([pow(int(v), -1, int(p)) if v else 0 for v, p in zip(pivots, primes)], dtype=np.int64)
+        factors = A[:, c + 1:, c] * inv[:, None] % P[:, None]
+        A[:, c + 1:, c:] = (A[:, c + 1:, c:] - factors[:, :, None] * A[:, c, None, c:]) % P[:, None, None]
+    return det.tolist()
+
+def _det_mod_primes(rows, primes):
+    if _use_numpy(len(rows)):
+        return _np_det_mod_primes(rows, primes)
+    return [_det_mod_p([[x % p for x in row] for row in rows], p) for p in primes]
+
+def _multimodular_det(rows, workers=None):
+    # Hadamard: |det| <= prod of row norms, so residues modulo primes whose product exceeds twice that
+    # pin down the signed value exactly
+    squares = 1
+    for row in rows:
+        squares *= sum(x * x for x in row)
+    primes = _det_primes(2 * isqrt(squares) + 1)
+    if workers and workers > 1 and len(primes) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        chunks = [primes[k::workers] for k in range(min(workers, len(primes)))]
+        with ProcessPoolExecutor(len(chunks)) as pool:
+            residues = list(pool.map(_det_mod_primes, [rows] * len(chunks), chunks))
+        pairs = zip(chain.from_iterable(chunks), chain.from_iterable(residues))
+    else:
+        pairs = zip(primes, _det_mod_primes(rows, primes))
+    # incremental CRT, then the symmetric representative in (-M/2, M/2]
+    value, modulus = 0, 1
+    for p, r in pairs:
+        value += modulus * ((r - value) * pow(modulus % p, -1, p) % p)
+        modulus *= p
+    return value - modulus if value > modulus // 2 else value
+
+# Shared RREF Analysis
+
+class RREFAnalysis:
+    # one elimination shared by rank, null, lin_ind, null_space, col_space and row_space
+    __slots__ = ("matrix", "rows", "reduced", "pivot_cols", "free_cols", "rank", "nullity", "exact",
+                 "_null_space", "_col_space", "_row_space")
+
+    def __init__(self, matrix, rows, reduced, pivot_cols, exact=False):
+        num_cols = len(rows[0])
+        pivot_set = set(pivot_cols)
+        self.matrix = matrix
+        self.rows = rows
+        self.reduced = reduced
+        self.pivot_cols = pivot_cols
+        self.free_cols = [j for j in range(num_cols) if j not in pivot_set]
+        self.rank = len(pivot_cols)
+        self.nullity = num_cols - self.rank
+        self.exact = exact
+        self._null_space = None
+        self._col_space = None
+        self._row_space = None
+
+    @property
+    def rref(self):
+        return _like(self.matrix, [row[:] for row in self.reduced])
+
+    @property
+    def lin_ind(self):
+        return self.nullity == 0
+
+    @property
+    def null_space(self):
+        if self._null_space is None:
+            num_cols = len(self.rows[0])
+            zero, one = (Fraction(0), Fraction(1)) if self.exact else (0.0, 1.0)
+            if not self.free_cols:
+                basis = [[zero] * num_cols]
+            else:
+                basis = []
+                for free_col in self.free_cols:
+                    v = [zero] * num_cols
+                    v[free_col] = one
+                    for i, pivot_col in enumerate(self.pivot_cols):
+                        v[pivot_col] = -self.reduced[i][free_col]
+                    basis.append(v)
+            self._null_space = basis
+        return _like(self.matrix, [v[:] for v in self._null_space])
+
+    @property
+    def col_space(self):
+        if self._col_space is None:
+            self._col_space = [[row[j] for row in self.rows] for j in self.pivot_cols]
+        basis = [v[:] for v in self._col_space]
+        return _like(self.matrix, basis) if basis else basis
+
+    @property
+    def row_space(self):
+        if self._row_space is None:
+            self._row_space = [row[:] for row in self.reduced[:self.rank]]
+        basis = [v[:] for v in self._row_space]
+        return _like(self.matrix, basis) if basis else basis
+
+def analyze(matrix, exact=None):
+    num_rows, num_cols = validate_matrix(matrix)
+    rows = _exact_rows(matrix, exact)
+    if rows is not None:
+        reduced, pivot_cols = _exact_rref(rows)
+        return RREFAnalysis(matrix, rows, reduced, pivot_cols, exact=True)
+    rows = _rows_of(matrix)
+    if _use_numpy(max(num_rows, num_cols)):
+        reduced, pivot_cols = _np_rref(_to_numpy(rows))
+        reduced = reduced.tolist()
+    else:
+        reduced, pivot_cols = _rref_pivots([row[:] for row in rows])
+    return RREFAnalysis(matrix, rows, reduced, pivot_cols)
+
+@_cached
 def lu(matrix):
     num_rows = validate_square_matrix(matrix)
-    A = [row[:] for row in matrix]
-    num_cols = num_rows
+    if _use_numpy(num_rows):
+        L, U = _np_lu(_to_numpy(matrix))
+        return _from_numpy(matrix, L), _from_numpy(matrix, U)
+    LU, _, _ = _lu_factor(_rows_of(matrix), pivoting=False)
+    L, U = _split_lu(LU)
 
-    L = [[0.0] * num_cols for _ in range (num_rows)]
-    U = [[0.0] * num_cols for _ in range(num_rows) ]
+    return _like(matrix, L), _like(matrix, U)
 
-    for i in range(num_rows):
-
-        for j in range(i, num_rows):
+@_cached
+def plu(matrix):
+    validate_square_matrix(matrix)
+    LU, perm, _ = _lu_factor(_rows_of(matrix), strict=False)
+    L, U = _split_lu(LU)
 
-            sum_val = sum(L[i][k] * U[k][j] for k in range(i))
-            U[i][j] = A[i][j] - sum_val
+    return perm, _like(matrix, L), _like(matrix, U)
 
-        if abs(U[i][i]) < 1e-10:
-            raise ValueError("Matrix requires pivoting for LU decomposition (zero pivot encountered)")
+def _split_lu(LU):
+    n = len(LU)
+    L = [[LU[i][j] if j < i else (1.0 if i == j else 0.0) for j in range(n)] for i in range(n)]
+    U = [[LU[i][j] if j >= i else 0.0 for j in range(n)] for i in range(n)]
+    return L, U
 
-        for j in range(i, num_rows):
-            if i == j:
-                L[i][j] = 1.0
+# Incremental Basis
+
+class Basis:
+    # greedy basis grown one vector at a time. The span is kept in reduced echelon form, so add() is one
+    # O(n k) reduction against k rows rather than a fresh rref of every vector seen so far
+    __slots__ = ("dim", "exact", "_vectors", "_rows", "_pivots")
+
+    def __init__(self, vectors=None, exact=None):
+        self.dim = None
+        self.exact = exact
+        self._vectors = []
+        self._rows = []
+        self._pivots = []
+        for v in vectors or ():
+            self.add(v)
+
+    def _residual(self, v, exact):
+        # v reduced against the echelon rows, and the pivot it would add (None when v is in the span)
+        residual = [Fraction(x) for x in _exact_rows([v], True)[0]] if exact else [float(x) for x in v]
+        # rows have zeros at each other's pivots, so the order of these subtractions does not matter
+        for p, row in zip(self._pivots, self._rows):
+            factor = residual[p]
+            if factor:
+                residual = [a - factor * b for a, b in zip(residual, row)]
+        if exact:
+            pivot = next((j for j, x in enumerate(residual) if x), None)
+        else:
+            tol = 1e-10 * max(1.0, max(abs(float(x)) for x in v))
+            pivot = next((j for j, x in enumerate(residual) if abs(x) > tol), None)
+        return residual, pivot
+
+    def add(self, v):
+        # True when v was independent of the basis so far (and is now part of it)
+        n = validate_vector(v)
+        if self.dim is None:
+            self.dim = n
+        elif n != self.dim:
+            raise ValueError(f"Invalid input: vector length must be {self.dim} (got {n})")
+        if self.exact is None:
+            self.exact = _exact_rows([v], None) is not None
+        residual, p = self._residual(v, self.exact)
+        if p is None:
+            return False
+        pivot = residual[p]
+        row = [x / pivot for x in residual]
+        row[p] = Fraction(1) if self.exact else 1.0
+        for i, other in enumerate(self._rows):
+            factor = other[p]
+            if factor:
+                self._rows[i] = [a - factor * b for a, b in zip(other, row)]
+        k = bisect_left(self._pivots, p)
+        self._pivots.insert(k, p)
+        self._rows.insert(k, row)
+        self._vectors.append(list(v))
+        return True
+
+    def __contains__(self, v):
+        # always a bool: input that is not a vector of this length and arithmetic is simply not in the span.
+        # A query never fixes the dimension or arithmetic mode; only add() does. With no vectors yet the
+        # span is just the zero vector
+        try:
+            n = validate_vector(v)
+            if self.dim is not None and n != self.dim:
+                return False
+            exact = self.exact if self.exact is not None else _exact_rows([v], None) is not None
+            return self._residual(v, exact)[1] is None
+        except (TypeError, ValueError):
+            return False
+
+    def __len__(self):
+        return len(self._vectors)
+
+    @property
+    def rank(self):
+        return len(self._vectors)
+
+    @property
+    def basis(self):
+        # reduced echelon rows spanning the same space: row_space() of the accepted vectors stacked as rows
+        return [row[:] for row in self._rows]
+
+    @property
+    def pivot_cols(self):
+        return self._pivots[:]
+
+    @property
+    def col_space(self):
+        # the accepted vectors themselves, as col_space() returns them for a matrix with the vectors as columns
+        return [v[:] for v in self._vectors]
+
+# Structure Detection
+
+# keyed by content digest; an entry never holds the matrix, so the cache stays a few KB at any size
+STRUCTURE_CACHE_SIZE = 64
+
+_structure_cache = OrderedDict()
+
+class Structure:
+    # bandwidths, symmetry and permutation come from one scan. No rows are kept, so a cached entry
+    # costs a few bytes however large the matrix was
+    __slots__ = ("shape", "lower_bandwidth", "upper_bandwidth", "symmetric", "permutation", "orthogonal")
+
+    def __init__(self, shape, lower_bandwidth, upper_bandwidth, symmetric, permutation, orthogonal):
+        self.shape = shape
+        self.lower_bandwidth = lower_bandwidth
+        self.upper_bandwidth = upper_bandwidth
+        self.symmetric = symmetric
+        self.permutation = permutation
+        self.orthogonal = orthogonal
+
+    @property
+    def square(self):
+        return self.shape[0] == self.shape[1]
+
+    @property
+    def diagonal(self):
+        return self.lower_bandwidth == 0 and self.upper_bandwidth == 0
+
+    @property
+    def upper(self):
+        return self.lower_bandwidth == 0
+
+    @property
+    def lower(self):
+        return self.upper_bandwidth == 0
+
+    @property
+    def triangular(self):
+        return self.lower_bandwidth == 0 or self.upper_bandwidth == 0
+
+    def __repr__(self):
+        kinds = [name for name in ("diagonal", "upper", "lower", "symmetric") if getattr(self, name)]
+        if self.permutation is not None:
+            kinds.append("permutation")
+        return f"Structure({self.shape[0]}x{self.shape[1]}, bandwidth=({self.lower_bandwidth}, {self.upper_bandwidth}), {', '.join(kinds) or 'general'})"
+
+def _classify(rows, num_rows, num_cols):
+    # each row is scanned inward from both ends, so dense rows cost O(1) and only zero runs are walked
+    lower_bandwidth = upper_bandwidth = 0
+    perm = [] if num_rows == num_cols else None
+    for i, row in enumerate(rows):
+        first = 0
+        while first < num_cols and not row[first]:
+            first += 1
+        if first == num_cols:
+            perm = None
+            continue
+        last = num_cols - 1
+        while not row[last]:
+            last -= 1
+        lower_bandwidth = max(lower_bandwidth, i - first)
+        upper_bandwidth = max(upper_bandwidth, last - i)
+        if perm is not None:
+            if first == last and row[first] == 1:
+                perm.append(first)
             else:
-                sum_val = sum(L[j][k] * U[k][i] for k in range(i))
-                L[j][i] = (A[j][i] - sum_val) / U[i][i]
+                perm = None
+    if perm is not None and len(set(perm)) != num_rows:
+        perm = None
+    symmetric = num_rows == num_cols and _is_symmetric(rows)
+    # a triangular matrix is orthogonal only as a +-1 diagonal; anything else pays for row products,
+    # which stop at the first row that is not a unit vector
+    if perm is not None:
+        orthogonal = True
+    elif num_rows != num_cols:
+        orthogonal = False
+    elif lower_bandwidth == 0 or upper_bandwidth == 0:
+        orthogonal = lower_bandwidth == upper_bandwidth == 0 and all(abs(abs(rows[i][i]) - 1.0) <= 1e-9 for i in range(num_rows))
+    else:
+        orthogonal = _is_orthogonal(rows)
+    return Structure((num_rows, num_cols), lower_bandwidth, upper_bandwidth, symmetric, perm, orthogonal)
+
+def _is_orthogonal(A, tol=1e-9):
+    # rows orthonormal; the first failing dot product ends the check, so general input costs O(n)
+    n = len(A)
+    for i in range(n):
+        A_i = A[i]
+        for j in range(i, n):
+            dot = sum(x * y for x, y in zip(A_i, A[j]))
+            if abs(dot - (1.0 if i == j else 0.0)) > tol:
+                return False
+    return True
+
+def _digest(matrix):
+    # 16-byte fingerprint of the contents. A Matrix hashes its whole buffer, so writes through a
+    # transpose view or straight into .data change it too
+    if isinstance(matrix, Matrix):
+        payload = repr((matrix.shape, matrix.strides)).encode() + matrix.data.tobytes()
+    elif set(map(type, chain.from_iterable(matrix))) == {float}:
+        payload = repr((len(matrix), len(matrix[0]))).encode() + array("d", chain.from_iterable(matrix)).tobytes()
+    else:
+        payload = repr(tuple(map(tuple, matrix))).encode()
+    return blake2b(payload, digest_size=16).digest()
+
+def structure(matrix):
+    num_rows, num_cols = validate_matrix(matrix)
+    key = _digest(matrix)
+    if isinstance(matrix, Matrix):
+        # trusted only while the buffer still hashes to the digest it was classified under
+        if matrix._structure is None or matrix._structure[0] != key:
+            matrix._structure = (key, _classify(matrix.tolist(), num_rows, num_cols))
+        return matrix._structure[1]
+
+    found = _structure_cache.get(key)
+    if found is not None:
+        _structure_cache.move_to_end(key)
+        return found
+    found = _classify(_rows_of(matrix), num_rows, num_cols)
+    _structure_cache[key] = found
+    if len(_structure_cache) > STRUCTURE_CACHE_SIZE:
+        _structure_cache.popitem(last=False)
+    return found
+
+def _diagonal(matrix):
+    n = min(len(matrix), len(matrix[0]))
+    if isinstance(matrix, Matrix):
+        return [matrix[i, i] for i in range(n)]
+    return [matrix[i][i] for i in range(n)]
+
+def _permutation_sign(perm):
+    sign = 1
+    seen = [False] * len(perm)
+    for start in range(len(perm)):
+        if seen[start]:
+            continue
+        length = 0
+        j = start
+        while not seen[j]:
+            seen[j] = True
+            j = perm[j]
+            length += 1
+        if length % 2 == 0:
+            sign = -sign
+    return sign
+
+def _structured_inverse(matrix, shape):
+    # None when no structure applies
+    n = shape.shape[0]
+    if shape.permutation is not None:
+        inv = [[0.0] * n for _ in range(n)]
+        for i, j in enumerate(shape.permutation):
+            inv[j][i] = 1.0
+        return inv
+    if shape.triangular:
+        rows = _rows_of(matrix)
+        if any(abs(rows[i][i]) < 1e-10 for i in range(n)):
+            raise ValueError("matrix is singular")
+        if shape.diagonal:
+            return [[1.0 / rows[i][i] if i == j else 0.0 for j in range(n)] for i in range(n)]
+        return _tri_inverse(rows, lower=shape.lower)
+    if shape.orthogonal:
+        rows = _rows_of(matrix)
+        return [[float(row[i]) for row in rows] for i in range(n)]
+    return None
+
+def _structured_solve(A, b, shape):
+    n = shape.shape[0]
+    if shape.permutation is not None:
+        x = [0.0] * n
+        for i, j in enumerate(shape.permutation):
+            x[j] = float(b[i])
+        return x
+    if shape.triangular:
+        rows = _rows_of(A)
+        if any(abs(rows[i][i]) < 1e-10 for i in range(n)):
+            raise ValueError("matrix is singular")
+        if shape.diagonal:
+            return [b[i] / rows[i][i] for i in range(n)]
+        return _tri_solve_vector(rows, b, lower=shape.lower)
+    if shape.orthogonal:
+        rows = _rows_of(A)
+        return [sum(rows[k][i] * b[k] for k in range(n)) for i in range(n)]
+    return None
+
+# Triangular Kernels
+
+def _tri_solve(T, Y, lower, unit=False):
+    # T X = Y in place, one right-hand-side row per equation. Only T's triangle is read,
+    # so a combined LU factor works for either half
+    n = len(Y)
+    for i in (range(n) if lower else range(n - 1, -1, -1)):
+        row = T[i]
+        y = Y[i]
+        for j in (range(i) if lower else range(i + 1, n)):
+            factor = row[j]
+            if factor:
+                y_j = Y[j]
+                y = [a - factor * c for a, c in zip(y, y_j)]
+        Y[i] = y if unit else [a / row[i] for a in y]
+    return Y
+
+def _tri_solve_vector(T, b, lower, unit=False, trans=False):
+    # T x = b, or T^T x = b when trans is set; the transposed solve walks rows of T
+    # column-style, so column-major factors need no transposing
+    n = len(b)
+    x = list(b)
+    forward = lower != trans
+    for i in (range(n) if forward else range(n - 1, -1, -1)):
+        row = T[i]
+        if trans:
+            if not unit:
+                x[i] /= row[i]
+            x_i = x[i]
+            if x_i:
+                for j in (range(i + 1, n) if forward else range(i)):
+                    x[j] -= row[j] * x_i
+        else:
+            total = x[i]
+            for j in (range(i) if forward else range(i + 1, n)):
+                total -= row[j] * x[j]
+            x[i] = total if unit else total / row[i]
+    return x
 
-    return L, U
+def _tri_mult(T, B, lower):
+    # T B with T triangular: row i only combines the rows of B inside T's triangle
+    n = len(T)
+    width = len(B[0])
+    product = []
+    for i in range(n):
+        row = T[i]
+        acc = [0.0] * width
+        for k in (range(i + 1) if lower else range(i, n)):
+            t = row[k]
+            if t:
+                acc = [a + t * c for a, c in zip(acc, B[k])]
+        product.append(acc)
+    return product
+
+def _tri_inverse(T, lower, unit=False):
+    # the inverse keeps T's triangle, so each row only updates the part that can be nonzero
+    n = len(T)
+    X = [[0.0] * n for _ in range(n)]
+    for i in (range(n) if lower else range(n - 1, -1, -1)):
+        row = T[i]
+        lo = 0 if lower else i
+        acc = [0.0] * (i + 1 if lower else n - i)
+        acc[i - lo] = 1.0
+        for j in (range(i) if lower else range(i + 1, n)):
+            t = row[j]
+            if t:
+                X_j = X[j]
+                if lower:
+                    acc[:j + 1] = [a - t * x for a, x in zip(acc, X_j[:j + 1])]
+                else:
+                    acc[j - i:] = [a - t * x for a, x in zip(acc[j - i:], X_j[j:])]
+        pivot = 1.0 if unit else row[i]
+        X[i][lo:lo + len(acc)] = [a / pivot for a in acc]
+    return X
+
+# Reusable LU Factorization
+
+def _lu_factor(A, pivoting=True, strict=True):
+    # in-place Doolittle: A ends up holding U and the unit-lower multipliers of L.
+    # strict=False keeps going past zero pivot columns so singular matrices still factor
+    n = len(A)
+    perm = list(range(n))
+    sign = 1.0
+
+    for k in range(n):
+        if pivoting:
+            pivot_row = k
+            for r in range(k + 1, n):
+                if abs(A[r][k]) > abs(A[pivot_row][k]):
+                    pivot_row = r
+
+            if pivot_row != k:
+                A[k], A[pivot_row] = A[pivot_row], A[k]
+                perm[k], perm[pivot_row] = perm[pivot_row], perm[k]
+                sign = -sign
+
+        pivot = A[k][k]
+        if abs(pivot) < 1e-10:
+            if not pivoting:
+                raise ValueError("Matrix requires pivoting for LU decomposition (zero pivot encountered)")
+            if strict:
+                raise ValueError("matrix is singular")
+            for i in range(k + 1, n):
+                A[i][k] = 0.0
+            continue
 
+        tail_k = A[k][k + 1:]
+        for i in range(k + 1, n):
+            row = A[i]
+            factor = row[k] / pivot
+            row[k] = factor
+            if factor:
+                row[k + 1:] = [x - factor * y for x, y in zip(row[k + 1:], tail_k)]
+
+    return A, perm, sign
+
+class LUFactorization:
+    # P A = L U, factored once; every solve afterwards is O(n^2)
+    __slots__ = ("lu", "perm", "sign", "size")
+
+    def __init__(self, lu, perm, sign):
+        self.lu = lu
+        self.perm = perm
+        self.sign = sign
+        self.size = len(lu)
+
+    def _substitute(self, Y):
+        # forward then back substitution on a list of right-hand-side rows (one row per equation)
+        _tri_solve(self.lu, Y, lower=True, unit=True)
+        return _tri_solve(self.lu, Y, lower=False)
+
+    def solve(self, b):
+        vec_len = validate_vector(b, "vector")
+        if vec_len != self.size:
+            raise ValueError(f"Invalid input: matrix size ({self.size}x{self.size}) must match vector length ({vec_len})")
+
+        y = _tri_solve_vector(self.lu, [b[p] for p in self.perm], lower=True, unit=True)
+        return _tri_solve_vector(self.lu, y, lower=False)
+
+    def solve_many(self, B):
+        num_rows, _ = validate_matrix(B, "matrix B")
+        if num_rows != self.size:
+            raise ValueError(f"Invalid input: matrix size ({self.size}x{self.size}) must match right-hand side rows ({num_rows})")
+
+        rows = _rows_of(B)
+        X = self._substitute([rows[p] for p in self.perm])
+        return _like(B, X)
+
+    def det(self):
+        total = self.sign
+        for i in range(self.size):
+            total *= self.lu[i][i]
+        return total
+
+    def inverse(self):
+        # A^-1 = U^-1 L^-1 P: two triangular inverses and one triangular product, then undo the row swaps as column swaps
+        product = _tri_mult(_tri_inverse(self.lu, lower=False), _tri_inverse(self.lu, lower=True, unit=True), lower=False)
+        source = [0] * self.size
+        for k, p in enumerate(self.perm):
+            source[p] = k
+        return [[row[k] for k in source] for row in product]
+
+def factorize(matrix):
+    if isinstance(matrix, BandMatrix):
+        return _band_lu(matrix)
+    if isinstance(matrix, SparseMatrix):
+        if matrix.shape[0] != matrix.shape[1]:
+            raise ValueError(f"Invalid input: matrix must be square (got {matrix.shape[0]}x{matrix.shape[1]})")
+        return _sparse_lu(matrix)
+    validate_square_matrix(matrix)
+    LU, perm, sign = _lu_factor(_rows_of(matrix))
+    return LUFactorization(LU, perm, sign)
+
+# Low-Rank Updates
+
+# Bennett's update never pivots; once a multiplier grows past this the factors have lost accuracy and are rebuilt
+UPDATE_GROWTH_LIMIT = 1e4
+
+def _update_columns(u, n, name):
+    # a vector is one update column; an n x k matrix is k of them
+    if isinstance(u, Matrix) or (isinstance(u, list) and u and isinstance(u[0], list)):
+        num_rows, k = validate_matrix(u, name)
+        if num_rows != n:
+            raise ValueError(f"Invalid input: {name} must have {n} rows (got {num_rows})")
+        rows = _rows_of(u)
+        return [[row[j] for row in rows] for j in range(k)]
+    if validate_vector(u, name) != n:
+        raise ValueError(f"Invalid input: {name} length must be {n} (got {len(u)})")
+    return [list(u)]
+
+def _bennett_update(lu, x, y):
+    # LU + x y^T in place, one pivot per step: the new row of U and column of L come from the old ones,
+    # and what is left over is again rank one on the trailing block. False means a pivot vanished or grew L
+    n = len(lu)
+    for k in range(n):
+        old = lu[k][k]
+        pivot = old + x[k] * y[k]
+        if abs(pivot) < 1e-10:
+            return False
+        u_tail = lu[k][k + 1:]
+        xk, yk = x[k], y[k]
+        lu[k][k] = pivot
+        lu[k][k + 1:] = [a + xk * b for a, b in zip(u_tail, y[k + 1:])]
+        for i in range(k + 1, n):
+            l = lu[i][k]
+            factor = (l * old + x[i] * yk) / pivot
+            if abs(factor) > UPDATE_GROWTH_LIMIT:
+                return False
+            lu[i][k] = factor
+            x[i] -= xk * l
+        y[k + 1:] = [(old * b - yk * a) / pivot for a, b in zip(u_tail, y[k + 1:])]
+    return True
+
+def _lu_product(F):
+    # A = P^T L U, rebuilt row by row from the packed factors
+    lu, n = F.lu, F.size
+    A = [None] * n
+    for k in range(n):
+        row = [0.0] * k + lu[k][k:]
+        for j in range(k):
+            factor = lu[k][j]
+            if factor:
+                row[j:] = [a + factor * b for a, b in zip(row[j:], lu[j][j:])]
+        A[F.perm[k]] = row
+    return A
+
+def _update_lu(F, columns_u, columns_v):
+    # P (A + u v^T) = L U + (P u) v^T, so each column pair is one Bennett step on the permuted u
+    lu = [row[:] for row in F.lu]
+    for u, v in zip(columns_u, columns_v):
+        if not _bennett_update(lu, [u[p] for p in F.perm], list(v)):
+            A = _lu_product(F)
+            for u, v in zip(columns_u, columns_v):
+                for i, ui in enumerate(u):
+                    if ui:
+                        A[i] = [a + ui * b for a, b in zip(A[i], v)]
+            LU, perm, sign = _lu_factor(A)
+            return LUFactorization(LU, perm, sign)
+    return LUFactorization(lu, F.perm[:], F.sign)
+
+def _update_inverse(inv, columns_u, columns_v):
+    # Woodbury: (A + U V^T)^-1 = B - B U (I + V^T B U)^-1 V^T B with B = A^-1; only the k x k capacitance
+    # matrix is factored, so a rank-k refresh costs O(k n^2)
+    n, k = len(columns_u[0]), len(columns_u)
+    if _use_numpy(n) and _exact_rows(inv, None) is None:
+        B = _to_numpy(inv)
+        U = np.array(columns_u, dtype=np.float64).T
+        V = np.array(columns_v, dtype=np.float64).T
+        BU = B @ U
+        VB = V.T @ B
+        X = factorize((np.eye(k) + V.T @ BU).tolist()).solve_many(VB.tolist())
+        return _from_numpy(inv, B - BU @ np.array(X))
+    B = _rows_of(inv)
+    BU = [[sum(b * x for b, x in zip(row, u)) for u in columns_u] for row in B]
+    VB = []
+    for v in columns_v:
+        acc = [0] * n
+        for vi, row in zip(v, B):
+            if vi:
+                acc = [a + vi * b for a, b in zip(acc, row)]
+        VB.append(acc)
+    capacitance = [[(1 if s == t else 0) + sum(vi * BU[i][t] for i, vi in enumerate(v)) for t in range(k)]
+                   for s, v in enumerate(columns_v)]
+    X = factorize(capacitance).solve_many(VB)
+    for i, row in enumerate(B):
+        for t in range(k):
+            factor = BU[i][t]
+            if factor:
+                row[:] = [a - factor * b for a, b in zip(row, X[t])]
+    return _like(inv, B)
+
+def update(factorization, u, v):
+    # refresh for A + u v^T (or A + U V^T with n x k U and V) given a factorize() result or a previous inverse()
+    if isinstance(factorization, LUFactorization):
+        n = factorization.size
+    elif isinstance(factorization, (BandMatrix, SparseMatrix, BandLUFactorization, SparseLUFactorization)):
+        raise ValueError("Invalid input: update needs a dense LU factorization or inverse matrix")
+    else:
+        n = validate_square_matrix(factorization, "inverse")
+    columns_u = _update_columns(u, n, "u")
+    columns_v = _update_columns(v, n, "v")
+    if len(columns_u) != len(columns_v):
+        raise ValueError(f"Invalid input: u and v must have the same number of columns ({len(columns_u)} vs {len(columns_v)})")
+    if isinstance(factorization, LUFactorization):
+        return _update_lu(factorization, columns_u, columns_v)
+    return _update_inverse(factorization, columns_u, columns_v)
+
+# Banded Matrices
+
+# dense input is solved in band storage when its band covers at most this fraction of a row
+BAND_DISPATCH_RATIO = 0.25
+
+class BandMatrix:
+    # square matrix that stores only its band: row i keeps columns i - lower .. i + upper in a
+    # fixed-width slot of a flat array, so memory is O(n * bandwidth). Slots that would fall
+    # outside the matrix (top-left and bottom-right corners) stay zero
+    __slots__ = ("data", "size", "lower", "upper")
+
+    def __init__(self, size, lower, upper, data=None):
+        if size <= 0:
+            raise ValueError("Invalid input: matrix cannot be empty")
+        if lower < 0 or upper < 0:
+            raise ValueError("Invalid input: bandwidths must be non-negative")
+        width = lower + upper + 1
+        if data is None:
+            data = array("d", bytes(8 * size * width))
+        elif len(data) != size * width:
+            raise ValueError(f"Invalid input: band storage needs {size * width} values (got {len(data)})")
+        self.data = data if isinstance(data, array) and data.typecode == "d" else array("d", data)
+        self.size = size
+        self.lower = lower
+        self.upper = upper
+
+    @classmethod
+    def tridiagonal(cls, sub, diag, sup):
+        n = len(diag)
+        if len(sub) != n - 1 or len(sup) != n - 1:
+            raise ValueError(f"Invalid input: off-diagonals must have length {n - 1} (got {len(sub)} and {len(sup)})")
+        data = array("d", bytes(8 * 3 * n))
+        data[3:3 * n:3] = array("d", sub)
+        data[1::3] = array("d", diag)
+        data[2:3 * n - 3:3] = array("d", sup)
+        return cls(n, 1, 1, data)
+
+    @classmethod
+    def from_dense(cls, matrix, lower=None, upper=None):
+        n = validate_square_matrix(matrix)
+        if lower is None or upper is None:
+            shape = structure(matrix)
+            lower = shape.lower_bandwidth if lower is None else lower
+            upper = shape.upper_bandwidth if upper is None else upper
+        band = cls(n, lower, upper)
+        width = lower + upper + 1
+        data = band.data
+        for i, row in enumerate(_rows_of(matrix)):
+            lo, hi = max(0, i - lower), min(n, i + upper + 1)
+            start = i * width + lo - i + lower
+            data[start:start + hi - lo] = array("d", row[lo:hi])
+        return band
+
+    @property
+    def shape(self):
+        return (self.size, self.size)
+
+    def _slot(self, i, j):
+        if not (0 <= i < self.size and 0 <= j < self.size):
+            raise IndexError("band index out of range")
+        offset = j - i + self.lower
+        if 0 <= offset <= self.lower + self.upper:
+            return i * (self.lower + self.upper + 1) + offset
+        return None
+
+    def __getitem__(self, index):
+        slot = self._slot(*index)
+        return 0.0 if slot is None else self.data[slot]
+
+    def __setitem__(self, index, value):
+        slot = self._slot(*index)
+        if slot is None:
+            raise ValueError(f"Invalid input: entry {index} lies outside the band")
+        self.data[slot] = value
+
+    def __len__(self):
+        return self.size
+
+    def band_row(self, i):
+        # (first column, stored values) for row i, clipped to the matrix
+        width = self.lower + self.upper + 1
+        lo, hi = max(0, i - self.lower), min(self.size, i + self.upper + 1)
+        start = i * width + lo - i + self.lower
+        return lo, self.data[start:start + hi - lo].tolist()
+
+    def tolist(self):
+        rows = []
+        for i in range(self.size):
+            lo, values = self.band_row(i)
+            row = [0.0] * self.size
+            row[lo:lo + len(values)] = values
+            rows.append(row)
+        return rows
+
+    def matrix_times_vector(self, v):
+        vec_len = validate_vector(v, "vector")
+        if vec_len != self.size:
+            raise ValueError(f"Invalid input: matrix columns ({self.size}) must match vector length ({vec_len})")
+        product = []
+        for i in range(self.size):
+            lo, values = self.band_row(i)
+            product.append(sum(a * x for a, x in zip(values, v[lo:lo + len(values)])))
+        return product
+
+    def __eq__(self, other):
+        if isinstance(other, BandMatrix):
+            return (self.size, self.lower, self.upper, self.data) == (other.size, other.lower, other.upper, other.data)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"BandMatrix(size={self.size}, lower={self.lower}, upper={self.upper})"
+
+class BandLUFactorization:
+    # partial pivoting widens U to lower + upper superdiagonals; row k of U is stored from
+    # column k, and each step keeps its row swap and at most `lower` multipliers
+    __slots__ = ("rows", "swaps", "multipliers", "sign", "size")
+
+    def __init__(self, rows, swaps, multipliers, sign):
+        self.rows = rows
+        self.swaps = swaps
+        self.multipliers = multipliers
+        self.sign = sign
+        self.size = len(rows)
+
+    def solve(self, b):
+        vec_len = validate_vector(b, "vector")
+        if vec_len != self.size:
+            raise ValueError(f"Invalid input: matrix size ({self.size}x{self.size}) must match vector length ({vec_len})")
+        x = [float(value) for value in b]
+        for k in range(self.size):
+            p = self.swaps[k]
+            if p != k:
+                x[k], x[p] = x[p], x[k]
+            x_k = x[k]
+            if x_k:
+                for t, factor in enumerate(self.multipliers[k], k + 1):
+                    x[t] -= factor * x_k
+        for k in range(self.size - 1, -1, -1):
+            row = self.rows[k]
+            total = x[k]
+            for t in range(1, len(row)):
+                total -= row[t] * x[k + t]
+            x[k] = total / row[0]
+        return x
+
+    def det(self):
+        total = self.sign
+        for row in self.rows:
+            total *= row[0]
+        return total
+
+def _band_lu(band, strict=True):
+    # strict=False returns None on a zero pivot instead of raising (det reports 0 then)
+    n, kl = band.size, band.lower
+    starts, rows = [], []
+    for i in range(n):
+        lo, values = band.band_row(i)
+        starts.append(lo)
+        rows.append(values)
+    swaps, multipliers = [], []
+    sign = 1.0
+
+    for k in range(n):
+        last = min(k + kl, n - 1)
+        p = k
+        best = abs(rows[k][k - starts[k]])
+        for r in range(k + 1, last + 1):
+            value = abs(rows[r][k - starts[r]])
+            if value > best:
+                p, best = r, value
+        if best < 1e-10:
+            if strict:
+                raise ValueError("matrix is singular")
+            return None
+        if p != k:
+            rows[k], rows[p] = rows[p], rows[k]
+            starts[k], starts[p] = starts[p], starts[k]
+            sign = -sign
+        swaps.append(p)
+
+        pivot_row = rows[k][k - starts[k]:]
+        rows[k], starts[k] = pivot_row, k
+        pivot, tail = pivot_row[0], pivot_row[1:]
+        factors = []
+        for r in range(k + 1, last + 1):
+            row = rows[r][k - starts[r]:]
+            factor = row[0] / pivot
+            rest = row[1:]
+            if len(rest) < len(tail):
+                rest.extend([0.0] * (len(tail) - len(rest)))
+            if factor:
+                rest[:len(tail)] = [x - factor * y for x, y in zip(rest, tail)]
+            rows[r], starts[r] = rest, k + 1
+            factors.append(factor)
+        multipliers.append(factors)
+
+    return BandLUFactorization(rows, swaps, multipliers, sign)
+
+def _thomas(band, b):
+    # tridiagonal elimination without pivoting; only used on diagonally dominant input, where it is stable
+    n = band.size
+    data = band.data
+    sub, diag, sup = data[3::3], data[1::3], data[2::3]
+    c = [0.0] * n
+    d = [0.0] * n
+    beta = diag[0]
+    if abs(beta) < 1e-10:
+        raise ValueError("matrix is singular")
+    c[0] = sup[0] / beta
+    d[0] = b[0] / beta
+    for i in range(1, n):
+        a = sub[i - 1]
+        beta = diag[i] - a * c[i - 1]
+        if abs(beta) < 1e-10:
+            raise ValueError("matrix is singular")
+        c[i] = sup[i] / beta
+        d[i] = (b[i] - a * d[i - 1]) / beta
+    for i in range(n - 2, -1, -1):
+        d[i] -= c[i] * d[i + 1]
+    return d
+
+def _diagonally_dominant(band):
+    for i in range(band.size):
+        lo, values = band.band_row(i)
+        diag = abs(values[i - lo])
+        if diag < sum(abs(x) for x in values) - diag:
+            return False
+    return True
+
+def _band_solve(band, b):
+    vec_len = validate_vector(b, "vector")
+    if vec_len != band.size:
+        raise ValueError(f"Invalid input: matrix size ({band.size}x{band.size}) must match vector length ({vec_len})")
+    if band.lower == band.upper == 1 and _diagonally_dominant(band):
+        return _thomas(band, b)
+    return _band_lu(band).solve(b)
+
+def _band_det(band):
+    F = _band_lu(band, strict=False)
+    return 0.0 if F is None else F.det()
+
+def _narrow_band(shape):
+    return shape.lower_bandwidth + shape.upper_bandwidth + 1 <= BAND_DISPATCH_RATIO * shape.shape[0]
+
+# Sparse Matrices
+
+# fill below this magnitude is dropped during elimination; a pivot candidate must be within
+# MARKOWITZ_THRESHOLD of the largest entry in its column (threshold partial pivoting)
+SPARSE_DROP_TOL = 1e-12
+MARKOWITZ_THRESHOLD = 0.1
+MARKOWITZ_SEARCH = 4
+
+class SparseMatrix:
+    # compressed sparse rows: row i's column indices and values are indices/values[indptr[i]:indptr[i + 1]],
+    # sorted by column. Zeros are never stored, so memory is O(rows + nonzeros)
+    __slots__ = ("indptr", "indices", "values", "shape")
+
+    def __init__(self, indptr, indices, values, shape):
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self.shape = shape
+
+    @classmethod
+    def from_coo(cls, rows, cols, values, shape):
+        # coordinate triplets in any order; duplicates are summed
+        num_rows, num_cols = shape
+        if num_rows <= 0 or num_cols <= 0:
+            raise ValueError("Invalid input: matrix cannot be empty")
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError(f"Invalid input: coordinate lists must have equal length (got {len(rows)}, {len(cols)} and {len(values)})")
+        row_dicts = [{} for _ in range(num_rows)]
+        for i, j, value in zip(rows, cols, values):
+            if not (0 <= i < num_rows and 0 <= j < num_cols):
+                raise ValueError(f"Invalid input: entry ({i}, {j}) outside a {num_rows}x{num_cols} matrix")
+            row = row_dicts[i]
+            row[j] = row.get(j, 0.0) + value
+        return cls._from_row_dicts(row_dicts, shape)
+
+    @classmethod
+    def from_dense(cls, matrix):
+        num_rows, num_cols = validate_matrix(matrix)
+        return cls._from_row_dicts([{j: x for j, x in enumerate(row) if x} for row in _rows_of(matrix)], (num_rows, num_cols))
+
+    @classmethod
+    def _from_row_dicts(cls, row_dicts, shape):
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+        for row in row_dicts:
+            for j in sorted(row):
+                if row[j]:
+                    indices.append(j)
+                    values.append(row[j])
+            indptr.append(len(indices))
+        return cls(indptr, indices, values, shape)
+
+    def copy(self):
+        return SparseMatrix(self.indptr[:], self.indices[:], self.values[:], self.shape)
+
+    @property
+    def nnz(self):
+        return len(self.values)
+
+    def row_dict(self, i):
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return dict(zip(self.indices[start:stop], self.values[start:stop]))
+
+    def __getitem__(self, index):
+        i, j = index
+        if not (0 <= i < self.shape[0] and 0 <= j < self.shape[1]):
+            raise IndexError("sparse index out of range")
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        k = bisect_left(self.indices, j, start, stop)
+        return self.values[k] if k < stop and self.indices[k] == j else 0.0
+
+    def __len__(self):
+        return self.shape[0]
+
+    def to_coo(self):
+        rows = []
+        for i in range(self.shape[0]):
+            rows.extend([i] * (self.indptr[i + 1] - self.indptr[i]))
+        return rows, self.indices.tolist(), self.values.tolist()
+
+    def tolist(self):
+        dense = [[0.0] * self.shape[1] for _ in range(self.shape[0])]
+        for i in range(self.shape[0]):
+            row = dense[i]
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                row[self.indices[k]] = self.values[k]
+        return dense
+
+    def transpose(self):
+        rows, cols, values = self.to_coo()
+        return SparseMatrix.from_coo(cols, rows, values, (self.shape[1], self.shape[0]))
+
+    def matrix_times_vector(self, v):
+        vec_len = validate_vector(v, "vector")
+        if vec_len != self.shape[1]:
+            raise ValueError(f"Invalid input: matrix columns ({self.shape[1]}) must match vector length ({vec_len})")
+        indices, values = self.indices, self.values
+        product = []
+        for i in range(self.shape[0]):
+            total = 0.0
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                total += values[k] * v[indices[k]]
+            product.append(total)
+        return product
+
+    def __eq__(self, other):
+        if isinstance(other, SparseMatrix):
+            return (self.shape, self.indptr, self.indices, self.values) == (other.shape, other.indptr, other.indices, other.values)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"SparseMatrix(shape={self.shape}, nnz={self.nnz})"
+
+def _sparse_rows(S):
+    # dict-of-columns per row plus the reverse index (rows holding each column), both kept current through fill
+    rows = [S.row_dict(i) for i in range(S.shape[0])]
+    col_rows = [set() for _ in range(S.shape[1])]
+    for i, row in enumerate(rows):
+        for j in row:
+            col_rows[j].add(i)
+    return rows, col_rows
+
+def _sparse_markowitz_row(rows, candidates, c):
+    # among numerically acceptable pivots in column c, the row with the fewest nonzeros creates the least fill
+    biggest = max(abs(rows[r][c]) for r in candidates)
+    return min((r for r in candidates if abs(rows[r][c]) >= MARKOWITZ_THRESHOLD * biggest), key=lambda r: (len(rows[r]), r))
+
+def _sparse_eliminate(rows, col_rows, r, factor, pivot_row, skip):
+    # row r -= factor * pivot_row, dropping cancelled entries from both indexes
+    row = rows[r]
+    for j, y in pivot_row.items():
+        if j == skip:
+            continue
+        value = row.get(j, 0.0) - factor * y
+        if abs(value) <= SPARSE_DROP_TOL:
+            if j in row:
+                del row[j]
+                col_rows[j].discard(r)
+        else:
+            if j not in row:
+                col_rows[j].add(r)
+            row[j] = value
+
+def _sparse_rref(S):
+    # Gauss-Jordan in column order (so the result is the true RREF); only the pivot row choice is Markowitz
+    num_rows, num_cols = S.shape
+    rows, col_rows = _sparse_rows(S)
+    done = [False] * num_rows
+    pivot_rows, pivot_cols = [], []
+
+    for c in range(num_cols):
+        candidates = [r for r in col_rows[c] if not done[r] and abs(rows[r][c]) > 1e-10]
+        if not candidates:
+            continue
+        p = _sparse_markowitz_row(rows, candidates, c)
+        pivot_row = rows[p]
+        pivot = pivot_row[c]
+        for j in pivot_row:
+            pivot_row[j] /= pivot
+        pivot_row[c] = 1.0
+        for r in list(col_rows[c]):
+            if r != p:
+                factor = rows[r].pop(c)
+                col_rows[c].discard(r)
+                _sparse_eliminate(rows, col_rows, r, factor, pivot_row, c)
+        done[p] = True
+        pivot_rows.append(p)
+        pivot_cols.append(c)
+        if len(pivot_rows) == num_rows:
+            break
+
+    reduced = [rows[p] for p in pivot_rows] + [{} for _ in range(num_rows - len(pivot_rows))]
+    return reduced, pivot_cols
+
+class SparseLUFactorization:
+    # each step records its pivot (row, column), the pivot row as eliminated (a row of U) and the
+    # multipliers it applied, which is all a solve needs
+    __slots__ = ("steps", "shape")
+
+    def __init__(self, steps, shape):
+        self.steps = steps
+        self.shape = shape
+
+    def solve(self, b):
+        n = self.shape[0]
+        vec_len = validate_vector(b, "vector")
+        if vec_len != n:
+            raise ValueError(f"Invalid input: matrix size ({n}x{n}) must match vector length ({vec_len})")
+        y = [float(value) for value in b]
+        for p, _, _, multipliers in self.steps:
+            y_p = y[p]
+            if y_p:
+                for r, factor in multipliers:
+                    y[r] -= factor * y_p
+        x = [0.0] * n
+        for p, c, U_row, _ in reversed(self.steps):
+            total = y[p]
+            for j, u in U_row.items():
+                if j != c:
+                    total -= u * x[j]
+            x[c] = total / U_row[c]
+        return x
+
+    def det(self):
+        total = 1.0
+        for _, c, U_row, _ in self.steps:
+            total *= U_row[c]
+        row_order = [p for p, _, _, _ in self.steps]
+        col_order = [c for _, c, _, _ in self.steps]
+        return total * _permutation_sign(row_order) * _permutation_sign(col_order)
+
+def _sparse_lu(S, strict=True):
+    # right-looking elimination in Markowitz order: the MARKOWITZ_SEARCH sparsest active columns
+    # (lazy min-heap on column counts) are scored by (row count - 1) * (column count - 1) for their
+    # sparsest acceptable row, and the cheapest pivot goes next
+    num_rows, num_cols = S.shape
+    rows, col_rows = _sparse_rows(S)
+    heap = [(len(col_rows[j]), j) for j in range(num_cols)]
+    heapify(heap)
+    col_done = [False] * num_cols
+    steps = []
+
+    while heap and len(steps) < num_rows:
+        options = []
+        while heap and len(options) < MARKOWITZ_SEARCH:
+            count, c = heappop(heap)
+            if col_done[c] or any(c == option[2] for option in options):
+                continue
+            if count != len(col_rows[c]):
+                heappush(heap, (len(col_rows[c]), c))
+                continue
+            candidates = [r for r in col_rows[c] if abs(rows[r][c]) > 1e-10]
+            if not candidates:
+                if strict:
+                    raise ValueError("matrix is singular")
+                col_done[c] = True
+                continue
+            r = _sparse_markowitz_row(rows, candidates, c)
+            options.append(((len(rows[r]) - 1) * (count - 1), r, c))
+            if options[-1][0] == 0:
+                break
+        if not options:
+            break
+        _, p, c = min(options)
+        for option in options:
+            if option[2] != c:
+                heappush(heap, (len(col_rows[option[2]]), option[2]))
+        col_done[c] = True
+
+        pivot_row = rows[p]
+        pivot = pivot_row[c]
+        for j in pivot_row:
+            col_rows[j].discard(p)
+        multipliers = []
+        for r in list(col_rows[c]):
+            factor = rows[r].pop(c) / pivot
+            multipliers.append((r, factor))
+            _sparse_eliminate(rows, col_rows, r, factor, pivot_row, c)
+        col_rows[c] = set()
+        for j in pivot_row:
+            if not col_done[j]:
+                heappush(heap, (len(col_rows[j]), j))
+        steps.append((p, c, pivot_row, multipliers))
+
+    if strict and len(steps) < num_cols:
+        raise ValueError("matrix is singular")
+    return SparseLUFactorization(steps, S.shape)
+
+def _sparse_rank(S):
+    return len(_sparse_lu(S, strict=False).steps)
+
+def _sparse_null_space(S):
+    num_cols = S.shape[1]
+    reduced, pivot_cols = _sparse_rref(S)
+    pivot_set = set(pivot_cols)
+    free_cols = [j for j in range(num_cols) if j not in pivot_set]
+    if not free_cols:
+        return SparseMatrix._from_row_dicts([{}], (1, num_cols))
+    basis = {f: {f: 1.0} for f in free_cols}
+    for i, pivot_col in enumerate(pivot_cols):
+        for j, value in reduced[i].items():
+            if j != pivot_col:
+                basis[j][pivot_col] = -value
+    return SparseMatrix._from_row_dicts([basis[f] for f in free_cols], (len(free_cols), num_cols))
+
+def _sparse_solve(S, b):
+    if S.shape[0] != S.shape[1]:
+        raise ValueError(f"Invalid input: matrix must be square (got {S.shape[0]}x{S.shape[1]})")
+    return _sparse_lu(S).solve(b)
+
+# Krylov Solvers
+
+class LinearOperator:
+    # matrix-free operator: only the action v -> A v is known
+    __slots__ = ("shape", "_matvec")
+
+    def __init__(self, shape, matvec):
+        self.shape = tuple(shape)
+        self._matvec = matvec
+
+    def matrix_times_vector(self, v):
+        return list(self._matvec(v))
+
+    def __repr__(self):
+        return f"LinearOperator(shape={self.shape})"
+
+class KrylovResult:
+    # residual_history[0] is the starting residual norm, then one entry per iteration
+    __slots__ = ("x", "iterations", "converged", "residual_history")
+
+    def __init__(self, x, iterations, converged, residual_history):
+        self.x = x
+        self.iterations = iterations
+        self.converged = converged
+        self.residual_history = residual_history
+
+    @property
+    def residual(self):
+        return self.residual_history[-1]
+
+    def __repr__(self):
+        return f"KrylovResult(iterations={self.iterations}, converged={self.converged}, residual={self.residual:.3e})"
+
+def _as_operator(A):
+    # BandMatrix, SparseMatrix, LinearOperator and user objects already apply themselves; dense
+    # input gets an uncached product so the result cache never fills with intermediate vectors
+    if hasattr(A, "matrix_times_vector"):
+        return A
+    num_rows, num_cols = validate_matrix(A)
+    if isinstance(A, Matrix):
+        return LinearOperator(A.shape, lambda v: _matrix_times_vector_packed(A, v))
+    rows = _rows_of(A)
+    return LinearOperator((num_rows, num_cols), lambda v: [sum(a * x for a, x in zip(row, v)) for row in rows])
+
+def _as_sparse(A):
+    if isinstance(A, SparseMatrix):
+        return A
+    if isinstance(A, BandMatrix):
+        rows, cols, values = [], [], []
+        for i in range(A.size):
+            lo, band = A.band_row(i)
+            for j, value in enumerate(band, lo):
+                if value:
+                    rows.append(i)
+                    cols.append(j)
+                    values.append(value)
+        return SparseMatrix.from_coo(rows, cols, values, A.shape)
+    if isinstance(A, (list, Matrix)):
+        return SparseMatrix.from_dense(A)
+    raise ValueError("Invalid input: preconditioning needs explicit matrix entries, not a matrix-free operator")
+
+def jacobi_preconditioner(A):
+    S = _as_sparse(A)
+    inverse_diagonal = []
+    for i in range(S.shape[0]):
+        d = S[i, i]
+        if not d:
+            raise ValueError("Invalid input: Jacobi preconditioning needs a nonzero diagonal")
+        inverse_diagonal.append(1.0 / d)
+    return LinearOperator(S.shape, lambda r: [d * x for d, x in zip(inverse_diagonal, r)])
+
+def ilu0_preconditioner(A):
+    # incomplete LU restricted to A's own sparsity pattern (no fill); applying it is one
+    # forward and one backward sweep over the stored entries
+    S = _as_sparse(A)
+    n = S.shape[0]
+    rows = [S.row_dict(i) for i in range(n)]
+    for i in range(n):
+        row = rows[i]
+        for k in sorted(j for j in row if j < i):
+            pivot = rows[k].get(k)
+            if not pivot:
+                raise ValueError("Computation failed: zero pivot in ILU(0) factorization")
+            factor = row[k] / pivot
+            row[k] = factor
+            for j, u in rows[k].items():
+                if j > k and j in row:
+                    row[j] -= factor * u
+    lower = [sorted((j, x) for j, x in row.items() if j < i) for i, row in enumerate(rows)]
+    upper = [sorted((j, x) for j, x in row.items() if j > i) for i, row in enumerate(rows)]
+    diagonal = [row.get(i, 0.0) for i, row in enumerate(rows)]
+    if not all(diagonal):
+        raise ValueError("Computation failed: zero pivot in ILU(0) factorization")
+
+    def apply(r):
+        y = list(r)
+        for i in range(n):
+            total = y[i]
+            for j, x in lower[i]:
+                total -= x * y[j]
+            y[i] = total
+        for i in range(n - 1, -1, -1):
+            total = y[i]
+            for j, x in upper[i]:
+                total -= x * y[j]
+            y[i] = total / diagonal[i]
+        return y
+
+    return LinearOperator(S.shape, apply)
+
+def _as_preconditioner(A, preconditioner):
+    if preconditioner is None:
+        return None
+    if preconditioner == "jacobi":
+        return jacobi_preconditioner(A)
+    if preconditioner == "ilu0":
+        return ilu0_preconditioner(A)
+    if hasattr(preconditioner, "matrix_times_vector"):
+        return preconditioner
+    raise ValueError(f"Invalid input: unknown preconditioner {preconditioner!r} (use 'jacobi', 'ilu0' or an operator)")
+
+def _krylov_start(A, b, x0):
+    n = validate_vector(b, "vector")
+    op = _as_operator(A)
+    shape = tuple(getattr(op, "shape", (n, n)))
+    if shape != (n, n):
+        raise ValueError(f"Invalid input: operator shape ({shape[0]}x{shape[1]}) must be square and match vector length ({n})")
+    if x0 is None:
+        x = [0.0] * n
+        r = [float(value) for value in b]
+    else:
+        if validate_vector(x0, "initial guess") != n:
+            raise ValueError(f"Invalid input: initial guess length ({len(x0)}) must match vector length ({n})")
+        x = [float(value) for value in x0]
+        r = [bi - ai for bi, ai in zip(b, op.matrix_times_vector(x))]
+    return op, x, r, hypot(*b) or 1.0
+
+def _dot(u, v):
+    return sum(a * b for a, b in zip(u, v))
+
+def conjugate_gradient(A, b, x0=None, tol=1e-10, max_iter=None, preconditioner=None):
+    # symmetric positive definite A only; stops early if a search direction loses positive curvature
+    op, x, r, b_norm = _krylov_start(A, b, x0)
+    M = _as_preconditioner(A, preconditioner)
+    max_iter = 10 * len(x) if max_iter is None else max_iter
+    history = [hypot(*r)]
+    iterations = 0
+
+    z = M.matrix_times_vector(r) if M else r
+    p = list(z)
+    rz = _dot(r, z)
+    while history[-1] > tol * b_norm and iterations < max_iter:
+        Ap = op.matrix_times_vector(p)
+        curvature = _dot(p, Ap)
+        if curvature <= 0.0:
+            break
+        alpha = rz / curvature
+        x = [xi + alpha * pi for xi, pi in zip(x, p)]
+        r = [ri - alpha * qi for ri, qi in zip(r, Ap)]
+        iterations += 1
+        history.append(hypot(*r))
+        if history[-1] <= tol * b_norm:
+            break
+        z = M.matrix_times_vector(r) if M else r
+        rz_next = _dot(r, z)
+        beta = rz_next / rz
+        rz = rz_next
+        p = [zi + beta * pi for zi, pi in zip(z, p)]
+
+    return KrylovResult(x, iterations, history[-1] <= tol * b_norm, history)
+
+def gmres(A, b, x0=None, tol=1e-10, restart=30, max_iter=None, preconditioner=None):
+    # restarted GMRES with right preconditioning, so the residuals it reports are residuals of A x = b.
+    # Givens rotations keep the least-squares residual current without solving it every step
+    op, x, r, b_norm = _krylov_start(A, b, x0)
+    M = _as_preconditioner(A, preconditioner)
+    n = len(x)
+    max_iter = 10 * n if max_iter is None else max_iter
+    history = [hypot(*r)]
+    iterations = 0
+
+    while history[-1] > tol * b_norm and iterations < max_iter:
+        beta = history[-1]
+        V = [[ri / beta for ri in r]]
+        H, cs, sn = [], [], []
+        g = [beta]
+        for j in range(restart):
+            w = op.matrix_times_vector(M.matrix_times_vector(V[j]) if M else V[j])
+            h = []
+            for v in V:
+                h_ij = _dot(w, v)
+                h.append(h_ij)
+                w = [wk - h_ij * vk for wk, vk in zip(w, v)]
+            h_next = hypot(*w)
+            h.append(h_next)
+            for i in range(j):
+                a, c = h[i], h[i + 1]
+                h[i] = cs[i] * a + sn[i] * c
+                h[i + 1] = -sn[i] * a + cs[i] * c
+            denom = hypot(h[j], h[j + 1])
+            c, s = (1.0, 0.0) if denom == 0.0 else (h[j] / denom, h[j + 1] / denom)
+            h[j], h[j + 1] = denom, 0.0
+            cs.append(c)
+            sn.append(s)
+            g.append(-s * g[j])
+            g[j] *= c
+            H.append(h)
+            iterations += 1
+            history.append(abs(g[j + 1]))
+            if history[-1] <= tol * b_norm or iterations >= max_iter or h_next == 0.0:
+                break
+            V.append([wk / h_next for wk in w])
+
+        k = len(H)
+        y = [0.0] * k
+        for i in range(k - 1, -1, -1):
+            total = g[i] - sum(H[m][i] * y[m] for m in range(i + 1, k))
+            y[i] = total / H[i][i] if H[i][i] else 0.0
+        update = [0.0] * n
+        for y_m, v in zip(y, V):
+            update = [u + y_m * vk for u, vk in zip(update, v)]
+        if M:
+            update = M.matrix_times_vector(update)
+        x = [xi + ui for xi, ui in zip(x, update)]
+        r = [bi - ai for bi, ai in zip(b, op.matrix_times_vector(x))]
+        history[-1] = hypot(*r)
+
+    return KrylovResult(x, iterations, history[-1] <= tol * b_norm, history)
+
+def bicgstab(A, b, x0=None, tol=1e-10, max_iter=None, preconditioner=None):
+    # BiCGSTAB with right preconditioning; stops (unconverged) on a zero inner product breakdown
+    op, x, r, b_norm = _krylov_start(A, b, x0)
+    M = _as_preconditioner(A, preconditioner)
+    n = len(x)
+    max_iter = 10 * n if max_iter is None else max_iter
+    history = [hypot(*r)]
+    iterations = 0
+
+    r_hat = list(r)
+    rho = alpha = omega = 1.0
+    p = v = [0.0] * n
+    while history[-1] > tol * b_norm and iterations < max_iter:
+        rho_next = _dot(r_hat, r)
+        if rho_next == 0.0:
+            break
+        beta = (rho_next / rho) * (alpha / omega)
+        rho = rho_next
+        p = [ri + beta * (pi - omega * vi) for ri, pi, vi in zip(r, p, v)]
+        p_hat = M.matrix_times_vector(p) if M else p
+        v = op.matrix_times_vector(p_hat)
+        denom = _dot(r_hat, v)
+        if denom == 0.0:
+            break
+        alpha = rho / denom
+        s = [ri - alpha * vi for ri, vi in zip(r, v)]
+        iterations += 1
+        if hypot(*s) <= tol * b_norm:
+            x = [xi + alpha * pi for xi, pi in zip(x, p_hat)]
+            history.append(hypot(*s))
+            break
+        s_hat = M.matrix_times_vector(s) if M else s
+        t = op.matrix_times_vector(s_hat)
+        tt = _dot(t, t)
+        omega = _dot(t, s) / tt if tt else 0.0
+        x = [xi + alpha * pi + omega * si for xi, pi, si in zip(x, p_hat, s_hat)]
+        r = [si - omega * ti for si, ti in zip(s, t)]
+        history.append(hypot(*r))
+        if omega == 0.0:
+            break
+
+    return KrylovResult(x, iterations, history[-1] <= tol * b_norm, history)
+
+# Cholesky Factorization
+
+def _cholesky_factor(A):
+    # row by row in place: the lower triangle becomes L with A = L L^T (the upper triangle is never read).
+    # Returns None at the first pivot that is not safely positive, so callers can fall back to LU
+    n = len(A)
+    for i in range(n):
+        row_i = A[i]
+        for j in range(i):
+            row_j = A[j]
+            row_i[j] = (row_i[j] - sum(x * y for x, y in zip(row_i[:j], row_j))) / row_j[j]
+        pivot = row_i[i] - sum(x * x for x in row_i[:i])
+        if pivot <= 1e-10 * abs(row_i[i]):
+            return None
+        row_i[i] = pivot ** 0.5
+    return A
+
+@_cached
+def cholesky(matrix):
+    num_rows = validate_square_matrix(matrix)
+    if not structure(matrix).symmetric:
+        raise ValueError("Invalid input: matrix must be symmetric")
+    L = _cholesky_factor([[float(x) for x in row] for row in _rows_of(matrix)])
+    if L is None:
+        raise ValueError("Matrix is not positive definite")
+    for i in range(num_rows):
+        L[i][i + 1:] = [0.0] * (num_rows - i - 1)
+    return _like(matrix, L)
+
+@_cached
+def cholesky_solve(L, B):
+    # L from cholesky(); B is one right-hand side (vector) or several (one column each)
+    num_rows = validate_square_matrix(L, "matrix L")
+    rows = _rows_of(L)
+    if isinstance(B, Matrix) or (B and isinstance(B[0], list)):
+        rhs_rows, _ = validate_matrix(B, "matrix B")
+        if rhs_rows != num_rows:
+            raise ValueError(f"Invalid input: matrix size ({num_rows}x{num_rows}) must match right-hand side rows ({rhs_rows})")
+        Y = _tri_solve(rows, _rows_of(B), lower=True)
+        return _like(B, _tri_solve([list(col) for col in zip(*rows)], Y, lower=False))
+
+    vec_len = validate_vector(B, "vector")
+    if vec_len != num_rows:
+        raise ValueError(f"Invalid input: matrix size ({num_rows}x{num_rows}) must match vector length ({vec_len})")
+    y = _tri_solve_vector(rows, B, lower=True)
+    return _tri_solve_vector(rows, y, lower=True, trans=True)
+
+@_cached
 def dot_product(v1, v2):
     len1 = validate_vector(v1, "vector 1")
     len2 = validate_vector(v2, "vector 2")
@@ -121,67 +2488,192 @@ def dot_product(v1, v2):
         raise ValueError(f"Invalid input: vectors must have same length (got {len1} and {len2})")
     return sum(a*b for a, b in zip(v1, v2))
 
+@_cached
 def magnitude(v):
     validate_vector(v)
     return sum(x**2 for x in v) ** 0.5
 
+@_cached
 def qr(matrix):
     num_rows, num_cols = validate_matrix(matrix)
-    A = [row[:] for row in matrix]
-    
-    A_T = [[A[i][j] for i in range(num_rows)] for j in range(num_cols)]
-    Q_T = []
-    R = [[0.0] * num_cols for _ in range(num_cols)]
-
-    for i in range(num_cols):
-        v = A_T[i][:]
-        for j in range(i):
-            R[j][i] = dot_product(Q_T[j], A_T[i])
-            v = [v[k] - R[j][i] * Q_T[j][k] for k in range(num_rows)]
-
-        R[i][i] = magnitude(v)
-
-        if abs(R[i][i]) < 1e-10:
+    if _use_numpy(max(num_rows, num_cols)):
+        Q, R = _np_qr(_to_numpy(matrix))
+        return _from_numpy(matrix, Q), _from_numpy(matrix, R)
+    F = householder_qr(matrix)
+    Q = F.q()
+    R = F.r()
+
+    # flip signs so R has a non-negative diagonal, matching the Gram-Schmidt convention
+    for k in range(len(R)):
+        if R[k][k] < 0:
+            R[k] = [0.0 - x for x in R[k]]
+            for row in Q:
+                row[k] = 0.0 - row[k]
+
+    return _like(matrix, Q), _like(matrix, R)
+
+# Householder QR
+
+class QRFactorization:
+    # A = Q R with Q kept as Householder reflectors: column k stores R above the diagonal and
+    # the reflector v_k (implicit leading 1) below it, so Q is never formed unless asked for
+    __slots__ = ("cols", "tau", "shape")
+
+    def __init__(self, cols, tau, shape):
+        self.cols = cols
+        self.tau = tau
+        self.shape = shape
+
+    def apply_qt(self, b):
+        num_rows = self.shape[0]
+        vec_len = validate_vector(b, "vector")
+        if vec_len != num_rows:
+            raise ValueError(f"Invalid input: matrix rows ({num_rows}) must match vector length ({vec_len})")
+        y = list(b)
+        for k, tau in enumerate(self.tau):
+            if tau:
+                v = self.cols[k]
+                w = y[k]
+                for i in range(k + 1, num_rows):
+                    w += v[i] * y[i]
+                w *= tau
+                y[k] -= w
+                for i in range(k + 1, num_rows):
+                    y[i] -= w * v[i]
+        return y
+
+    def apply_q(self, x):
+        num_rows = self.shape[0]
+        vec_len = validate_vector(x, "vector")
+        if vec_len != num_rows:
+            raise ValueError(f"Invalid input: matrix rows ({num_rows}) must match vector length ({vec_len})")
+        y = list(x)
+        for k in range(len(self.tau) - 1, -1, -1):
+            tau = self.tau[k]
+            if tau:
+                v = self.cols[k]
+                w = y[k]
+                for i in range(k + 1, num_rows):
+                    w += v[i] * y[i]
+                w *= tau
+                y[k] -= w
+                for i in range(k + 1, num_rows):
+                    y[i] -= w * v[i]
+        return y
+
+    def q(self, full=False):
+        num_rows = self.shape[0]
+        width = num_rows if full else len(self.tau)
+        Q_T = []
+        for j in range(width):
+            e = [0.0] * num_rows
+            e[j] = 1.0
+            Q_T.append(self.apply_q(e))
+        return [[Q_T[j][i] for j in range(width)] for i in range(num_rows)]
+
+    def r(self):
+        num_cols = self.shape[1]
+        k = len(self.tau)
+        return [[self.cols[j][i] if j >= i else 0.0 for j in range(num_cols)] for i in range(k)]
+
+    def solve(self, b):
+        # least-squares solution of A x = b (exact when A is square and nonsingular)
+        num_rows, num_cols = self.shape
+        if num_rows < num_cols:
+            raise ValueError("Invalid input: least squares needs at least as many rows as columns")
+        y = self.apply_qt(b)
+        scale = max(abs(self.cols[k][k]) for k in range(num_cols))
+        if any(abs(self.cols[k][k]) <= 1e-10 * max(scale, 1.0) for k in range(num_cols)):
             raise ValueError("Matrix is rank deficient")
+        # the reflector columns hold R transposed (lower triangle), so solve R x = y as a transposed solve
+        return _tri_solve_vector(self.cols, y[:num_cols], lower=True, trans=True)
 
-        Q_T.append([v[k] / R[i][i] for k in range(num_rows)])
-
-    Q = [[Q_T[i][j] for i in range(num_cols)] for j in range(num_rows)]
-    
-    return Q, R
+def householder_qr(matrix):
+    num_rows, num_cols = validate_matrix(matrix)
+    A = _rows_of(matrix)
+    cols = [[float(A[i][j]) for i in range(num_rows)] for j in range(num_cols)]
+    tau = []
+
+    for k in range(min(num_rows, num_cols)):
+        x = cols[k]
+        alpha = x[k]
+        norm = sum(value * value for value in x[k:]) ** 0.5
+        if norm == 0.0:
+            tau.append(0.0)
+            continue
+        beta = -norm if alpha >= 0 else norm
+        scale = 1.0 / (alpha - beta)
+        for i in range(k + 1, num_rows):
+            x[i] *= scale
+        x[k] = beta
+        t = (beta - alpha) / beta
+        tau.append(t)
+
+        for j in range(k + 1, num_cols):
+            col = cols[j]
+            w = col[k]
+            for i in range(k + 1, num_rows):
+                w += x[i] * col[i]
+            w *= t
+            if w:
+                col[k] -= w
+                for i in range(k + 1, num_rows):
+                    col[i] -= w * x[i]
+
+    return QRFactorization(cols, tau, (num_rows, num_cols))
+
+@_cached
+def least_squares(A, b):
+    num_rows, _ = validate_matrix(A, "matrix")
+    vec_len = validate_vector(b, "vector")
+    if num_rows != vec_len:
+        raise ValueError(f"Invalid input: matrix rows ({num_rows}) must match vector length ({vec_len})")
+    return householder_qr(A).solve(b)
 
-def inverse(matrix):
+@_cached
+def inverse(matrix, exact=None):
     num_rows = validate_square_matrix(matrix)
-
-    augment = [matrix[i][:] + [1 if i == j else 0 for j in range(num_rows)] for i in range(num_rows)]
-
-    for i in range(num_rows):
-        pivot_row = i
-        for k in range(i + 1, num_rows):
-            if abs(augment[k][i]) > abs(augment[pivot_row][i]):
-                pivot_row = k
-
-        if pivot_row != i:
-            augment[i], augment[pivot_row] = augment[pivot_row], augment[i]
-
-        pivot = augment[i][i]
-        if abs(pivot) < 1e-10:
+    rows = _exact_rows(matrix, exact)
+    if rows is not None:
+        return _exact_inverse(rows)
+    if num_rows <= SMALL_KERNEL_MAX:
+        inv = _inverse_small(_flatten(matrix), num_rows)
+        if inv is None:
             raise ValueError("matrix is singular")
-
-        for j in range(2 * num_rows):
-            augment[i][j] /= pivot
-
-        for k in range(num_rows):
-            if k != i:
-                factor = augment[k][i]
-                for j in range (2 * num_rows):
-                    augment[k][j] -= factor * augment [i][j]
-
-    return [[augment[i][j] for j in range(num_rows, 2 * num_rows)] for i in range(num_rows)]
-
-def det(matrix):
+        return _like(matrix, [inv[i * num_rows:(i + 1) * num_rows] for i in range(num_rows)])
+    inv = _structured_inverse(matrix, structure(matrix))
+    if inv is not None:
+        return _like(matrix, inv)
+    if _use_numpy(num_rows):
+        return _from_numpy(matrix, _np_gauss_jordan(_to_numpy(matrix), np.eye(num_rows)))
+
+    return _like(matrix, factorize(matrix).inverse())
+
+@_cached
+def det(matrix, exact=None, workers=None):
+    if isinstance(matrix, BandMatrix):
+        return _band_det(matrix)
     num_rows = validate_square_matrix(matrix)
-    A = [row[:] for row in matrix]
+    rows = _exact_rows(matrix, exact)
+    if rows is not None:
+        return _exact_det(rows, workers)
+    if num_rows <= SMALL_KERNEL_MAX:
+        a = _flatten(matrix)
+        d = _det_small(a, num_rows)
+        return 0.0 if _small_is_singular(a, num_rows, d) else d
+    shape = structure(matrix)
+    if shape.triangular:
+        total = 1.0
+        for d in _diagonal(matrix):
+            total *= d
+        return total
+    if shape.permutation is not None:
+        return float(_permutation_sign(shape.permutation))
+    if _narrow_band(shape):
+        return _band_det(BandMatrix.from_dense(matrix, shape.lower_bandwidth, shape.upper_bandwidth))
+    if _use_numpy(num_rows):
+        return _np_det(_to_numpy(matrix))
+    A = _rows_of(matrix)
 
     det = 1.0
 
@@ -207,18 +2699,38 @@ def det(matrix):
 
     return det
 
+@_cached
 def matrix_times_vector(A, v):
+    if isinstance(A, (BandMatrix, SparseMatrix)):
+        return A.matrix_times_vector(v)
     num_rows, num_cols = validate_matrix(A, "matrix")
     vec_len = validate_vector(v, "vector")
     if num_cols != vec_len:
         raise ValueError(f"Invalid input: matrix columns ({num_cols}) must match vector length ({vec_len})")
 
+    if isinstance(A, Matrix):
+        return _matrix_times_vector_packed(A, v)
+
     product = []
     for _ in range(num_rows):
         product.append(dot_product(A[_], v))
 
     return product
 
+def _matrix_times_vector_packed(A, v):
+    num_rows, num_cols = A.shape
+    data = A.data
+    s0, s1 = A.strides
+    product = []
+    for i in range(num_rows):
+        start = i * s0
+        total = 0.0
+        for j in range(num_cols):
+            total += data[start + j * s1] * v[j]
+        product.append(total)
+    return product
+
+@_cached
 def matrix_mult(A, B):
     num_rows_A, num_cols_A = validate_matrix(A, "matrix A")
     num_rows_B, num_cols_B = validate_matrix(B, "matrix B")
@@ -226,44 +2738,303 @@ def matrix_mult(A, B):
     if num_cols_A != num_rows_B:
         raise ValueError(f"Invalid input: matrices not multiplicable (A columns: {num_cols_A}, B rows: {num_rows_B})")
     
-    product = [[0.0]* num_cols_B for _ in range(num_rows_A)]
-
-    for i in range(num_rows_A):
-        for j in range(num_cols_B):
-            product[i][j] = sum(A[i][k] * B[k][j] for k in range(num_cols_A))
-
-    return product
-
-def solve_system(A, b):
+    if _use_numpy(max(num_rows_A, num_cols_A, num_cols_B)) and _float_entries(A, B):
+        template = A if isinstance(A, Matrix) else B
+        return _from_numpy(template, _to_numpy(A) @ _to_numpy(B))
+
+    product = _matmul(A if isinstance(A, list) else A.tolist(), B if isinstance(B, list) else B.tolist())
+
+    return _like_any((A, B), product)
+
+# Multiplication Engine
+
+# tile width for the i-k-j kernel, and the smallest dimension at which Strassen splitting pays off
+MULT_BLOCK_SIZE = 64
+STRASSEN_THRESHOLD = 128
+
+def _zero_of(A, B):
+    # the zero a plain sum of products would end on: 0.0 once a float takes part, Fraction(0) for
+    # Fraction input, so rows skipped by the kernel and Strassen padding keep the entry type
+    zero = 0
+    for t in {type(x) for M in (A, B) for row in M for x in row}:
+        zero = zero + t(0)
+    return zero
+
+def _matmul(A, B, zero=None):
+    if zero is None:
+        zero = _zero_of(A, B)
+    if min(len(A), len(B), len(B[0])) >= STRASSEN_THRESHOLD:
+        return _strassen(A, B, zero)
+    return _matmul_blocked(A, B, zero)
+
+def _matmul_blocked(A, B, zero):
+    # i-k-j order: each A[i][k] scales a contiguous panel of row k of B, so B is never walked by column
+    num_rows, inner, num_cols = len(A), len(B), len(B[0])
+    block = MULT_BLOCK_SIZE
+    C = [[zero] * num_cols for _ in range(num_rows)]
+    for j0 in range(0, num_cols, block):
+        j1 = min(j0 + block, num_cols)
+        panel = [row[j0:j1] for row in B] if (j0, j1) != (0, num_cols) else B
+        for k0 in range(0, inner, block):
+            k1 = min(k0 + block, inner)
+            for i in range(num_rows):
+                A_i = A[i]
+                acc = C[i][j0:j1]
+                for k in range(k0, k1):
+                    a = A_i[k]
+                    if a:
+                        acc = [x + a * y for x, y in zip(acc, panel[k])]
+                C[i][j0:j1] = acc
+    return C
+
+def _quadrant(M, r0, num_rows, c0, num_cols, zero):
+    # num_rows x num_cols block starting at (r0, c0), zero padded past the edge of M
+    out = []
+    for i in range(r0, r0 + num_rows):
+        if i < len(M):
+            row = M[i][c0:c0 + num_cols]
+            if len(row) < num_cols:
+                row.extend([zero] * (num_cols - len(row)))
+        else:
+            row = [zero] * num_cols
+        out.append(row)
+    return out
+
+def _add(X, Y):
+    return [[x + y for x, y in zip(row_x, row_y)] for row_x, row_y in zip(X, Y)]
+
+def _sub(X, Y):
+    return [[x - y for x, y in zip(row_x, row_y)] for row_x, row_y in zip(X, Y)]
+
+def _strassen(A, B, zero):
+    num_rows, inner, num_cols = len(A), len(B), len(B[0])
+    h_rows, h_inner, h_cols = (num_rows + 1) // 2, (inner + 1) // 2, (num_cols + 1) // 2
+
+    A11 = _quadrant(A, 0, h_rows, 0, h_inner, zero)
+    A12 = _quadrant(A, 0, h_rows, h_inner, h_inner, zero)
+    A21 = _quadrant(A, h_rows, h_rows, 0, h_inner, zero)
+    A22 = _quadrant(A, h_rows, h_rows, h_inner, h_inner, zero)
+    B11 = _quadrant(B, 0, h_inner, 0, h_cols, zero)
+    B12 = _quadrant(B, 0, h_inner, h_cols, h_cols, zero)
+    B21 = _quadrant(B, h_inner, h_inner, 0, h_cols, zero)
+    B22 = _quadrant(B, h_inner, h_inner, h_cols, h_cols, zero)
+
+    M1 = _matmul(_add(A11, A22), _add(B11, B22), zero)
+    M2 = _matmul(_add(A21, A22), B11, zero)
+    M3 = _matmul(A11, _sub(B12, B22), zero)
+    M4 = _matmul(A22, _sub(B21, B11), zero)
+    M5 = _matmul(_add(A11, A12), B22, zero)
+    M6 = _matmul(_sub(A21, A11), _add(B11, B12), zero)
+    M7 = _matmul(_sub(A12, A22), _add(B21, B22), zero)
+
+    C11 = _add(_sub(_add(M1, M4), M5), M7)
+    C12 = _add(M3, M5)
+    C21 = _add(M2, M4)
+    C22 = _add(_add(_sub(M1, M2), M3), M6)
+
+    top = [left + right for left, right in zip(C11, C12)]
+    bottom = [left + right for left, right in zip(C21, C22)]
+    return [row[:num_cols] for row in (top + bottom)[:num_rows]]
+
+# Matrix Chain Products
+
+class MultiplicationPlan:
+    # order is a nested pair of operand indices, e.g. (0, (1, 2)) for A (B C); flops counts scalar multiplications
+    __slots__ = ("order", "flops", "naive_flops", "shapes")
+
+    def __init__(self, order, flops, naive_flops, shapes):
+        self.order = order
+        self.flops = flops
+        self.naive_flops = naive_flops
+        self.shapes = shapes
+
+    def describe(self):
+        def render(node):
+            if isinstance(node, int):
+                return f"M{node}"
+            return f"({render(node[0])} {render(node[1])})"
+        return render(self.order)
+
+    def __repr__(self):
+        return f"MultiplicationPlan({self.describe()}, flops={self.flops}, naive_flops={self.naive_flops})"
+
+def multi_mult_plan(*matrices):
+    if not matrices:
+        raise ValueError("Invalid input: multi_mult needs at least one matrix")
+    shapes = [validate_matrix(M, f"matrix {k}") for k, M in enumerate(matrices)]
+    for k in range(1, len(shapes)):
+        if shapes[k - 1][1] != shapes[k][0]:
+            raise ValueError(f"Invalid input: matrices not multiplicable (matrix {k - 1} columns: {shapes[k - 1][1]}, matrix {k} rows: {shapes[k][0]})")
+
+    # classic O(k^3) chain DP over dims: operand k is dims[k] x dims[k + 1]
+    dims = [shapes[0][0]] + [shape[1] for shape in shapes]
+    count = len(shapes)
+    cost = [[0] * count for _ in range(count)]
+    split = [[0] * count for _ in range(count)]
+    for length in range(2, count + 1):
+        for i in range(count - length + 1):
+            j = i + length - 1
+            best = None
+            for k in range(i, j):
+                total = cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                if best is None or total < best:
+                    best, split[i][j] = total, k
+            cost[i][j] = best
+
+    def build(i, j):
+        if i == j:
+            return i
+        k = split[i][j]
+        return (build(i, k), build(k + 1, j))
+
+    naive = sum(dims[0] * dims[k] * dims[k + 1] for k in range(1, count))
+    return MultiplicationPlan(build(0, count - 1), cost[0][count - 1], naive, shapes)
+
+def _mult_pair(A, B):
+    # uncached product of two row lists, so intermediate results never enter the result cache
+    if _use_numpy(max(len(A), len(B), len(B[0]))) and _float_entries(A, B):
+        return (np.array(A, dtype=np.float64) @ np.array(B, dtype=np.float64)).tolist()
+    return _matmul(A, B)
+
+def multi_mult(*matrices):
+    plan = multi_mult_plan(*matrices)
+    operands = [M.tolist() if isinstance(M, Matrix) else M for M in matrices]
+
+    def run(node):
+        if isinstance(node, int):
+            return operands[node]
+        return _mult_pair(run(node[0]), run(node[1]))
+
+    if isinstance(plan.order, int):
+        return _like(matrices[0], _rows_of(matrices[0]))
+    return _like_any(matrices, run(plan.order))
+
+# Matrix Powers and Exponential
+
+# symmetric matrices switch from repeated squaring to A^k = V diag(lambda^k) V^T at this power
+POWER_EIGEN_MIN = 64
+
+def _identity(n):
+    return [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+def _power_by_squaring(A, k):
+    # about 2 log2(k) products instead of k - 1
+    result = None
+    base = A
+    while True:
+        if k & 1:
+            result = base if result is None else _mult_pair(result, base)
+        k >>= 1
+        if not k:
+            return result
+        base = _mult_pair(base, base)
+
+@_cached
+def matrix_power(matrix, k):
+    num_rows = validate_square_matrix(matrix)
+    if isinstance(k, bool) or not isinstance(k, int):
+        raise ValueError(f"Invalid input: power must be an integer (got {k!r})")
+    if k == 0:
+        return _like(matrix, _identity(num_rows))
+    A = inverse(matrix) if k < 0 else matrix
+    A = A.tolist() if isinstance(A, Matrix) else [row[:] for row in A]
+    k = abs(k)
+
+    shape = structure(A)
+    if shape.diagonal:
+        return _like(matrix, [[A[i][i] ** k if i == j else 0.0 for j in range(num_rows)] for i in range(num_rows)])
+    # int and Fraction input stays on exact repeated squaring; only float input may trade exactness for speed
+    if shape.symmetric and k >= POWER_EIGEN_MIN and set(map(type, chain.from_iterable(A))) == {float}:
+        values, vectors = _np_symmetric_eigen(np.array(A)) if _use_numpy(num_rows) else _jacobi_eigen(A)
+        scaled = [[value ** k * x for x in v] for value, v in zip(values, vectors)]
+        return _like(matrix, _mult_pair([list(col) for col in zip(*vectors)], scaled))
+    if k == 1:
+        return _like(matrix, A)
+    return _like(matrix, _power_by_squaring(A, k))
+
+# degree-6 diagonal Pade approximant of e^x, valid once the scaled matrix has norm <= 1/2
+_PADE_COEFFICIENTS = (1.0, 1 / 2, 5 / 44, 1 / 66, 1 / 792, 1 / 15840, 1 / 665280)
+
+@_cached
+def expm(matrix):
+    # scaling and squaring: e^A = (e^(A / 2^s))^(2^s) with e^(A / 2^s) from the Pade approximant N / D
+    num_rows = validate_square_matrix(matrix)
+    A = [[float(x) for x in row] for row in _rows_of(matrix)]
+    shape = structure(A)
+    if shape.diagonal:
+        return _like(matrix, [[exp(A[i][i]) if i == j else 0.0 for j in range(num_rows)] for i in range(num_rows)])
+
+    norm = max(sum(abs(x) for x in row) for row in A)
+    squarings = 0
+    while norm > 0.5:
+        norm /= 2.0
+        squarings += 1
+    scale = 2.0 ** -squarings
+    X = [[x * scale for x in row] for row in A]
+
+    N = _identity(num_rows)
+    D = _identity(num_rows)
+    power = X
+    for j, c in enumerate(_PADE_COEFFICIENTS[1:], 1):
+        if j > 1:
+            power = _mult_pair(power, X)
+        sign = -c if j % 2 else c
+        N = [[n + c * p for n, p in zip(row_n, row_p)] for row_n, row_p in zip(N, power)]
+        D = [[d + sign * p for d, p in zip(row_d, row_p)] for row_d, row_p in zip(D, power)]
+
+    F = factorize(D).solve_many(N)
+    for _ in range(squarings):
+        F = _mult_pair(F, F)
+    return _like(matrix, F)
+
+@_cached
+def solve_system(A, b, exact=None):
+    if isinstance(A, BandMatrix):
+        return _band_solve(A, b)
+    if isinstance(A, SparseMatrix):
+        return _sparse_solve(A, b)
     num_rows = validate_square_matrix(A, "matrix")
     vec_len = validate_vector(b, "vector")
     if num_rows != vec_len:
         raise ValueError(f"Invalid input: matrix size ({num_rows}x{num_rows}) must match vector length ({vec_len})")
+    rows = _exact_rows(A, exact, extra=b)
+    if rows is not None:
+        return _exact_solve(rows, b)
 
-    A_inv = inverse(A)
-
-    x = matrix_times_vector(A_inv, b)
+    if num_rows <= SMALL_KERNEL_MAX:
+        inv = _inverse_small(_flatten(A), num_rows)
+        if inv is None:
+            raise ValueError("matrix is singular")
+        return [sum(inv[i * num_rows + j] * b[j] for j in range(num_rows)) for i in range(num_rows)]
 
-    return x
+    shape = structure(A)
+    x = _structured_solve(A, b, shape)
+    if x is not None:
+        return x
+    if _narrow_band(shape):
+        return _band_solve(BandMatrix.from_dense(A, shape.lower_bandwidth, shape.upper_bandwidth), b)
 
-    """
-    num_rows = len(A)
+    if shape.symmetric:
+        if _use_numpy(num_rows):
+            L = _np_cholesky(_to_numpy(A))
+        else:
+            L = _cholesky_factor([[float(x) for x in row] for row in _rows_of(A)])
+        if L is not None:
+            return _tri_solve_vector(L, _tri_solve_vector(L, b, lower=True), lower=True, trans=True)
 
-    L, U = lu(A)
+    if _use_numpy(num_rows):
+        return _np_gauss_jordan(_to_numpy(A), np.array(b, dtype=np.float64)[:, None])[:, 0].tolist()
 
-    y = [0.0] * num_rows
-    for i in range(num_rows):
-        y[i] = b[i] - sum(L[i][j] * y[j] for j in range(i))
-    
-    x = [0.0] * num_rows
-    for i in range(num_rows - 1, -1, -1):
-        x[i] = (y[i] - sum(U[i][j] * x[j] for j in range(i+1, num_rows))) / U[i][i]
+    return factorize(A).solve(b)
 
-    return x
-    """
-    
+@_cached
 def transpose(matrix):
+    if isinstance(matrix, SparseMatrix):
+        return matrix.transpose()
     num_rows, num_cols = validate_matrix(matrix)
+    if isinstance(matrix, Matrix):
+        # Matrix.transpose() is a view on the same buffer; the public function must not alias its input
+        return matrix.transpose().copy()
     A = [row[:] for row in matrix]
 
     trans = [[0.0] * num_rows for _ in range(num_cols)]
@@ -274,35 +3045,41 @@ def transpose(matrix):
 
     return trans
 
+@_cached
 def trace(matrix):
     num_rows = validate_square_matrix(matrix)
-    A = [row[:] for row in matrix]
+
+    if isinstance(matrix, Matrix):
+        return sum(matrix[i, i] for i in range(num_rows))
 
     total = 0
     for i in range(num_rows):
-        total += A[i][i]
+        total += matrix[i][i]
 
     return total
         
-def rank(matrix):
-    validate_matrix(matrix)
-    A = [row[:] for row in matrix]
-    A1 = rref(A)
-
-    r = 0
-    for row in A1:
-        if any(abs(x) > 1e-10 for x in row):
-            r += 1
-    return r
+@_cached
+def rank(matrix, exact=None):
+    if isinstance(matrix, SparseMatrix):
+        return _sparse_rank(matrix)
+    if _exact_rows(matrix, exact) is not None:
+        return analyze(matrix, exact).rank
+    shape = structure(matrix)
+    if shape.permutation is not None:
+        return shape.shape[0]
+    if shape.triangular:
+        diag = _diagonal(matrix)
+        if shape.diagonal:
+            return sum(1 for d in diag if abs(d) >= 1e-10)
+        if all(abs(d) >= 1e-10 for d in diag):
+            return len(diag)
+    return analyze(matrix).rank
     
+@_cached
 def null(matrix):
-    _, num_cols = validate_matrix(matrix)
-    r = rank(matrix)
-
-    nul = num_cols - r
-
-    return nul
+    return analyze(matrix).nullity
 
+@_cached
 def cross(v1, v2):
     len1 = validate_vector(v1, "vector 1")
     len2 = validate_vector(v2, "vector 2")
@@ -311,14 +3088,12 @@ def cross(v1, v2):
         raise ValueError(f"Invalid input: vectors must be 3-dimensional (got {len1} and {len2})")
     
 
-    m1 = [[v1[0], v1[1]], [v2[0], v2[1]]]
-    m2 = [[v1[0], v1[2]], [v2[0], v2[2]]]
-    m3 = [[v1[1], v1[2]], [v2[1], v2[2]]]
+    a0, a1, a2 = v1
+    b0, b1, b2 = v2
 
-    c = [det(m3), -det(m2), det(m1)]
-
-    return c
+    return [1.0 * (a1 * b2 - a2 * b1), 1.0 * (a2 * b0 - a0 * b2), 1.0 * (a0 * b1 - a1 * b0)]
 
+@_cached
 def projection(a, v):
     validate_vector(a, "vector a")
     validate_vector(v, "vector v")
@@ -332,68 +3107,310 @@ def projection(a, v):
 
     return proj
 
+@_cached
 def lin_ind(matrix):
-    _, num_cols = validate_matrix(matrix)
-    r = rank(matrix)
+    return analyze(matrix).lin_ind
 
-    return r == num_cols
+# Eigenvalue Engine
 
-def eigenvalues(matrix, max_iter = 1000, tol = 1e-10):
-    validate_square_matrix(matrix)
-    A = [row[:] for row in matrix]
+def _hessenberg(A):
+    # in-place Householder reduction to upper Hessenberg form (similarity transform, same eigenvalues)
+    n = len(A)
+    for k in range(n - 2):
+        x = [A[i][k] for i in range(k + 1, n)]
+        alpha = sum(value * value for value in x) ** 0.5
+        if alpha == 0.0:
+            continue
+        if x[0] > 0:
+            alpha = -alpha
+        v = x
+        v[0] -= alpha
+        v_norm2 = sum(value * value for value in v)
+        if v_norm2 == 0.0:
+            continue
+        scale = 2.0 / v_norm2
+
+        for j in range(k + 1, n):
+            s = scale * sum(v[i] * A[k + 1 + i][j] for i in range(n - k - 1))
+            if s:
+                for i in range(n - k - 1):
+                    A[k + 1 + i][j] -= s * v[i]
+
+        for row in A:
+            tail = row[k + 1:]
+            s = scale * sum(a * b for a, b in zip(tail, v))
+            if s:
+                row[k + 1:] = [a - s * b for a, b in zip(tail, v)]
+
+        A[k + 1][k] = alpha
+        for i in range(k + 2, n):
+            A[i][k] = 0.0
+    return A
 
-    for _ in range(max_iter):
-        Q, R = qr(A)
-        A1 = matrix_mult(R, Q)
+def _hessenberg_eigenvalues(a, max_iter):
+    # Francis double-shift QR on an upper Hessenberg matrix with deflation (after EISPACK hqr);
+    # each sweep only touches the active window, so an iteration costs O(n^2)
+    n = len(a)
+    wr = [0.0] * n
+    wi = [0.0] * n
+    anorm = 0.0
+    for i in range(n):
+        for j in range(max(i - 1, 0), n):
+            anorm += abs(a[i][j])
+
+    nn = n - 1
+    t = 0.0
+    total_iter = 0
+    x = y = w = 0.0
+    while nn >= 0:
+        its = 0
+        while True:
+            l = nn
+            while l >= 1:
+                s = abs(a[l - 1][l - 1]) + abs(a[l][l])
+                if s == 0.0:
+                    s = anorm
+                if abs(a[l][l - 1]) + s == s:
+                    a[l][l - 1] = 0.0
+                    break
+                l -= 1
+
+            x = a[nn][nn]
+            if l == nn:
+                wr[nn] = x + t
+                wi[nn] = 0.0
+                nn -= 1
+                break
 
-        converged = all(abs(A1[i][i] - A[i][i]) < tol for i in range(len(A)))
+            y = a[nn - 1][nn - 1]
+            w = a[nn][nn - 1] * a[nn - 1][nn]
+            if l == nn - 1:
+                p = 0.5 * (y - x)
+                q = p * p + w
+                z = abs(q) ** 0.5
+                x += t
+                if q >= 0.0:
+                    z = p + (z if p >= 0 else -z)
+                    wr[nn - 1] = wr[nn] = x + z
+                    if z:
+                        wr[nn] = x - w / z
+                    wi[nn - 1] = wi[nn] = 0.0
+                else:
+                    wr[nn - 1] = wr[nn] = x + p
+                    wi[nn - 1] = -z
+                    wi[nn] = z
+                nn -= 2
+                break
 
-        if converged:
-            return [A1[i][i] for i in range(len(A))]
-        
-        A = A1
+            if total_iter >= max_iter:
+                raise ValueError("Computation failed: eigenvalues did not converge")
+            if its == 10 or its == 20:
+                # exceptional shift to break cycles between close eigenvalues
+                t += x
+                for i in range(nn + 1):
+                    a[i][i] -= x
+                s = abs(a[nn][nn - 1]) + abs(a[nn - 1][nn - 2])
+                y = x = 0.75 * s
+                w = -0.4375 * s * s
+            its += 1
+            total_iter += 1
+
+            m = nn - 2
+            while m >= l:
+                z = a[m][m]
+                r = x - z
+                s = y - z
+                p = (r * s - w) / a[m + 1][m] + a[m][m + 1]
+                q = a[m + 1][m + 1] - z - r - s
+                r = a[m + 2][m + 1]
+                s = abs(p) + abs(q) + abs(r)
+                p /= s
+                q /= s
+                r /= s
+                if m == l:
+                    break
+                u = abs(a[m][m - 1]) * (abs(q) + abs(r))
+                v = abs(p) * (abs(a[m - 1][m - 1]) + abs(z) + abs(a[m + 1][m + 1]))
+                if u + v == v:
+                    break
+                m -= 1
+
+            for i in range(m + 2, nn + 1):
+                a[i][i - 2] = 0.0
+                if i != m + 2:
+                    a[i][i - 3] = 0.0
+
+            for k in range(m, nn):
+                if k != m:
+                    p = a[k][k - 1]
+                    q = a[k + 1][k - 1]
+                    r = a[k + 2][k - 1] if k != nn - 1 else 0.0
+                    x = abs(p) + abs(q) + abs(r)
+                    if x != 0.0:
+                        p /= x
+                        q /= x
+                        r /= x
+                s = (p * p + q * q + r * r) ** 0.5
+                if p < 0:
+                    s = -s
+                if s == 0.0:
+                    continue
+                if k == m:
+                    if l != m:
+                        a[k][k - 1] = -a[k][k - 1]
+                else:
+                    a[k][k - 1] = -s * x
+                p += s
+                x = p / s
+                y = q / s
+                z = r / s
+                q /= p
+                r /= p
+                row_k = a[k]
+                row_k1 = a[k + 1]
+                if k != nn - 1:
+                    row_k2 = a[k + 2]
+                    for j in range(k, nn + 1):
+                        p = row_k[j] + q * row_k1[j] + r * row_k2[j]
+                        row_k2[j] -= p * z
+                        row_k1[j] -= p * y
+                        row_k[j] -= p * x
+                else:
+                    for j in range(k, nn + 1):
+                        p = row_k[j] + q * row_k1[j]
+                        row_k1[j] -= p * y
+                        row_k[j] -= p * x
+                for i in range(l, min(nn, k + 3) + 1):
+                    row = a[i]
+                    p = x * row[k] + y * row[k + 1]
+                    if k != nn - 1:
+                        p += z * row[k + 2]
+                        row[k + 2] -= p * r
+                    row[k + 1] -= p * q
+                    row[k] -= p
+
+    return wr, wi
+
+# Symmetric Eigen Solver
+
+def _is_symmetric(A, tol=1e-10):
+    n = len(A)
+    if n != len(A[0]):
+        return False
+    for i in range(n):
+        row = A[i]
+        for j in range(i + 1, n):
+            if abs(row[j] - A[j][i]) > tol:
+                return False
+    return True
+
+def _jacobi_eigen(A, max_sweeps=100):
+    # cyclic Jacobi rotations on a float copy; V accumulates the rotations so its columns are
+    # orthonormal eigenvectors. Returns (values, vectors) with vectors as rows
+    n = len(A)
+    V = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    scale = max(abs(x) for row in A for x in row) or 1.0
+
+    for _ in range(max_sweeps):
+        off = 0.0
+        for p in range(n - 1):
+            row = A[p]
+            for q in range(p + 1, n):
+                off += row[q] * row[q]
+        if off ** 0.5 <= 1e-15 * scale:
+            break
 
-    return [A[i][i] for i in range(len(A))]
+        for p in range(n - 1):
+            for q in range(p + 1, n):
+                apq = A[p][q]
+                if abs(apq) <= 1e-300:
+                    continue
+                tau = (A[q][q] - A[p][p]) / (2.0 * apq)
+                t = 1.0 / (abs(tau) + (1.0 + tau * tau) ** 0.5)
+                if tau < 0:
+                    t = -t
+                c = 1.0 / (1.0 + t * t) ** 0.5
+                s = t * c
+
+                for row in A:
+                    akp = row[p]
+                    akq = row[q]
+                    row[p] = c * akp - s * akq
+                    row[q] = s * akp + c * akq
+                row_p = A[p]
+                row_q = A[q]
+                A[p] = [c * x - s * y for x, y in zip(row_p, row_q)]
+                A[q] = [s * x + c * y for x, y in zip(row_p, row_q)]
+                for row in V:
+                    vkp = row[p]
+                    vkq = row[q]
+                    row[p] = c * vkp - s * vkq
+                    row[q] = s * vkp + c * vkq
+    else:
+        raise ValueError("Computation failed: symmetric eigen solver did not converge")
+
+    order = sorted(range(n), key=lambda i: -abs(A[i][i]))
+    values = [A[i][i] for i in order]
+    vectors = [[V[k][i] for k in range(n)] for i in order]
+    return values, vectors
+
+@_cached
+def symmetric_eigen(matrix):
+    num_rows = validate_square_matrix(matrix)
+    A = [[float(x) for x in row] for row in _rows_of(matrix)]
+    if not _is_symmetric(A):
+        raise ValueError("Invalid input: matrix must be symmetric")
 
-def null_space(matrix):
-    _, num_cols = validate_matrix(matrix)
-    A = rref(matrix)
+    if _use_numpy(num_rows):
+        values, vectors = _np_symmetric_eigen(np.array(A))
+    else:
+        values, vectors = _jacobi_eigen(A)
 
-    pivot_cols = []
-    for row in A:
-        for j in range(num_cols):
-            if abs(row[j]) > 1e-10:
-                pivot_cols.append(j)
-                break
-    # print("Pivot cols:", pivot_cols)
-    free_cols = [j for j in range(num_cols) if j not in pivot_cols]
-    # print("Free cols:", free_cols)
-    if not free_cols:
-        return [[0.0] * num_cols]
+    return values, _like(matrix, vectors)
 
-    basis = []
-    for free_col in free_cols:
-        v = [0.0] * num_cols
-        v[free_col] = 1.0
+@_cached
+def eigenvalues(matrix, max_iter = 1000, tol = 1e-10):
+    num_rows = validate_square_matrix(matrix)
+    shape = structure(matrix)
+    if shape.triangular:
+        return sorted((float(d) for d in _diagonal(matrix)), key=lambda value: -abs(value))
+    if _use_numpy(num_rows):
+        return _np_eigenvalues(_to_numpy(matrix), max(tol, 1e-10))
+    A = [[float(x) for x in row] for row in _rows_of(matrix)]
 
-        for i, pivot_col in enumerate(pivot_cols):
-            v[pivot_col] = -A[i][free_col]
+    if shape.symmetric:
+        return _jacobi_eigen(A)[0]
 
-        basis.append(v)
+    wr, wi = _hessenberg_eigenvalues(_hessenberg(A), max_iter)
 
-    return basis if basis else [[0.0] * num_cols]
+    values = [complex(re, im) if abs(im) > tol else re for re, im in zip(wr, wi)]
+    values.sort(key=lambda value: -abs(value))
+    return values
 
+@_cached
+def null_space(matrix, exact=None):
+    if isinstance(matrix, SparseMatrix):
+        return _sparse_null_space(matrix)
+    return analyze(matrix, exact).null_space
+
+@_cached
 def eigenvector(matrix, eigenvalue):
     num_rows = validate_square_matrix(matrix)
-    A_shifted = [row[:] for row in matrix]
+    A_shifted = _rows_of(matrix)
 
     for i in range(num_rows):
         A_shifted[i][i] -= eigenvalue
 
-    return null_space(A_shifted)
+    return _like(matrix, null_space(A_shifted))
 
+@_cached
 def eigenvectors(matrix):
     validate_square_matrix(matrix)
+
+    A = [[float(x) for x in row] for row in _rows_of(matrix)]
+    if _is_symmetric(A):
+        return _group_eigenpairs(matrix, *symmetric_eigen(A))
+
     eigenvals = eigenvalues(matrix)
     result = []
     for lam in eigenvals:
@@ -401,9 +3418,23 @@ def eigenvectors(matrix):
         result.append((lam, v))
     return result
 
+def _group_eigenpairs(matrix, values, vectors):
+    # repeated eigenvalues share one entry whose basis spans the whole eigenspace
+    scale = max([abs(value) for value in values] + [1.0])
+    groups = []
+    for value, vector in zip(values, vectors):
+        for group in groups:
+            if abs(group[0] - value) <= 1e-8 * scale:
+                group[1].append(vector)
+                break
+        else:
+            groups.append((value, [vector]))
+    return [(lam, _like(matrix, basis)) for lam, basis in groups]
+
+@_cached
 def diagonalize(matrix):
     num_rows = validate_square_matrix(matrix)
-    A = [row[:] for row in matrix]
+    A = _rows_of(matrix)
 
     values = eigenvectors(A)
     print("Eigenvectors output:", values)
@@ -428,7 +3459,7 @@ def diagonalize(matrix):
     
     P_inv = inverse(P)
 
-    return P, D, P_inv
+    return _like(matrix, P), _like(matrix, D), _like(matrix, P_inv)
 
     
     
@@ -461,41 +3492,356 @@ def diagonalize(matrix):
 
     """
 
+@_cached
 def col_space(matrix):
-    num_rows, num_cols = validate_matrix(matrix)
-    A = [row[:] for row in matrix]
-    A1 = rref(A)
-
-    pivot_cols = []
-    for row in A1:
-        for j in range(num_cols):
-            if abs(row[j]) > 1e-10:
-                pivot_cols.append(j)
-                break
-
-    basis = []
-    for col_index in pivot_cols:
-        col = [A[i][col_index] for i in range(num_rows)]
-        basis.append(col)
-
-    return basis
+    return analyze(matrix).col_space
 
+@_cached
 def row_space(matrix):
-    validate_matrix(matrix)
-    A = [row[:] for row in matrix]
-    A1 = rref(A)
-
-    basis = []
-    for row in A1:
-        if any(abs(x) > 1e-10 for x in row):
-            basis.append(row)
-
-    return basis
+    return analyze(matrix).row_space
 
+@_cached
 def change_of_basis(old_basis, new_basis):
     validate_square_matrix(old_basis, "old_basis")
     validate_square_matrix(new_basis, "new_basis")
 
-    new_inv = inverse(new_basis)
+    return _like_any((old_basis, new_basis), factorize(new_basis).solve_many(_rows_of(old_basis)))
+
+# Batched API
+
+class MatrixStack:
+    # count matrices of one shape packed back to back in a single array('d')
+    __slots__ = ("data", "shape")
+
+    def __init__(self, matrices):
+        if not matrices:
+            raise ValueError("Invalid input: stack cannot be empty")
+        num_rows, num_cols = validate_matrix(matrices[0], "matrix 0")
+        data = array("d")
+        for i, matrix in enumerate(matrices):
+            if validate_matrix(matrix, f"matrix {i}") != (num_rows, num_cols):
+                raise ValueError("Invalid input: stack matrices must share one shape")
+            for row in matrix:
+                data.extend(row)
+        self.data = data
+        self.shape = (len(matrices), num_rows, num_cols)
+
+    @classmethod
+    def from_buffer(cls, data, count, num_rows, num_cols):
+        if count <= 0 or num_rows <= 0 or num_cols <= 0:
+            raise ValueError("Invalid input: stack cannot be empty")
+        if len(data) != count * num_rows * num_cols:
+            raise ValueError(f"Invalid input: buffer length must be {count * num_rows * num_cols} for a {count}x{num_rows}x{num_cols} stack")
+        S = cls.__new__(cls)
+        S.data = data if isinstance(data, array) and data.typecode == "d" else array("d", data)
+        S.shape = (count, num_rows, num_cols)
+        return S
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, index):
+        count, num_rows, num_cols = self.shape
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("stack index out of range")
+        start = index * num_rows * num_cols
+        flat = self.data[start:start + num_rows * num_cols].tolist()
+        return [flat[i * num_cols:(i + 1) * num_cols] for i in range(num_rows)]
+
+    def __iter__(self):
+        for i in range(self.shape[0]):
+            yield self[i]
+
+    def tolist(self):
+        return list(self)
+
+    def __repr__(self):
+        return f"MatrixStack(shape={self.shape})"
+
+def _as_stack(stack, square=True):
+    if not isinstance(stack, MatrixStack):
+        stack = MatrixStack(stack)
+    if square and stack.shape[1] != stack.shape[2]:
+        raise ValueError("Invalid input: stack matrices must be square")
+    return stack
+
+def _np_stack(stack):
+    return np.frombuffer(stack.data, dtype=np.float64).reshape(stack.shape).copy()
+
+def _np_stack_to_packed(values):
+    data = array("d")
+    data.frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return MatrixStack.from_buffer(data, *values.shape)
+
+def _np_batch_eliminate(A, width, jordan):
+    # partial-pivoting elimination of every matrix in a (count, n, width) stack at once;
+    # returns (eliminated stack, determinant per matrix, singular mask)
+    count, n, _ = A.shape
+    index = np.arange(count)
+    total = np.ones(count)
+    singular = np.zeros(count, dtype=bool)
+    # same singularity rule as the per-matrix Python path, so the answer never depends on the
+    # stack size: the scale-free test of _small_is_singular up to SMALL_KERNEL_MAX, the pivot
+    # threshold of _det_flat above it
+    relative = n <= SMALL_KERNEL_MAX
+    if relative:
+        bound = np.prod(np.linalg.norm(A[:, :, :n], axis=2), axis=1)
+    for i in range(n):
+        pivot_rows = i + np.argmax(np.abs(A[:, i:, i]), axis=1)
+        swapped = pivot_rows != i
+        if swapped.any():
+            row_i = A[index, i].copy()
+            A[index, i] = A[index, pivot_rows]
+            A[index, pivot_rows] = row_i
+            total[swapped] *= -1
+        pivots = A[:, i, i].copy()
+        small = pivots == 0.0 if relative else np.abs(pivots) < 1e-10
+        singular |= small
+        total *= pivots
+        pivots[small] = 1.0
+        if jordan:
+            A[:, i, :] /= pivots[:, None]
+            factors = A[:, :, i].copy()
+            factors[:, i] = 0.0
+            A -= factors[:, :, None] * A[:, None, i, :]
+        else:
+            factors = A[:, i + 1:, i] / pivots[:, None]
+            A[:, i + 1:, i:] -= factors[:, :, None] * A[:, None, i, i:]
+    if relative:
+        singular |= np.abs(total) <= 1e-10 * bound
+    total[singular] = 0.0
+    return A, total, singular
+
+def _np_batch_rref(A):
+    # Gauss-Jordan on a whole (count, rows, cols) stack. Each matrix tracks its own next pivot row,
+    # so per column only the matrices with a pivot left in that column take part
+    count, num_rows, num_cols = A.shape
+    index = np.arange(count)
+    rows = np.arange(num_rows)
+    current = np.zeros(count, dtype=np.intp)
+    for c in range(num_cols):
+        column = np.abs(A[:, :, c])
+        column[rows[None, :] < current[:, None]] = 0.0
+        pivot_rows = np.argmax(column, axis=1)
+        active = column[index, pivot_rows] > 1e-10
+        if not active.any():
+            continue
+        layers, top, pivot_rows = index[active], current[active], pivot_rows[active]
+        row_top = A[layers, top].copy()
+        A[layers, top] = A[layers, pivot_rows]
+        A[layers, pivot_rows] = row_top
+        A[layers, top] /= A[layers, top, c][:, None]
+        factors = A[layers, :, c].copy()
+        factors[np.arange(len(layers)), top] = 0.0
+        A[layers] -= factors[:, :, None] * A[layers, top][:, None, :]
+        current[active] += 1
+    return A
+
+def _det_flat(a, n):
+    # partial-pivoting elimination on one row-major n*n list
+    total = 1.0
+    for i in range(n):
+        base = i * n
+        pivot_row = i
+        best = abs(a[base + i])
+        for k in range(i + 1, n):
+            value = abs(a[k * n + i])
+            if value > best:
+                pivot_row = k
+                best = value
+        if best < 1e-10:
+            return 0.0
+        if pivot_row != i:
+            other = pivot_row * n
+            a[base:base + n], a[other:other + n] = a[other:other + n], a[base:base + n]
+            total = -total
+        pivot = a[base + i]
+        for k in range(i + 1, n):
+            row = k * n
+            factor = a[row + i] / pivot
+            if factor:
+                for j in range(i, n):
+                    a[row + j] -= factor * a[base + j]
+        total *= pivot
+    return total
 
-    return matrix_mult(new_inv, old_basis)
+def _gauss_jordan_flat(a, n, width):
+    # reduces the row-major n x width list [A | B] in place to [I | A^-1 B]; False if singular
+    for i in range(n):
+        base = i * width
+        pivot_row = i
+        best = abs(a[base + i])
+        for k in range(i + 1, n):
+            value = abs(a[k * width + i])
+            if value > best:
+                pivot_row = k
+                best = value
+        if best < 1e-10:
+            return False
+        if pivot_row != i:
+            other = pivot_row * width
+            a[base:base + width], a[other:other + width] = a[other:other + width], a[base:base + width]
+        pivot = a[base + i]
+        for j in range(width):
+            a[base + j] /= pivot
+        for k in range(n):
+            if k != i:
+                row = k * width
+                factor = a[row + i]
+                if factor:
+                    for j in range(width):
+                        a[row + j] -= factor * a[base + j]
+    return True
+
+def _exact_stack(stack):
+    # integer/Fraction row lists for exact batch mode; a packed stack must hold integral doubles
+    if isinstance(stack, MatrixStack):
+        count, n, num_cols = stack.shape
+        if n != num_cols:
+            raise ValueError("Invalid input: stack matrices must be square")
+        if not all(x.is_integer() for x in stack.data):
+            raise ValueError("Invalid input: exact mode needs integer or Fraction entries")
+        values = [int(x) for x in stack.data]
+        size = n * n
+        return [[values[k * size + i * n:k * size + (i + 1) * n] for i in range(n)] for k in range(count)]
+    if not stack:
+        raise ValueError("Invalid input: stack cannot be empty")
+    matrices = []
+    for i, matrix in enumerate(stack):
+        validate_square_matrix(matrix, f"matrix {i}")
+        matrices.append(_exact_rows(matrix, True))
+    return matrices
+
+def det_batch(stack, exact=False, workers=None):
+    if exact:
+        # exact matrices may differ in size; workers split the stack, one matrix per task
+        matrices = _exact_stack(stack)
+        if workers and workers > 1 and len(matrices) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(min(workers, len(matrices))) as pool:
+                return list(pool.map(_exact_det, matrices))
+        return [_exact_det(rows) for rows in matrices]
+    stack = _as_stack(stack)
+    count, n, _ = stack.shape
+    if _use_numpy(count):
+        return _np_batch_eliminate(_np_stack(stack), n, False)[1].tolist()
+
+    data = stack.data
+    size = n * n
+    if n <= SMALL_KERNEL_MAX:
+        dets = []
+        for k in range(count):
+            a = data[k * size:(k + 1) * size].tolist()
+            d = _det_small(a, n)
+            dets.append(0.0 if _small_is_singular(a, n, d) else d)
+        return dets
+    return [_det_flat(data[k * size:(k + 1) * size].tolist(), n) for k in range(count)]
+
+def inverse_batch(stack):
+    stack = _as_stack(stack)
+    count, n, _ = stack.shape
+    if _use_numpy(count):
+        A = np.concatenate((_np_stack(stack), np.broadcast_to(np.eye(n), (count, n, n))), axis=2)
+        A, _, singular = _np_batch_eliminate(A, 2 * n, True)
+        if singular.any():
+            raise ValueError(f"matrix {int(np.argmax(singular))} is singular")
+        return _np_stack_to_packed(A[:, :, n:])
+
+    data = stack.data
+    size = n * n
+    out = array("d")
+    if n <= SMALL_KERNEL_MAX:
+        for k in range(count):
+            inv = _inverse_small(data[k * size:(k + 1) * size].tolist(), n)
+            if inv is None:
+                raise ValueError(f"matrix {k} is singular")
+            out.extend(inv)
+        return MatrixStack.from_buffer(out, count, n, n)
+
+    identity_rows = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    for k in range(count):
+        flat = data[k * size:(k + 1) * size].tolist()
+        augment = []
+        for i in range(n):
+            augment.extend(flat[i * n:(i + 1) * n])
+            augment.extend(identity_rows[i])
+        if not _gauss_jordan_flat(augment, n, 2 * n):
+            raise ValueError(f"matrix {k} is singular")
+        for i in range(n):
+            out.extend(augment[i * 2 * n + n:(i + 1) * 2 * n])
+    return MatrixStack.from_buffer(out, count, n, n)
+
+def solve_batch(stack, rhs):
+    stack = _as_stack(stack)
+    count, n, _ = stack.shape
+    num_rhs, vec_len = validate_matrix(rhs, "right-hand sides")
+    if num_rhs != count:
+        raise ValueError(f"Invalid input: got {num_rhs} right-hand sides for {count} matrices")
+    if vec_len != n:
+        raise ValueError(f"Invalid input: matrix size ({n}x{n}) must match vector length ({vec_len})")
+
+    if _use_numpy(count):
+        b = np.array(_rows_of(rhs), dtype=np.float64)[:, :, None]
+        A, _, singular = _np_batch_eliminate(np.concatenate((_np_stack(stack), b), axis=2), n + 1, True)
+        if singular.any():
+            raise ValueError(f"matrix {int(np.argmax(singular))} is singular")
+        return A[:, :, n].tolist()
+
+    data = stack.data
+    size = n * n
+    solutions = []
+    if n <= SMALL_KERNEL_MAX:
+        for k in range(count):
+            inv = _inverse_small(data[k * size:(k + 1) * size].tolist(), n)
+            if inv is None:
+                raise ValueError(f"matrix {k} is singular")
+            b = rhs[k]
+            solutions.append([sum(inv[i * n + j] * b[j] for j in range(n)) for i in range(n)])
+        return solutions
+    for k in range(count):
+        flat = data[k * size:(k + 1) * size].tolist()
+        b = rhs[k]
+        augment = []
+        for i in range(n):
+            augment.extend(flat[i * n:(i + 1) * n])
+            augment.append(b[i])
+        if not _gauss_jordan_flat(augment, n, n + 1):
+            raise ValueError(f"matrix {k} is singular")
+        solutions.append(augment[n::n + 1])
+    return solutions
+
+def rref_batch(stack):
+    stack = _as_stack(stack, square=False)
+    count, num_rows, num_cols = stack.shape
+    if _use_numpy(count):
+        return _np_stack_to_packed(_np_batch_rref(_np_stack(stack)))
+
+    size = num_rows * num_cols
+    data = stack.data
+    out = array("d")
+    for k in range(count):
+        flat = data[k * size:(k + 1) * size].tolist()
+        rows = [flat[i * num_cols:(i + 1) * num_cols] for i in range(num_rows)]
+        for row in _rref_pivots(rows)[0]:
+            out.extend(row)
+    return MatrixStack.from_buffer(out, count, num_rows, num_cols)
+
+# Web Bridge
+
+def _json_ready(value):
+    # JSON has no complex or rational numbers, so the terminal gets them as text ("1.0+2.0i", "1/3")
+    if isinstance(value, complex):
+        return f"{value.real!r}{'-' if value.imag < 0 else '+'}{abs(value.imag)!r}i"
+    if isinstance(value, Fraction):
+        return str(value)
+    if isinstance(value, (Matrix, SparseMatrix, BandMatrix)):
+        return _json_ready(value.tolist())
+    if isinstance(value, (list, tuple)):
+        return [_json_ready(x) for x in value]
+    return value
+
+def to_json(result):
+    # the Pyodide bridge in src/utils/parser.js serializes every result through this
+    return json.dumps(_json_ready(result))
@@ -282,10 +282,10 @@ Note: You can still use literal syntax:
   }).join(', ');
 
   // Execute function and convert result to JSON for serialization
+  // (to_json writes complex and Fraction values as text)
   pythonCode += `
-import json
 result = ${funcName}(${pythonArgs})
-json.dumps(result)
+to_json(result)
 `;
 
   console.log('Executing Python code:', pythonCode);
@@ -0,0 +1,59 @@
+"""
+Test the shared RREF analysis object against the one-shot functions
+"""
+from main import (
+    Matrix, analyze, RREFAnalysis, rref, rank, null, lin_ind,
+    null_space, col_space, row_space, matrix_times_vector
+)
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, Matrix):
+        a = a.tolist()
+    if isinstance(b, Matrix):
+        b = b.tolist()
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) < tol
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+print("=" * 70)
+print("RREF ANALYSIS TESTS")
+print("=" * 70)
+
+A = [[1, 2, 0, 3], [2, 4, 1, 7], [3, 6, 1, 10]]
+info = analyze(A)
+
+print("\n1. Cached properties")
+print("-" * 70)
+check("returns RREFAnalysis", isinstance(info, RREFAnalysis))
+check("pivot columns", info.pivot_cols == [0, 2])
+check("free columns", info.free_cols == [1, 3])
+check("rank", info.rank == 2)
+check("nullity", info.nullity == 2)
+check("lin_ind", info.lin_ind is False)
+check("rref", close(info.rref, rref(A)))
+check("null space vectors are in the null space", all(close(matrix_times_vector(A, v), [0, 0, 0]) for v in info.null_space))
+check("col space", close(info.col_space, [[1, 2, 3], [0, 1, 1]]))
+check("row space", close(info.row_space, [[1, 2, 0, 3], [0, 0, 1, 1]]))
+basis = info.null_space
+basis[0][0] = 99
+check("bases are defensive copies", info.null_space[0][0] != 99)
+
+print("\n2. One-shot functions agree")
+print("-" * 70)
+check("rank", rank(A) == info.rank)
+check("null", null(A) == info.nullity)
+check("lin_ind", lin_ind([[1, 0], [0, 1]]))
+check("null_space", close(null_space(A), info.null_space))
+check("null_space of full rank", close(null_space([[1, 0], [0, 1]]), [[0, 0]]))
+check("col_space", close(col_space(A), info.col_space))
+check("row_space", close(row_space(A), info.row_space))
+check("zero matrix has empty col space", col_space([[0, 0], [0, 0]]) == [])
+check("Matrix input keeps Matrix bases", isinstance(analyze(Matrix(A)).null_space, Matrix))
+
+print("\n" + "=" * 70)
+print("RREF ANALYSIS TESTS COMPLETE")
+print("=" * 70)
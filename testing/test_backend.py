@@ -0,0 +1,115 @@
+"""
+Test that the NumPy backend agrees with the pure-Python code
+(skipped when numpy is not installed)
+"""
+import random
+from main import (
+    np, set_backend, get_backend, Matrix, rref, lu, qr, inverse, det,
+    solve_system, eigenvalues, eigenvectors, diagonalize, matrix_mult
+)
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, Matrix):
+        a = a.tolist()
+    if isinstance(b, Matrix):
+        b = b.tolist()
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) < tol
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def both(func, *args):
+    set_backend("python")
+    expected = func(*args)
+    set_backend("numpy")
+    try:
+        result = func(*args)
+    finally:
+        set_backend("auto")
+    return expected, result
+
+def errors_match(func, *args):
+    messages = []
+    for backend in ("python", "numpy"):
+        set_backend(backend)
+        try:
+            func(*args)
+            messages.append(None)
+        except ValueError as e:
+            messages.append(str(e))
+    set_backend("auto")
+    return messages[0] is not None and messages[0] == messages[1]
+
+print("=" * 70)
+print("NUMPY BACKEND TESTS")
+print("=" * 70)
+
+if np is None:
+    print("numpy not installed - backend is", get_backend(), "- skipping")
+else:
+    random.seed(2)
+    n = 12
+    A = [[random.uniform(-5, 5) for _ in range(n)] for _ in range(n)]
+    S = [[A[i][j] + A[j][i] + (20.0 * i if i == j else 0.0) for j in range(n)] for i in range(n)]
+    wide = [[random.randint(-3, 3) for _ in range(n + 3)] for _ in range(n - 2)]
+    b = [random.uniform(-1, 1) for _ in range(n)]
+
+    print("\n1. Results agree with the pure-Python backend")
+    print("-" * 70)
+    check("rref", close(*both(rref, wide)))
+    check("lu", close(*both(lu, A)))
+    check("qr", close(*both(qr, A)))
+    check("inverse", close(*both(inverse, A)))
+    check("det", close(*both(det, A), tol=1e-6 * abs(det(A))))
+    check("solve_system", close(*both(solve_system, A, b)))
+    check("eigenvalues (symmetric)", close(*map(sorted, both(eigenvalues, S))))
+    check("matrix_mult", close(*both(matrix_mult, A, S)))
+
+    print("\n2. Return types are unchanged")
+    print("-" * 70)
+    _, result = both(inverse, A)
+    check("inverse returns list of lists", type(result) is list and type(result[0]) is list)
+    check("inverse element is float", type(result[0][0]) is float)
+    _, result = both(inverse, Matrix(A))
+    check("inverse of Matrix returns Matrix", isinstance(result, Matrix))
+    _, result = both(det, A)
+    check("det returns float", type(result) is float)
+
+    print("\n3. Errors match")
+    print("-" * 70)
+    check("inverse(singular)", errors_match(inverse, [[1, 2], [2, 4]]))
+    check("lu(needs pivoting)", errors_match(lu, [[0, 1], [1, 0]]))
+    check("qr(rank deficient)", close(*both(qr, [[1, 2], [2, 4]])))
+    check("det(singular) is 0", both(det, [[1, 2], [2, 4]]) == (0.0, 0.0))
+
+    print("\n4. Complex eigenvalues")
+    print("-" * 70)
+    # a random 8x8 rotation: every eigenvalue sits on the unit circle, most of them off the real axis
+    R, _ = qr([[random.uniform(-1, 1) for _ in range(8)] for _ in range(8)])
+    for backend in ("python", "numpy"):
+        set_backend(backend)
+        pairs = eigenvectors(R)
+        check(f"{backend} eigenvalues are complex", any(isinstance(lam, complex) and abs(lam.imag) > 1e-6 for lam, _ in pairs))
+        check(f"{backend} R v = lambda v", all(close([sum(a * x for a, x in zip(row, v)) for row in R], [lam * x for x in v])
+                                              for lam, basis in pairs for v in basis))
+        P, D, P_inv = diagonalize(R)
+        check(f"{backend} diagonalize rebuilds R", close(matrix_mult(matrix_mult(P, D), P_inv), R))
+        # a packed Matrix cannot hold complex entries, so these results come back as lists
+        for M in (Matrix(R), Matrix([[0, -1], [1, 0]])):
+            rows = M.tolist()
+            pairs = eigenvectors(M)
+            check(f"{backend} Matrix {len(rows)}x{len(rows)} R v = lambda v",
+                  all(close([sum(a * x for a, x in zip(row, v)) for row in rows], [lam * x for x in v])
+                      for lam, basis in pairs for v in basis))
+            P, D, P_inv = diagonalize(M)
+            check(f"{backend} Matrix {len(rows)}x{len(rows)} diagonalize returns lists",
+                  all(isinstance(part, list) for part in (P, D, P_inv)))
+            check(f"{backend} Matrix {len(rows)}x{len(rows)} diagonalize rebuilds it", close(matrix_mult(matrix_mult(P, D), P_inv), rows))
+    set_backend("auto")
+
+print("\n" + "=" * 70)
+print("NUMPY BACKEND TESTS COMPLETE")
+print("=" * 70)
@@ -0,0 +1,110 @@
+"""
+Test band storage and the tridiagonal and banded LU solvers
+"""
+import random
+import time
+from main import (
+    BandMatrix, Matrix, solve_system, det, factorize, matrix_times_vector,
+    set_backend
+)
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) <= tol * max(1.0, abs(b))
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args):
+    try:
+        func(*args)
+        return False
+    except ValueError:
+        return True
+
+def random_band(n, lower, upper, dominant=False):
+    rows = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(max(0, i - lower), min(n, i + upper + 1)):
+            rows[i][j] = random.uniform(-1, 1)
+        if dominant:
+            rows[i][i] = 2.0 * (lower + upper + 1)
+    return rows
+
+random.seed(16)
+
+print("=" * 70)
+print("BANDED SOLVER TESTS")
+print("=" * 70)
+
+print("\n1. Band storage")
+print("-" * 70)
+dense = random_band(7, 2, 1)
+band = BandMatrix.from_dense(dense)
+check("bandwidths detected", (band.lower, band.upper) == (2, 1))
+check("storage is n * (lower + upper + 1)", len(band.data) == 7 * 4)
+check("round trip to dense", band.tolist() == dense)
+check("entries outside the band read as zero", band[0, 5] == 0.0)
+check("writing outside the band raises", raises(band.__setitem__, (0, 5), 1.0))
+band[3, 4] = 9.0
+check("writing inside the band", band.tolist()[3][4] == 9.0)
+tri = BandMatrix.tridiagonal([1, 2, 3], [4, 5, 6, 7], [8, 9, 10])
+check("tridiagonal constructor", tri.tolist() == [[4, 8, 0, 0], [1, 5, 9, 0], [0, 2, 6, 10], [0, 0, 3, 7]])
+check("tridiagonal length mismatch raises", raises(BandMatrix.tridiagonal, [1], [1, 2, 3], [1, 2]))
+v = [random.uniform(-1, 1) for _ in range(7)]
+check("matrix_times_vector", close(matrix_times_vector(band, v), matrix_times_vector(band.tolist(), v)))
+
+print("\n2. Solvers")
+print("-" * 70)
+for name, (n, lower, upper, dominant) in [("Thomas", (40, 1, 1, True)), ("tridiagonal with pivoting", (40, 1, 1, False)),
+                                          ("banded LU", (40, 3, 2, False)), ("lower-heavy band", (30, 4, 0, False))]:
+    dense = random_band(n, lower, upper, dominant)
+    for i in range(n):
+        dense[i][i] += 0.1
+    b = [random.uniform(-1, 1) for _ in range(n)]
+    x = solve_system(BandMatrix.from_dense(dense, lower, upper), b)
+    check(f"{name} solve", close(matrix_times_vector(dense, x), b))
+    check(f"{name} det", close(det(BandMatrix.from_dense(dense, lower, upper)), factorize(dense).det(), 1e-8))
+needs_pivot = BandMatrix.tridiagonal([1.0] * 5, [0.0] * 6, [1.0] * 5)
+check("zero diagonal handled by pivoting", close(matrix_times_vector(needs_pivot, solve_system(needs_pivot, [1, 2, 3, 4, 5, 6])), [1, 2, 3, 4, 5, 6]))
+singular = BandMatrix(6, 1, 1)
+check("zero band matrix has zero det", det(singular) == 0.0)
+check("zero band matrix solve raises", raises(solve_system, singular, [1] * 6))
+check("factorize returns a reusable banded LU", close(factorize(tri).solve([1, 2, 3, 4]), solve_system(tri.tolist(), [1, 2, 3, 4])))
+
+print("\n3. Dense input dispatch")
+print("-" * 70)
+set_backend("python")
+dense = random_band(60, 2, 2, True)
+b = [1.0] * 60
+check("dense banded solve", close(matrix_times_vector(dense, solve_system(dense, b)), b))
+check("dense banded det", close(det(dense), factorize(dense).det(), 1e-8))
+check("Matrix banded solve", close(matrix_times_vector(dense, solve_system(Matrix(dense), b)), b))
+set_backend("auto")
+
+print("\n4. Large systems")
+print("-" * 70)
+n = 100000
+sub, diag, sup = [-1.0] * (n - 1), [2.5] * n, [-1.0] * (n - 1)
+big = BandMatrix.tridiagonal(sub, diag, sup)
+rhs = [1.0] * n
+start = time.perf_counter()
+x = solve_system(big, rhs)
+elapsed = time.perf_counter() - start
+print(f"  n = {n} tridiagonal: {elapsed:.3f}s")
+check("100000x100000 tridiagonal residual", close(matrix_times_vector(big, x), rhs))
+penta = BandMatrix(20000, 2, 2)
+for i in range(20000):
+    for j in range(max(0, i - 2), min(20000, i + 3)):
+        penta[i, j] = 6.0 if i == j else random.uniform(-1, 1)
+start = time.perf_counter()
+x = solve_system(penta, [1.0] * 20000)
+elapsed = time.perf_counter() - start
+print(f"  n = 20000 pentadiagonal: {elapsed:.3f}s")
+check("20000x20000 pentadiagonal residual", close(matrix_times_vector(penta, x), [1.0] * 20000))
+
+print("\n" + "=" * 70)
+print("BANDED SOLVER TESTS COMPLETE")
+print("=" * 70)
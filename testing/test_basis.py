@@ -0,0 +1,117 @@
+"""
+Test the incremental Basis accumulator against rank, col_space and row_space
+"""
+import random
+import time
+from fractions import Fraction
+from main import Basis, rank, col_space, row_space, transpose
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args):
+    try:
+        func(*args)
+        return False
+    except ValueError:
+        return True
+
+def close(a, b, tol=1e-8):
+    if isinstance(a, list):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) <= tol * max(1.0, abs(b))
+
+random.seed(25)
+
+print("=" * 70)
+print("INCREMENTAL BASIS TESTS")
+print("=" * 70)
+
+print("\n1. Streaming insertion")
+print("-" * 70)
+B = Basis()
+check("empty basis", B.rank == 0 and B.basis == [] and B.col_space == [])
+check("first vector is independent", B.add([1.0, 2.0, 3.0]))
+check("multiple is dependent", not B.add([2.0, 4.0, 6.0]))
+check("new direction is independent", B.add([0.0, 1.0, 1.0]))
+check("combination is dependent", not B.add([1.0, 4.0, 5.0]))
+check("rank counts accepted vectors", B.rank == len(B) == 2)
+check("membership test", [1.0, 3.0, 4.0] in B and [0.0, 0.0, 1.0] not in B)
+check("zero vector is dependent", not B.add([0.0, 0.0, 0.0]))
+check("col_space keeps the vectors as given", B.col_space == [[1.0, 2.0, 3.0], [0.0, 1.0, 1.0]])
+check("basis is reduced echelon", close(B.basis, [[1.0, 0.0, 1.0], [0.0, 1.0, 1.0]]))
+check("pivot columns", B.pivot_cols == [0, 1])
+check("full rank", B.add([0.0, 0.0, 1.0]) and B.rank == 3 and not B.add([5.0, -1.0, 2.0]))
+
+print("\n2. Agreement with rank, col_space and row_space")
+print("-" * 70)
+for n, k in [(6, 10), (12, 8), (20, 30)]:
+    independent = [[random.uniform(-1, 1) for _ in range(n)] for _ in range(k // 2)]
+    vectors = []
+    for v in independent:
+        vectors.append(v)
+        a, b = random.uniform(-2, 2), random.uniform(-2, 2)
+        w = random.choice(vectors)
+        vectors.append([a * x + b * y for x, y in zip(v, w)])
+    B = Basis(vectors)
+    A = transpose(vectors)
+    check(f"{n}-dim, {k} vectors: rank", B.rank == rank(A))
+    check(f"{n}-dim, {k} vectors: col_space", close(B.col_space, col_space(A)))
+    check(f"{n}-dim, {k} vectors: basis", close(B.basis, row_space(vectors)))
+    check(f"{n}-dim, {k} vectors: accepted vectors in span", all(v in B for v in vectors))
+
+print("\n3. Exact mode")
+print("-" * 70)
+B = Basis([[Fraction(1, 3), Fraction(1, 2)], [Fraction(2, 3), Fraction(1)]])
+check("Fraction input switches exact on", B.exact and B.rank == 1)
+check("basis stays exact", B.basis == [[Fraction(1), Fraction(3, 2)]])
+B = Basis(exact=True)
+near = [[1, 10 ** 12], [1, 10 ** 12 + 1]]
+check("integers with exact=True", B.add(near[0]) and B.add(near[1]) and B.rank == 2)
+check("float basis misses the same vectors", Basis(near).rank == 1)
+check("exact mode rejects floats", raises(Basis([[1, 2]], exact=True).add, [0.5, 1.0]))
+M = [[random.randint(-5, 5) for _ in range(8)] for _ in range(12)]
+check("exact rank matches", Basis(M, exact=True).rank == rank(transpose(M), exact=True))
+
+print("\n4. Input validation")
+print("-" * 70)
+B = Basis([[1.0, 0.0]])
+check("length mismatch", raises(B.add, [1.0, 0.0, 0.0]))
+check("membership with the wrong length is False", [1.0, 0.0, 0.0] not in B and "ab" not in B)
+E = Basis()
+check("empty basis contains only the zero vector", [1, 2] not in E and [0, 0] in E and [0.0, 1e-12] in E)
+check("unconvertible input is not a member", [1.0, None] not in B and [1j, 0] not in B and {} not in B)
+X = Basis([[1, 2]], exact=True)
+check("float vector on an exact basis is not a member", [0.5, 1.0] not in X and [1, 2] in X)
+Z = Basis([[0, 0, 0]])
+check("zero vectors only: zero is in the span", Z.rank == 0 and [0, 0, 0] in Z and [0, 1, 0] not in Z)
+check("membership query leaves dimension and mode unset", E.dim is None and E.exact is None)
+check("first add still fixes them", E.add([Fraction(1, 2), 1, 0]) and E.dim == 3 and E.exact)
+check("empty vector", raises(B.add, []))
+check("non-list vector", raises(B.add, "ab"))
+
+print("\n5. Performance")
+print("-" * 70)
+n = 60
+vectors = [[random.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+vectors += [[a + b for a, b in zip(vectors[i], vectors[i + 1])] for i in range(20)]
+random.shuffle(vectors)
+start = time.perf_counter()
+B = Basis()
+streamed = [B.add(v) for v in vectors]
+streaming = time.perf_counter() - start
+start = time.perf_counter()
+greedy, rerun_flags = [], []
+for v in vectors:
+    independent = rank(transpose(greedy + [v])) > len(greedy)
+    if independent:
+        greedy.append(v)
+    rerun_flags.append(independent)
+rerun = time.perf_counter() - start
+print(f"  {len(vectors)} vectors in R^{n}: Basis {streaming:.4f}s, rank() per vector {rerun:.4f}s")
+check("same greedy choices as rank()", streamed == rerun_flags and B.rank == n)
+
+print("\n" + "=" * 70)
+print("INCREMENTAL BASIS TESTS COMPLETE")
+print("=" * 70)
@@ -0,0 +1,78 @@
+"""
+Test the batched det/inverse/solve/rref entry points against the single-matrix functions
+"""
+import random
+from main import (
+    MatrixStack, det_batch, inverse_batch, solve_batch, rref_batch,
+    det, inverse, solve_system, rref, set_backend, np
+)
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) < tol
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args):
+    try:
+        func(*args)
+        return False
+    except ValueError:
+        return True
+
+print("=" * 70)
+print("BATCHED API TESTS")
+print("=" * 70)
+
+random.seed(5)
+backends = ["python"] + (["numpy"] if np is not None else [])
+for backend in backends:
+    set_backend(backend)
+    print(f"\n{backend} backend")
+    print("-" * 70)
+    for n in (2, 3, 4, 6):
+        matrices = [[[random.uniform(-2, 2) for _ in range(n)] for _ in range(n)] for _ in range(50)]
+        stack = MatrixStack(matrices)
+        rhs = [[random.uniform(-1, 1) for _ in range(n)] for _ in range(50)]
+        check(f"det_batch {n}x{n}", close(det_batch(stack), [det(m) for m in matrices]))
+        check(f"inverse_batch {n}x{n}", close(inverse_batch(stack).tolist(), [inverse(m) for m in matrices]))
+        check(f"solve_batch {n}x{n}", close(solve_batch(stack, rhs), [solve_system(m, b) for m, b in zip(matrices, rhs)]))
+    wide = [[[random.randint(-2, 2) for _ in range(5)] for _ in range(3)] for _ in range(20)]
+    check("rref_batch 3x5", close(rref_batch(wide).tolist(), [rref(m) for m in wide]))
+    mixed = [[[0, 1, 2], [0, 2, 4], [0, 0, 1]], [[1, 2, 3], [2, 4, 6], [1, 0, 0]], [[0, 0, 0], [0, 0, 0], [0, 0, 5]]] * 4
+    check("rref_batch with different pivot columns", close(rref_batch(mixed).tolist(), [rref(m) for m in mixed]))
+    tall = [[[random.randint(-2, 2) for _ in range(3)] for _ in range(6)] for _ in range(20)]
+    check("rref_batch 6x3", close(rref_batch(tall).tolist(), [rref(m) for m in tall]))
+    singular = [[[1, 2], [3, 4]], [[1, 2], [2, 4]]]
+    check("det_batch singular gives 0", close(det_batch(singular), [-2, 0]))
+    check("inverse_batch singular raises", raises(inverse_batch, singular))
+    check("solve_batch singular raises", raises(solve_batch, singular, [[1, 1], [1, 1]]))
+set_backend("auto")
+
+print("\nSingularity does not depend on the stack size")
+print("-" * 70)
+# 3 copies stay on the Python kernels, 10 reach the NumPy path when it is available
+badly_scaled = [[1e-11, 0], [0, 1e11]]
+flat = [[1e-11, 0], [0, 1e-11]]
+for count in (3, 10):
+    check(f"det_batch x{count} badly scaled", close(det_batch([badly_scaled] * count), [1.0] * count))
+    check(f"inverse_batch x{count} badly scaled",
+          close(inverse_batch([badly_scaled] * count).tolist(), [[[1e11, 0], [0, 1e-11]]] * count, tol=1e-3))
+    check(f"solve_batch x{count} badly scaled", close(solve_batch([badly_scaled] * count, [[1, 1]] * count), [[1e11, 1e-11]] * count, tol=1e-3))
+    check(f"det_batch x{count} uniformly small", all(abs(d / 1e-22 - 1) < 1e-9 for d in det_batch([flat] * count)))
+    check(f"det_batch x{count} rank deficient", det_batch([[[1e-11, 2e-11], [2e-11, 4e-11]]] * count) == [0.0] * count)
+
+print("\nStack validation")
+print("-" * 70)
+check("mixed shapes rejected", raises(MatrixStack, [[[1, 2], [3, 4]], [[1]]]))
+check("non-square rejected for det", raises(det_batch, [[[1, 2, 3], [4, 5, 6]]]))
+check("rhs count must match", raises(solve_batch, [[[1, 0], [0, 1]]], [[1, 2], [3, 4]]))
+check("from_buffer length checked", raises(MatrixStack.from_buffer, [1.0, 2.0, 3.0], 1, 2, 2))
+check("indexing", MatrixStack([[[1, 2], [3, 4]]])[0] == [[1.0, 2.0], [3.0, 4.0]])
+
+print("\n" + "=" * 70)
+print("BATCHED API TESTS COMPLETE")
+print("=" * 70)
@@ -0,0 +1,91 @@
+"""
+Test the opt-in result cache
+"""
+import gc
+import random
+import tracemalloc
+from main import (
+    Matrix, enable_cache, disable_cache, clear_cache, cache_info,
+    det, inverse, rref, eigenvalues, solve_system, transpose, null_space, SparseMatrix, trace
+)
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+print("=" * 70)
+print("RESULT CACHE TESTS")
+print("=" * 70)
+
+A = [[4, 7], [2, 6]]
+
+print("\n1. Disabled by default")
+print("-" * 70)
+check("cache starts disabled", cache_info()["enabled"] is False)
+det(A)
+check("no stats while disabled", cache_info()["hits"] == 0 and cache_info()["misses"] == 0)
+
+print("\n2. Hits and misses")
+print("-" * 70)
+enable_cache(max_entries=4)
+first = inverse(A)
+second = inverse(A)
+info = cache_info()
+check("first call misses, second hits", info["misses"] >= 1 and info["hits"] == 1)
+check("same values", first == second)
+second[0][0] = 1000
+check("results are defensive copies", inverse(A)[0][0] != 1000)
+check("equal content shares an entry", det([[4, 7], [2, 6]]) == det(A) and cache_info()["hits"] >= 3)
+B = [row[:] for row in A]
+B[0][0] = 5
+check("changed content misses", det(B) != det(A))
+check("int and float inputs are separate entries", rref([[1, 2], [3, 4]]) == rref([[1.0, 2.0], [3.0, 4.0]]))
+check("Matrix input still returns Matrix", isinstance(inverse(Matrix(A)), Matrix) and isinstance(inverse(Matrix(A)), Matrix))
+check("keyword arguments are part of the key", eigenvalues(A, tol=1e-8) == eigenvalues(A))
+check("multi-argument functions", solve_system(A, [1, 2]) == solve_system(A, [1, 2]))
+S = SparseMatrix.from_dense([[1.0, 2.0, 0.0], [0.0, 0.0, 3.0]])
+for func in (rref, transpose, null_space):
+    expected = func(S).tolist()
+    result = func(S)
+    result.values[0] = 1000.0
+    check(f"sparse {func.__name__} results are defensive copies", func(S).tolist() == expected)
+
+print("\n3. Bounds")
+print("-" * 70)
+for k in range(10):
+    det([[k, 1], [1, 1]])
+check("entry bound respected", cache_info()["entries"] <= 4)
+enable_cache(max_entries=100, max_bytes=2000)
+for k in range(20):
+    inverse([[k + 1, 1], [1, 2]])
+info = cache_info()
+check("byte bound respected", 0 < info["bytes"] <= 2000)
+clear_cache()
+# about 4.8 KB of index and value arrays, over the 2000-byte budget
+transpose(SparseMatrix.from_coo(list(range(200)), list(range(200)), [1.0] * 200, (200, 200)))
+check("sparse results count their arrays", cache_info()["entries"] == 0)
+enable_cache(max_entries=1000, max_bytes=1 << 20)
+gc.collect()
+tracemalloc.start()
+for _ in range(20):
+    trace(Matrix([[random.random() for _ in range(300)] for _ in range(300)]))
+    trace([[random.random() for _ in range(300)] for _ in range(300)])
+gc.collect()
+retained = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+print(f"  40 cached 300x300 inputs: {retained} bytes retained, {cache_info()['bytes']} reported")
+check("keys do not keep inputs alive", retained <= cache_info()["max_bytes"])
+check("reported size counts keys as well as results", cache_info()["bytes"] > 40 * 24)
+clear_cache()
+check("clear_cache empties", cache_info()["entries"] == 0 and cache_info()["hits"] == 0)
+try:
+    inverse([[1, 2], [2, 4]])
+except ValueError:
+    pass
+check("errors are not cached", cache_info()["entries"] == 0)
+disable_cache()
+check("disable_cache", cache_info()["enabled"] is False)
+
+print("\n" + "=" * 70)
+print("RESULT CACHE TESTS COMPLETE")
+print("=" * 70)
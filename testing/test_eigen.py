@@ -0,0 +1,80 @@
+"""
+Test the eigenvalue engine on matrices the old unshifted QR loop could not handle
+"""
+import random
+from main import eigenvalues, eigenvectors, symmetric_eigen, diagonalize, matrix_mult, det, trace, set_backend
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) < tol
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def product(values):
+    total = 1
+    for value in values:
+        total *= value
+    return total
+
+print("=" * 70)
+print("EIGENVALUE ENGINE TESTS")
+print("=" * 70)
+
+set_backend("python")
+
+print("\n1. Small known spectra")
+print("-" * 70)
+check("symmetric 2x2", close(eigenvalues([[2, 1], [1, 2]]), [3, 1]))
+check("1x1", close(eigenvalues([[5]]), [5]))
+check("identity (repeated)", close(eigenvalues([[1, 0], [0, 1]]), [1, 1]))
+check("defective", close(eigenvalues([[1, 1], [0, 1]]), [1, 1]))
+check("rotation gives complex pair", close(sorted(eigenvalues([[0, -1], [1, 0]]), key=lambda z: z.imag), [-1j, 1j]))
+check("sorted by magnitude", close(eigenvalues([[1, 0, 0], [0, -4, 0], [0, 0, 2]]), [-4, 2, 1]))
+check("close eigenvalues", close(sorted(eigenvalues([[1, 1e-3], [1e-3, 1]])), [1 - 1e-3, 1 + 1e-3], tol=1e-12))
+
+print("\n2. Larger random matrices")
+print("-" * 70)
+random.seed(7)
+n = 40
+A = [[random.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+values = eigenvalues(A)
+check("count", len(values) == n)
+check("sum equals trace", close(sum(values), trace(A)))
+check("product equals det", close(product(values), det(A), tol=1e-6 * max(1.0, abs(det(A)))))
+check("complex values come in conjugate pairs", close(sum(complex(v).imag for v in values), 0))
+
+print("\n3. Eigenvectors use the new eigenvalues")
+print("-" * 70)
+pairs = eigenvectors([[2, 0, 0], [0, 3, 4], [0, 4, 9]])
+check("three eigenpairs", len(pairs) == 3)
+check("eigenvalues", close(sorted(lam for lam, _ in pairs), [1, 2, 11]))
+
+print("\n4. Symmetric fast path")
+print("-" * 70)
+random.seed(11)
+n = 25
+B = [[random.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+S = [[B[i][j] + B[j][i] for j in range(n)] for i in range(n)]
+values, vectors = symmetric_eigen(S)
+check("eigenvalues match general path", close(values, eigenvalues(S)))
+check("A v = lambda v", all(close([sum(S[i][k] * v[k] for k in range(n)) for i in range(n)], [lam * x for x in v]) for lam, v in zip(values, vectors)))
+gram = matrix_mult(vectors, [[vectors[j][i] for j in range(n)] for i in range(n)])
+check("eigenvectors are orthonormal", close(gram, [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]))
+pairs = eigenvectors([[2, 0, 0], [0, 2, 0], [0, 0, 5]])
+check("repeated eigenvalue grouped", len(pairs) == 2 and len(pairs[1][1]) == 2)
+P, D, P_inv = diagonalize([[1, 0], [0, 1]])
+check("diagonalize identity", close(D, [[1, 0], [0, 1]]))
+try:
+    symmetric_eigen([[1, 2], [3, 4]])
+    check("non-symmetric rejected", False)
+except ValueError:
+    check("non-symmetric rejected", True)
+
+set_backend("auto")
+
+print("\n" + "=" * 70)
+print("EIGENVALUE ENGINE TESTS COMPLETE")
+print("=" * 70)
@@ -0,0 +1,122 @@
+"""
+Test exact (Fraction) mode and the Bareiss fraction-free kernels
+"""
+import random
+from fractions import Fraction
+from main import (
+    Matrix, rref, det, inverse, rank, null_space, solve_system, matrix_mult,
+    matrix_times_vector, analyze
+)
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+        return False
+    except ValueError:
+        return True
+
+def fraction_rref(A):
+    # textbook Gauss-Jordan over Fractions, as the reference
+    A = [[Fraction(x) for x in row] for row in A]
+    r = 0
+    for c in range(len(A[0])):
+        pivot = next((i for i in range(r, len(A)) if A[i][c]), None)
+        if pivot is None:
+            continue
+        A[r], A[pivot] = A[pivot], A[r]
+        A[r] = [x / A[r][c] for x in A[r]]
+        for i in range(len(A)):
+            if i != r and A[i][c]:
+                A[i] = [x - A[i][c] * y for x, y in zip(A[i], A[r])]
+        r += 1
+        if r == len(A):
+            break
+    return A
+
+def fraction_det(A):
+    A = [[Fraction(x) for x in row] for row in A]
+    total = Fraction(1)
+    for c in range(len(A)):
+        pivot = next((i for i in range(c, len(A)) if A[i][c]), None)
+        if pivot is None:
+            return Fraction(0)
+        if pivot != c:
+            A[c], A[pivot] = A[pivot], A[c]
+            total = -total
+        total *= A[c][c]
+        for i in range(c + 1, len(A)):
+            factor = A[i][c] / A[c][c]
+            A[i] = [x - factor * y for x, y in zip(A[i], A[c])]
+    return total
+
+def all_fractions(rows):
+    return all(isinstance(x, Fraction) for row in rows for x in row)
+
+random.seed(21)
+
+print("=" * 70)
+print("EXACT MODE TESTS")
+print("=" * 70)
+
+print("\n1. Mode selection")
+print("-" * 70)
+A = [[2, 1], [1, 3]]
+check("integer input stays float by default", isinstance(det(A), float))
+check("exact=True on integers gives a Fraction", det(A, exact=True) == Fraction(5))
+check("Fraction input switches exact mode on", inverse([[Fraction(2), 1], [1, 3]]) == [[Fraction(3, 5), Fraction(-1, 5)], [Fraction(-1, 5), Fraction(2, 5)]])
+check("exact=False forces floats", isinstance(det([[Fraction(1, 2), 0], [0, 2]], exact=False), float))
+check("float entries with exact=True raise", raises(det, [[1.5, 0], [0, 1]], exact=True))
+check("packed Matrix with exact=True raises", raises(rank, Matrix(A), exact=True))
+
+print("\n2. Agreement with Fraction Gauss-Jordan")
+print("-" * 70)
+for trial, (r, c, deficient) in enumerate([(4, 4, False), (5, 7, False), (6, 4, False), (5, 5, True), (6, 8, True)]):
+    M = [[random.randint(-9, 9) for _ in range(c)] for _ in range(r)]
+    if deficient:
+        M[-1] = [x - 2 * y for x, y in zip(M[0], M[1])]
+        M[-2] = [3 * x for x in M[0]]
+    expected = fraction_rref(M)
+    reduced = rref(M, exact=True)
+    check(f"rref {r}x{c}{' (rank deficient)' if deficient else ''}", reduced == expected and all_fractions(reduced))
+    check(f"rank {r}x{c}", rank(M, exact=True) == sum(1 for row in expected if any(row)))
+    basis = null_space(M, exact=True)
+    if rank(M, exact=True) < c:
+        check(f"null space {r}x{c} is exact", all(all(x == 0 for x in matrix_times_vector(M, v)) for v in basis))
+rational = [[Fraction(1, 3), Fraction(1, 2), 1], [Fraction(2, 7), 5, Fraction(-1, 4)], [1, Fraction(3, 8), Fraction(2, 9)]]
+check("rational rref", rref(rational) == fraction_rref(rational))
+
+print("\n3. det, inverse and solve")
+print("-" * 70)
+hilbert = [[Fraction(1, i + j + 1) for j in range(6)] for i in range(6)]
+check("6x6 Hilbert determinant", det(hilbert) == Fraction(1, 186313420339200000))
+inv = inverse(hilbert)
+identity = [[Fraction(int(i == j)) for j in range(6)] for i in range(6)]
+check("Hilbert inverse is exact", matrix_mult(hilbert, inv) == identity and inv[0][0] == 36)
+b = [Fraction(1, k + 1) for k in range(6)]
+x = solve_system(hilbert, b)
+check("Hilbert solve is exact", matrix_times_vector(hilbert, x) == b and x == [1, 0, 0, 0, 0, 0])
+check("swap sign", det([[0, 1], [1, 0]], exact=True) == -1)
+check("singular det is zero", det([[1, 2], [2, 4]], exact=True) == 0)
+check("singular inverse raises", raises(inverse, [[1, 2], [2, 4]], exact=True))
+check("singular solve raises", raises(solve_system, [[Fraction(1), 2], [2, 4]], [1, 1]))
+check("Fraction right-hand side turns exact mode on", solve_system([[2, 0], [0, 4]], [Fraction(1), 1]) == [Fraction(1, 2), Fraction(1, 4)])
+
+print("\n4. Large integer entries")
+print("-" * 70)
+big = 10 ** 15
+dependent = [[big, big + 1, 1], [big + 1, big + 2, 1], [1, 1, 0]]
+check("exact rank 2 on 1e15 entries", rank(dependent, exact=True) == 2)
+check("exact det 0 on 1e15 entries", det(dependent, exact=True) == 0)
+M = [[random.randint(-10 ** 6, 10 ** 6) for _ in range(12)] for _ in range(12)]
+d = det(M, exact=True)
+check("12x12 determinant is an integer", d.denominator == 1)
+check("Bareiss det matches Fraction elimination", d == fraction_det(M))
+check("analyze shares the exact elimination", analyze(hilbert).exact and analyze(hilbert).rank == 6)
+
+print("\n" + "=" * 70)
+print("EXACT MODE TESTS COMPLETE")
+print("=" * 70)
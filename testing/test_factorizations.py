@@ -0,0 +1,173 @@
+"""
+Test the reusable factorization objects against the one-shot functions
+"""
+import random
+import time
+import main
+from main import (
+    Matrix, factorize, LUFactorization, inverse, det, solve_system,
+    matrix_mult, matrix_times_vector, change_of_basis, lu, plu,
+    qr, householder_qr, QRFactorization, least_squares, transpose,
+    cholesky, cholesky_solve
+)
+from main import _tri_solve, _tri_solve_vector, _tri_mult, _tri_inverse
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, Matrix):
+        a = a.tolist()
+    if isinstance(b, Matrix):
+        b = b.tolist()
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) < tol
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args):
+    try:
+        func(*args)
+        return False
+    except ValueError:
+        return True
+
+print("=" * 70)
+print("FACTORIZATION TESTS")
+print("=" * 70)
+
+A = [[0, 2, 1], [1, 1, 0], [3, 0, 1]]
+b = [3, 2, 4]
+B = [[3, 1], [2, 0], [4, 2]]
+
+print("\n1. factorize")
+print("-" * 70)
+F = factorize(A)
+check("returns LUFactorization", isinstance(F, LUFactorization))
+x = F.solve(b)
+check("solve", close(matrix_times_vector(A, x), b))
+X = F.solve_many(B)
+check("solve_many", close(matrix_mult(A, X), B))
+check("solve_many keeps Matrix", isinstance(F.solve_many(Matrix(B)), Matrix))
+check("det", close(F.det(), det(A)))
+check("inverse", close(F.inverse(), inverse(A)))
+check("reusable after solves", close(F.solve(b), x))
+check("singular raises", raises(factorize, [[1, 2], [2, 4]]))
+check("non-square raises", raises(factorize, [[1, 2, 3], [4, 5, 6]]))
+check("wrong rhs length raises", raises(F.solve, [1, 2]))
+
+print("\n2. Built on factorize")
+print("-" * 70)
+check("solve_system", close(solve_system(A, b), x))
+check("solve_system zero pivot", close(solve_system([[0, 1], [1, 0]], [2, 3]), [3, 2]))
+check("solve_system singular raises", raises(solve_system, [[1, 2], [2, 4]], [1, 2]))
+check("change_of_basis", close(change_of_basis([[1, 0], [0, 1]], [[1, 1], [0, 1]]), [[1, -1], [0, 1]]))
+
+print("\n3. plu and lu")
+print("-" * 70)
+P, L, U = plu(A)
+check("plu reconstructs PA = LU", close(matrix_mult(L, U), [A[p] for p in P]))
+check("plu L is unit lower", all(L[i][i] == 1.0 and all(L[i][j] == 0.0 for j in range(i + 1, 3)) for i in range(3)))
+check("plu U is upper", all(U[i][j] == 0.0 for i in range(3) for j in range(i)))
+P, L, U = plu([[1, 2], [2, 4]])
+check("plu factors singular input", close(matrix_mult(L, U), [[[1, 2], [2, 4]][p] for p in P]))
+P, L, U = plu(Matrix(A))
+check("plu keeps Matrix", isinstance(L, Matrix) and isinstance(U, Matrix))
+L, U = lu([[4, 3], [6, 3]])
+check("lu without pivoting", close(L, [[1, 0], [1.5, 1]]) and close(U, [[4, 3], [0, -1.5]]))
+check("lu zero pivot still raises", raises(lu, [[0, 1], [1, 0]]))
+
+print("\n4. Householder QR")
+print("-" * 70)
+tall = [[1, 2], [3, 4], [5, 6], [7, 9]]
+F = householder_qr(tall)
+check("returns QRFactorization", isinstance(F, QRFactorization))
+Q = F.q()
+check("thin Q shape", len(Q) == 4 and len(Q[0]) == 2)
+check("Q has orthonormal columns", close(matrix_mult(transpose(Q), Q), [[1, 0], [0, 1]]))
+check("QR reconstructs", close(matrix_mult(Q, F.r()), tall))
+Q_full = F.q(full=True)
+check("full Q is orthogonal", close(matrix_mult(transpose(Q_full), Q_full), [[1 if i == j else 0 for j in range(4)] for i in range(4)]))
+y = [1, -1, 2, 0.5]
+check("apply_qt matches explicit Q", close(F.apply_qt(y), matrix_times_vector(transpose(Q_full), y)))
+check("apply_q undoes apply_qt", close(F.apply_q(F.apply_qt(y)), y))
+x = least_squares(tall, [5, 11, 17, 25])
+check("least squares exact fit", close(x, [1, 2]))
+check("least squares rank deficient raises", raises(least_squares, [[1, 2], [2, 4], [3, 6]], [1, 2, 3]))
+Q, R = qr([[1, 2], [2, 4]])
+check("qr no longer raises on rank deficiency", close(matrix_mult(Q, R), [[1, 2], [2, 4]]))
+Q, R = qr([[1, 2, 3], [4, 5, 6]])
+check("qr of wide matrix", close(matrix_mult(Q, R), [[1, 2, 3], [4, 5, 6]]))
+Q, R = qr([[1, 2, 3], [0, 1, 4], [5, 6, 0]])
+check("qr R has non-negative diagonal", all(R[i][i] >= 0 for i in range(3)))
+
+print("\n5. Triangular kernels")
+print("-" * 70)
+random.seed(13)
+n = 7
+U = [[random.uniform(1, 2) if j == i else (random.uniform(-1, 1) if j > i else 0.0) for j in range(n)] for i in range(n)]
+L = transpose(U)
+D = [[random.uniform(-3, 3) for _ in range(5)] for _ in range(n)]
+check("upper times dense", close(_tri_mult(U, D, lower=False), matrix_mult(U, D)))
+check("lower times dense", close(_tri_mult(L, D, lower=True), matrix_mult(L, D)))
+v = [random.uniform(-1, 1) for _ in range(n)]
+check("upper solve", close(matrix_times_vector(U, _tri_solve_vector(U, v, lower=False)), v))
+check("lower solve", close(matrix_times_vector(L, _tri_solve_vector(L, v, lower=True)), v))
+check("transposed solve", close(matrix_times_vector(U, _tri_solve_vector(L, v, lower=True, trans=True)), v))
+check("multi right-hand-side solve", close(matrix_mult(U, _tri_solve(U, [row[:] for row in D], lower=False)), D))
+check("upper inverse", close(_tri_inverse(U, lower=False), inverse(U)))
+check("lower inverse", close(_tri_inverse(L, lower=True), inverse(L)))
+G = [[random.uniform(-1, 1) + (3 if i == j else 0) for j in range(n)] for i in range(n)]
+check("LU inverse through triangular inverses", close(matrix_mult(G, factorize(G).inverse()), [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]))
+check("inverse of 6x6 still raises when singular", raises(inverse, [[i + j for j in range(6)] for i in range(6)]))
+
+print("\n6. Cholesky")
+print("-" * 70)
+G = [[random.uniform(-1, 1) for _ in range(8)] for _ in range(8)]
+SPD = matrix_mult(transpose(G), G)
+for i in range(8):
+    SPD[i][i] += 1.0
+L = cholesky(SPD)
+check("L L^T reproduces A", close(matrix_mult(L, transpose(L)), SPD))
+check("L is lower triangular", all(L[i][j] == 0.0 for i in range(8) for j in range(i + 1, 8)))
+b = [random.uniform(-1, 1) for _ in range(8)]
+check("cholesky_solve vector", close(cholesky_solve(L, b), factorize(SPD).solve(b)))
+B = [[random.uniform(-1, 1) for _ in range(3)] for _ in range(8)]
+check("cholesky_solve several right-hand sides", close(cholesky_solve(L, B), factorize(SPD).solve_many(B)))
+check("Matrix input", isinstance(cholesky(Matrix(SPD)), Matrix))
+check("solve_system on SPD input", close(solve_system(SPD, b), factorize(SPD).solve(b)))
+indefinite = [[1.0 if i == j else 0.0 for j in range(6)] for i in range(6)]
+indefinite[5][5] = -2.0
+indefinite[0][5] = indefinite[5][0] = 0.5
+check("indefinite raises", raises(cholesky, indefinite))
+check("non-symmetric raises", raises(cholesky, [[2, 1], [0, 2]]))
+check("solve_system falls back to LU on indefinite input", close(matrix_times_vector(indefinite, solve_system(indefinite, b[:6])), b[:6]))
+# at n >= 8 the auto backend reaches NumPy; symmetric input must still try Cholesky before Gauss-Jordan
+eliminations = []
+gauss_jordan = main._np_gauss_jordan
+main._np_gauss_jordan = lambda *args: eliminations.append(args) or gauss_jordan(*args)
+indefinite_8 = [row + [0.0, 0.0] for row in indefinite] + [[0.0] * 6 + [3.0, 0.0], [0.0] * 7 + [3.0]]
+x = solve_system(SPD, b)
+check("solve_system on 8x8 SPD input skips Gauss-Jordan", not eliminations and close(matrix_times_vector(SPD, x), b))
+x = solve_system(indefinite_8, b)
+check("8x8 indefinite input still solves", close(matrix_times_vector(indefinite_8, x), b))
+main._np_gauss_jordan = gauss_jordan
+main.set_backend("python")
+G = [[random.uniform(-1, 1) for _ in range(120)] for _ in range(120)]
+big = matrix_mult(transpose(G), G)
+for i in range(120):
+    big[i][i] += 1.0
+rhs = [1.0] * 120
+start = time.perf_counter()
+x = cholesky_solve(cholesky(big), rhs)
+chol_time = time.perf_counter() - start
+start = time.perf_counter()
+y = factorize(big).solve(rhs)
+lu_time = time.perf_counter() - start
+main.set_backend("auto")
+print(f"  120x120 SPD: Cholesky {chol_time:.4f}s, LU {lu_time:.4f}s")
+check("120x120 Cholesky matches LU", close(x, y, 1e-6))
+
+print("\n" + "=" * 70)
+print("FACTORIZATION TESTS COMPLETE")
+print("=" * 70)
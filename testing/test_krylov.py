@@ -0,0 +1,101 @@
+"""
+Test the Krylov solvers, the operator interface and the preconditioners
+"""
+import random
+from main import (
+    SparseMatrix, BandMatrix, LinearOperator, KrylovResult, conjugate_gradient,
+    gmres, bicgstab, jacobi_preconditioner, ilu0_preconditioner,
+    matrix_times_vector, solve_system, set_backend
+)
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) <= tol * max(1.0, abs(b))
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+        return False
+    except ValueError:
+        return True
+
+def grid_laplacian(k, shift=0.0, skew=0.0):
+    rows, cols, values = [], [], []
+    for a in range(k):
+        for c in range(k):
+            i = a * k + c
+            rows.append(i); cols.append(i); values.append(4.0 + shift)
+            for da, dc, sign in ((1, 0, 1), (-1, 0, -1), (0, 1, 1), (0, -1, -1)):
+                if 0 <= a + da < k and 0 <= c + dc < k:
+                    rows.append(i); cols.append((a + da) * k + c + dc); values.append(-1.0 + sign * skew)
+    return SparseMatrix.from_coo(rows, cols, values, (k * k, k * k))
+
+random.seed(18)
+set_backend("python")
+
+print("=" * 70)
+print("KRYLOV SOLVER TESTS")
+print("=" * 70)
+
+spd = grid_laplacian(20)
+n = spd.shape[0]
+b = [random.uniform(-1, 1) for _ in range(n)]
+reference = solve_system(spd, b)
+
+print("\n1. Conjugate gradient")
+print("-" * 70)
+plain = conjugate_gradient(spd, b, tol=1e-10)
+check("returns a KrylovResult", isinstance(plain, KrylovResult))
+check("converges to the direct solution", plain.converged and close(plain.x, reference))
+check("history has one entry per iteration", len(plain.residual_history) == plain.iterations + 1)
+jacobi = conjugate_gradient(spd, b, preconditioner="jacobi")
+ilu = conjugate_gradient(spd, b, preconditioner="ilu0")
+print(f"  iterations: none {plain.iterations}, Jacobi {jacobi.iterations}, ILU(0) {ilu.iterations}")
+check("Jacobi preconditioned", jacobi.converged and close(jacobi.x, reference))
+check("ILU(0) preconditioned", ilu.converged and close(ilu.x, reference))
+check("ILU(0) needs fewer iterations", ilu.iterations < plain.iterations)
+capped = conjugate_gradient(spd, b, max_iter=3)
+check("iteration limit reports non-convergence", not capped.converged and capped.iterations == 3)
+warm = conjugate_gradient(spd, b, x0=reference)
+check("exact initial guess needs no iterations", warm.iterations == 0 and warm.converged)
+
+print("\n2. GMRES and BiCGSTAB on a nonsymmetric system")
+print("-" * 70)
+nonsym = grid_laplacian(15, shift=0.5, skew=0.3)
+b2 = [random.uniform(-1, 1) for _ in range(nonsym.shape[0])]
+reference2 = solve_system(nonsym, b2)
+for name, result in [("GMRES", gmres(nonsym, b2)), ("GMRES restart 5", gmres(nonsym, b2, restart=5)),
+                     ("GMRES with ILU(0)", gmres(nonsym, b2, preconditioner="ilu0")),
+                     ("BiCGSTAB", bicgstab(nonsym, b2)), ("BiCGSTAB with Jacobi", bicgstab(nonsym, b2, preconditioner="jacobi"))]:
+    print(f"  {name}: {result.iterations} iterations")
+    check(f"{name} converges", result.converged and close(result.x, reference2))
+check("GMRES history ends at the true residual", close(gmres(nonsym, b2).residual, 0.0, 1e-8))
+
+print("\n3. Operator interface")
+print("-" * 70)
+size = 200
+def laplacian_1d(v):
+    return [2.0 * v[i] - (v[i - 1] if i else 0.0) - (v[i + 1] if i < size - 1 else 0.0) for i in range(size)]
+op = LinearOperator((size, size), laplacian_1d)
+rhs = [1.0] * size
+result = conjugate_gradient(op, rhs)
+check("matrix-free CG", result.converged and close(laplacian_1d(result.x), rhs))
+band = BandMatrix.tridiagonal([-1.0] * (size - 1), [2.0] * size, [-1.0] * (size - 1))
+check("BandMatrix operand", close(bicgstab(band, rhs).x, solve_system(band, rhs)))
+dense = [[4.0 if i == j else random.uniform(-0.5, 0.5) for j in range(12)] for i in range(12)]
+check("dense list operand", close(gmres(dense, [1.0] * 12).x, solve_system(dense, [1.0] * 12)))
+check("custom preconditioner operator", conjugate_gradient(spd, b, preconditioner=jacobi_preconditioner(spd)).converged)
+check("ILU(0) of a dense matrix", close(ilu0_preconditioner(dense).matrix_times_vector(matrix_times_vector(dense, [1.0] * 12)), [1.0] * 12))
+check("preconditioning a matrix-free operator raises", raises(conjugate_gradient, op, rhs, preconditioner="jacobi"))
+check("unknown preconditioner raises", raises(gmres, spd, b, preconditioner="ssor"))
+check("shape mismatch raises", raises(bicgstab, op, [1.0] * 5))
+
+set_backend("auto")
+print("\n" + "=" * 70)
+print("KRYLOV SOLVER TESTS COMPLETE")
+print("=" * 70)
@@ -0,0 +1,91 @@
+"""
+Test the blocked and Strassen multiplication kernels against a naive product
+"""
+import random
+import time
+import main
+from fractions import Fraction
+from main import matrix_mult, Matrix, set_backend
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) < tol
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def naive(A, B):
+    return [[sum(A[i][k] * B[k][j] for k in range(len(B))) for j in range(len(B[0]))] for i in range(len(A))]
+
+def rand(r, c):
+    return [[random.uniform(-5, 5) for _ in range(c)] for _ in range(r)]
+
+random.seed(12)
+set_backend("python")
+
+print("=" * 70)
+print("MATRIX MULTIPLICATION ENGINE TESTS")
+print("=" * 70)
+
+print("\n1. Blocked kernel")
+print("-" * 70)
+for shape in [(1, 1, 1), (3, 5, 2), (7, 1, 9), (70, 65, 130)]:
+    A, B = rand(shape[0], shape[1]), rand(shape[1], shape[2])
+    check(f"{shape[0]}x{shape[1]} times {shape[1]}x{shape[2]}", close(matrix_mult(A, B), naive(A, B)))
+check("integer inputs stay exact", matrix_mult([[1, 2], [3, 4]], [[5, 6], [7, 8]]) == [[19, 22], [43, 50]])
+product = matrix_mult([[0, 0], [1, 1]], [[1.0, 2.0], [3.0, 4.0]])
+check("zero rows of a float product are floats", product == [[0.0, 0.0], [4.0, 6.0]] and all(type(x) is float for row in product for x in row))
+
+saved = main.MULT_BLOCK_SIZE
+main.MULT_BLOCK_SIZE = 4
+A, B = rand(11, 9), rand(9, 13)
+check("small tiles give the same product", close(matrix_mult(A, B), naive(A, B)))
+main.MULT_BLOCK_SIZE = saved
+
+print("\n2. Strassen recursion")
+print("-" * 70)
+saved = main.STRASSEN_THRESHOLD
+main.STRASSEN_THRESHOLD = 4
+for shape in [(8, 8, 8), (9, 7, 11), (17, 16, 5), (33, 33, 33)]:
+    A, B = rand(shape[0], shape[1]), rand(shape[1], shape[2])
+    check(f"{shape[0]}x{shape[1]} times {shape[1]}x{shape[2]} (padded)", close(matrix_mult(A, B), naive(A, B)))
+A = [[Fraction(random.randint(-9, 9), random.randint(1, 9)) for _ in range(9)] for _ in range(9)]
+product = matrix_mult(A, A)
+check("odd-size Fraction product stays exact", product == naive(A, A) and all(type(x) is Fraction for row in product for x in row))
+main.STRASSEN_THRESHOLD = saved
+
+print("\n3. Matrix inputs")
+print("-" * 70)
+A, B = rand(6, 4), rand(4, 3)
+product = matrix_mult(Matrix(A), B)
+check("Matrix argument returns Matrix", isinstance(product, Matrix))
+check("Matrix product matches", close(product.tolist(), naive(A, B)))
+check("transposed view operand", close(matrix_mult(Matrix(B).transpose(), Matrix(A).transpose()).tolist(), [list(r) for r in zip(*naive(A, B))]))
+
+print("\n4. Exact input on the auto backend")
+print("-" * 70)
+# 8x8 reaches NumPy on the auto backend when it is installed; int and Fraction input must not go through float64
+set_backend("auto")
+big = [[random.randint(10 ** 9, 10 ** 10) for _ in range(8)] for _ in range(8)]
+check("8x8 int product is exact", matrix_mult(big, big) == naive(big, big))
+fractions = [[Fraction(1, random.randint(1, 50)) for _ in range(8)] for _ in range(8)]
+product = matrix_mult(fractions, fractions)
+check("8x8 Fraction product is exact", product == naive(fractions, fractions) and all(type(x) is Fraction for row in product for x in row))
+set_backend("python")
+
+print("\n5. Timing")
+print("-" * 70)
+A, B = rand(160, 160), rand(160, 160)
+start = time.perf_counter()
+fast = matrix_mult(A, B)
+engine = time.perf_counter() - start
+start = time.perf_counter()
+slow = naive(A, B)
+reference = time.perf_counter() - start
+print(f"  160x160: engine {engine:.3f}s, naive {reference:.3f}s")
+check("160x160 matches naive", close(fast, slow))
+
+set_backend("auto")
+print("\n" + "=" * 70)
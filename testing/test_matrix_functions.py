@@ -0,0 +1,100 @@
+"""
+Test matrix_power and expm against direct loops and series
+"""
+import math
+import random
+import time
+from fractions import Fraction
+from main import Matrix, matrix_power, expm, matrix_mult, inverse, set_backend
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, Matrix):
+        a = a.tolist()
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) <= tol * max(1.0, abs(b))
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args):
+    try:
+        func(*args)
+        return False
+    except ValueError:
+        return True
+
+def repeated(A, k):
+    result = A
+    for _ in range(k - 1):
+        result = matrix_mult(result, A)
+    return result
+
+def series_exp(A, terms=60):
+    n = len(A)
+    result = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    term = [row[:] for row in result]
+    for k in range(1, terms):
+        term = [[x / k for x in row] for row in matrix_mult(term, A)]
+        result = [[a + b for a, b in zip(r, t)] for r, t in zip(result, term)]
+    return result
+
+random.seed(20)
+set_backend("python")
+
+print("=" * 70)
+print("MATRIX FUNCTION TESTS")
+print("=" * 70)
+
+print("\n1. matrix_power")
+print("-" * 70)
+G = [[random.uniform(-0.5, 0.5) for _ in range(6)] for _ in range(6)]
+check("k = 0 is the identity", matrix_power(G, 0) == [[1.0 if i == j else 0.0 for j in range(6)] for i in range(6)])
+check("k = 1 is a copy", matrix_power(G, 1) == G and matrix_power(G, 1) is not G)
+for k in (2, 5, 13, 32):
+    check(f"k = {k} matches repeated multiplication", close(matrix_power(G, k), repeated(G, k)))
+check("negative power uses the inverse", close(matrix_power(G, -3), repeated(inverse(G), 3)))
+check("integer Fibonacci matrix", close(matrix_power([[1, 1], [1, 0]], 30), [[1346269, 832040], [832040, 514229]]))
+fib = matrix_power([[1, 1], [1, 0]], 90)
+check("large integer power stays exact", fib[0][1] == 2880067194370816120 and type(fib[0][1]) is int)
+half = matrix_power([[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 3), Fraction(1, 2)]], 70)
+check("Fraction power stays exact", half[0][0] == (Fraction(5, 6) ** 70 + Fraction(1, 6) ** 70) / 2)
+ints = [[random.randint(-3, 3) for _ in range(8)] for _ in range(8)]
+fracs = [[Fraction(random.randint(-3, 3), random.randint(1, 4)) for _ in range(8)] for _ in range(8)]
+set_backend("python")
+expected = [matrix_power(ints, 40), matrix_power(fracs, 12)]
+set_backend("auto")
+check("8x8 int power exact on the auto backend", matrix_power(ints, 40) == expected[0] and type(matrix_power(ints, 40)[0][0]) is int)
+check("8x8 Fraction power exact on the auto backend", matrix_power(fracs, 12) == expected[1])
+check("diagonal fast path", matrix_power([[2, 0], [0, 3]], 10) == [[1024, 0.0], [0.0, 59049]])
+S = [[G[i][j] + G[j][i] for j in range(6)] for i in range(6)]
+check("symmetric eigen path", close(matrix_power(S, 100), repeated(S, 100), 1e-6))
+check("Matrix input returns Matrix", isinstance(matrix_power(Matrix(G), 3), Matrix))
+check("non-integer power raises", raises(matrix_power, G, 2.5))
+
+P = [[random.random() for _ in range(8)] for _ in range(8)]
+P = [[x / sum(row) for x in row] for row in P]
+start = time.perf_counter()
+stationary = matrix_power(P, 10 ** 6)
+elapsed = time.perf_counter() - start
+print(f"  8x8 Markov chain to the 10^6 power: {elapsed:.4f}s")
+check("Markov chain rows converge to one stationary row", all(close(row, stationary[0]) for row in stationary))
+check("stationary rows still sum to one", close(sum(stationary[0]), 1.0))
+
+print("\n2. expm")
+print("-" * 70)
+check("zero matrix", close(expm([[0, 0], [0, 0]]), [[1, 0], [0, 1]]))
+check("diagonal", close(expm([[1, 0], [0, -2]]), [[math.e, 0], [0, math.exp(-2)]]))
+theta = 1.3
+check("rotation generator", close(expm([[0, -theta], [theta, 0]]), [[math.cos(theta), -math.sin(theta)], [math.sin(theta), math.cos(theta)]]))
+check("nilpotent", close(expm([[0, 1, 0], [0, 0, 1], [0, 0, 0]]), [[1, 1, 0.5], [0, 1, 1], [0, 0, 1]]))
+check("small random matches series", close(expm(G), series_exp(G), 1e-9))
+big = [[x * 8 for x in row] for row in G]
+check("large norm (scaling and squaring)", close(expm(big), series_exp(big, 200), 1e-6))
+check("expm(A) expm(-A) = I", close(matrix_mult(expm(big), expm([[-x for x in row] for row in big])), [[1.0 if i == j else 0.0 for j in range(6)] for i in range(6)], 1e-6))
+
+set_backend("auto")
+print("\n" + "=" * 70)
+print("MATRIX FUNCTION TESTS COMPLETE")
+print("=" * 70)
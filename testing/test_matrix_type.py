@@ -0,0 +1,112 @@
+"""
+Test that the packed Matrix type is accepted by every matrix function
+and that results come back as Matrix when a Matrix goes in
+"""
+from main import (
+    Matrix, rref, lu, qr, inverse, det, matrix_times_vector, matrix_mult,
+    solve_system, transpose, trace, rank, null, lin_ind, eigenvalues,
+    null_space, eigenvectors, diagonalize, col_space, row_space, change_of_basis
+)
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, Matrix):
+        a = a.tolist()
+    if isinstance(b, Matrix):
+        b = b.tolist()
+    if isinstance(a, list):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) < tol
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+print("=" * 70)
+print("PACKED MATRIX TYPE TESTS")
+print("=" * 70)
+
+lists_2x2 = [[1, 2], [3, 4]]
+lists_3x3 = [[1, 2, 3], [0, 1, 4], [5, 6, 0]]
+lists_2x3 = [[1, 2, 3], [4, 5, 6]]
+symmetric = [[2, 1], [1, 2]]
+M2 = Matrix(lists_2x2)
+M3 = Matrix(lists_3x3)
+M23 = Matrix(lists_2x3)
+
+print("\n1. Storage")
+print("-" * 70)
+check("shape", M23.shape == (2, 3))
+check("strides", M23.strides == (3, 1))
+check("typecode is packed double", M23.data.typecode == "d")
+check("tolist round trip", M23.tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+check("element access", M23[1, 2] == 6.0)
+check("row access", M23[1] == [4.0, 5.0, 6.0])
+check("negative element index", M23[0, -1] == 3.0 and M23[-1, 0] == 4.0 and M23.transpose()[-1, 0] == 3.0)
+
+def index_error(index, value=None):
+    try:
+        if value is None:
+            M23[index]
+        else:
+            M23[index] = value
+        return False
+    except IndexError:
+        return True
+
+check("column past the edge raises", index_error((0, 3)))
+check("row past the edge raises", index_error((2, 0)) and index_error((-3, 0)))
+check("out-of-range write raises and changes nothing", index_error((0, 3), 9.0) and M23.tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+W = Matrix([[1, 2], [3, 4]])
+W[0, -1] = 7.0
+check("negative write lands in the right cell", W.tolist() == [[1.0, 7.0], [3.0, 4.0]])
+check("Matrix.transpose is a view", M23.transpose().data is M23.data)
+T = transpose(M23)
+T[0, 1] = 100.0
+check("transpose() returns an independent copy", T.data is not M23.data and M23[1, 0] == 4.0)
+check("transpose values", transpose(M23).tolist() == [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]])
+try:
+    Matrix([])
+    check("empty Matrix rejected", False)
+except ValueError:
+    check("empty Matrix rejected", True)
+
+print("\n2. Results match list-of-lists and keep the Matrix type")
+print("-" * 70)
+for name, func, args, list_args in [
+    ("rref", rref, (M3,), (lists_3x3,)),
+    ("inverse", inverse, (M3,), (lists_3x3,)),
+    ("transpose", transpose, (M23,), (lists_2x3,)),
+    ("matrix_mult", matrix_mult, (M23, transpose(M23)), (lists_2x3, transpose(lists_2x3))),
+    ("null_space", null_space, (M23,), (lists_2x3,)),
+    ("col_space", col_space, (M23,), (lists_2x3,)),
+    ("row_space", row_space, (M23,), (lists_2x3,)),
+    ("change_of_basis", change_of_basis, (M2, Matrix([[1, 1], [0, 1]])), (lists_2x2, [[1, 1], [0, 1]])),
+]:
+    result = func(*args)
+    check(f"{name} returns Matrix", isinstance(result, Matrix))
+    check(f"{name} matches lists", close(result, func(*list_args)))
+
+L, U = lu(Matrix(symmetric))
+check("lu returns Matrix", isinstance(L, Matrix) and isinstance(U, Matrix))
+Q, R = qr(M3)
+check("qr returns Matrix", isinstance(Q, Matrix) and isinstance(R, Matrix))
+check("qr reconstructs", close(matrix_mult(Q, R), lists_3x3))
+P, D, P_inv = diagonalize(Matrix(symmetric))
+check("diagonalize returns Matrix", isinstance(P, Matrix) and isinstance(D, Matrix))
+
+print("\n3. Scalars and vectors")
+print("-" * 70)
+check("det", close(det(M3), det(lists_3x3)))
+check("trace", close(trace(M3), 2))
+check("rank", rank(M23) == 2)
+check("null", null(M23) == 1)
+check("lin_ind", lin_ind(M2))
+check("matrix_times_vector", close(matrix_times_vector(M23, [1, 1, 1]), [6, 15]))
+check("matrix_times_vector on view", close(matrix_times_vector(M23.transpose(), [1, 1]), [5, 7, 9]))
+check("solve_system", close(solve_system(M2, [5, 11]), [1, 2]))
+check("eigenvalues", close(sorted(eigenvalues(Matrix(symmetric))), [1, 3]))
+check("eigenvectors", len(eigenvectors(Matrix(symmetric))) == 2)
+
+print("\n" + "=" * 70)
+print("PACKED MATRIX TYPE TESTS COMPLETE")
+print("=" * 70)
@@ -0,0 +1,77 @@
+"""
+Test the matrix chain planner and multi_mult
+"""
+import random
+import time
+from main import Matrix, multi_mult, multi_mult_plan, matrix_mult, set_backend
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, Matrix):
+        a = a.tolist()
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) <= tol * max(1.0, abs(b))
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args):
+    try:
+        func(*args)
+        return False
+    except ValueError:
+        return True
+
+def rand(r, c):
+    return [[random.uniform(-1, 1) for _ in range(c)] for _ in range(r)]
+
+random.seed(19)
+set_backend("python")
+
+print("=" * 70)
+print("MATRIX CHAIN TESTS")
+print("=" * 70)
+
+print("\n1. Planning")
+print("-" * 70)
+plan = multi_mult_plan(rand(10, 30), rand(30, 5), rand(5, 60))
+print(f"  {plan}")
+check("textbook chain picks (A B) C", plan.order == ((0, 1), 2) and plan.flops == 4500)
+plan = multi_mult_plan(rand(40, 20), rand(20, 30), rand(30, 10), rand(10, 30))
+check("four operand optimum", plan.flops == 26000 and plan.describe() == "((M0 (M1 M2)) M3)")
+plan = multi_mult_plan(rand(200, 2), rand(2, 200), rand(200, 1))
+print(f"  {plan}")
+check("outer product chain avoids the 200x200 intermediate", plan.order == (0, (1, 2)) and plan.flops < plan.naive_flops / 50)
+check("single matrix plan", multi_mult_plan(rand(3, 4)).flops == 0)
+check("shape mismatch raises", raises(multi_mult_plan, rand(2, 3), rand(4, 2)))
+check("no operands raises", raises(multi_mult_plan))
+
+print("\n2. Products")
+print("-" * 70)
+chain = [rand(6, 3), rand(3, 8), rand(8, 2), rand(2, 7)]
+expected = matrix_mult(matrix_mult(matrix_mult(chain[0], chain[1]), chain[2]), chain[3])
+check("matches left-to-right product", close(multi_mult(*chain), expected))
+check("two operands match matrix_mult", close(multi_mult(chain[0], chain[1]), matrix_mult(chain[0], chain[1])))
+single = rand(3, 3)
+copy = multi_mult(single)
+copy[0][0] = 99.0
+check("single operand is copied", single[0][0] != 99.0)
+check("Matrix operand returns Matrix", isinstance(multi_mult(Matrix(chain[0]), chain[1]), Matrix))
+
+print("\n3. Timing")
+print("-" * 70)
+u, w, v = rand(300, 1), rand(1, 300), rand(300, 1)
+start = time.perf_counter()
+planned = multi_mult(u, w, v)
+fast = time.perf_counter() - start
+start = time.perf_counter()
+naive = matrix_mult(matrix_mult(u, w), v)
+slow = time.perf_counter() - start
+print(f"  300x1 * 1x300 * 300x1: planned {fast:.4f}s, left to right {slow:.4f}s")
+check("planned product matches", close(planned, naive))
+
+set_backend("auto")
+print("\n" + "=" * 70)
+print("MATRIX CHAIN TESTS COMPLETE")
+print("=" * 70)
@@ -0,0 +1,103 @@
+"""
+Test the multi-modular exact determinant and its batch entry point
+"""
+import random
+import time
+from fractions import Fraction
+from main import det, det_batch, MatrixStack, set_backend, get_backend
+import main
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+        return False
+    except ValueError:
+        return True
+
+def bareiss_det(A):
+    n = len(A)
+    _, pivot_cols, last, sign = main._bareiss([row[:] for row in A], n, jordan=False)
+    return sign * last if len(pivot_cols) == n else 0
+
+def random_int_matrix(n, size):
+    return [[random.randint(-size, size) for _ in range(n)] for _ in range(n)]
+
+random.seed(23)
+
+print("=" * 70)
+print("MULTI-MODULAR DETERMINANT TESTS")
+print("=" * 70)
+
+print("\n1. Residues and reconstruction")
+print("-" * 70)
+primes = main._det_primes(10 ** 30)
+product = 1
+for q in primes:
+    product *= q
+check("prime prefix covers the bound", product > 10 ** 30 and product // primes[-1] <= 10 ** 30)
+check("primes descend below 2^31", all(main._is_prime(q) and q < 1 << 31 for q in primes) and primes == sorted(primes, reverse=True))
+A = random_int_matrix(12, 1000)
+reference = bareiss_det(A)
+q = primes[0]
+check("det mod p matches", main._det_mod_p([[x % q for x in row] for row in A], q) == reference % q)
+check("CRT rebuilds the exact value", main._multimodular_det(A) == reference)
+check("negative determinant", main._multimodular_det([[0, 1], [1, 0]]) == -1)
+check("singular gives 0", main._multimodular_det([[1, 2, 3], [2, 4, 6], [7, 8, 9]]) == 0)
+check("zero row gives 0", main._multimodular_det([[0, 0], [5, 7]]) == 0)
+huge = [[random.randint(-10 ** 40, 10 ** 40) for _ in range(6)] for _ in range(6)]
+check("entries past 64 bits", main._multimodular_det(huge) == bareiss_det(huge))
+
+print("\n2. det(A, exact=True)")
+print("-" * 70)
+backend = get_backend()
+for name in ["python", "numpy"] if backend == "numpy" else ["python"]:
+    set_backend(name)
+    for n in [1, 3, 9, 25]:
+        A = random_int_matrix(n, 10 ** 6)
+        check(f"{name} {n}x{n} exact det", det(A, exact=True) == bareiss_det(A))
+    H = [[Fraction(1, i + j + 1) for j in range(4)] for i in range(4)]
+    check(f"{name} Fraction input divides out the row scales", main._exact_det(H, workers=1) == Fraction(1, 6048000))
+    A = random_int_matrix(10, 100)
+    check(f"{name} modular path matches Bareiss", main._exact_det(A, workers=1) == bareiss_det(A))
+set_backend(backend)
+A = random_int_matrix(20, 10 ** 6)
+check("worker pool gives the same value", det(A, exact=True, workers=2) == bareiss_det(A))
+check("integer matrix gives an int", type(det(A, exact=True)) is int)
+check("non-integral det stays a Fraction", det([[Fraction(1, 2), 0], [0, 1]]) == Fraction(1, 2))
+check("integral Fraction det gives an int", type(det([[Fraction(1, 2), 0], [0, 2]])) is int)
+check("batch results are ints", all(type(d) is int for d in det_batch([[[1, 2], [3, 4]], [[2, 0], [0, 3]]], exact=True)))
+check("float det loses digits", det(A) != bareiss_det(A))
+
+print("\n3. det_batch(stack, exact=True)")
+print("-" * 70)
+matrices = [random_int_matrix(n, 50) for n in [2, 5, 8]]
+expected = [bareiss_det(A) for A in matrices]
+check("mixed sizes", det_batch(matrices, exact=True) == expected)
+check("worker pool", det_batch(matrices, exact=True, workers=2) == expected)
+same = [random_int_matrix(4, 9) for _ in range(3)]
+check("integral MatrixStack", det_batch(MatrixStack(same), exact=True) == [bareiss_det(A) for A in same])
+check("fractional MatrixStack rejected", raises(det_batch, MatrixStack([[[0.5, 1], [1, 1]]]), exact=True))
+check("float entries rejected", raises(det_batch, [[[1.5, 2], [3, 4]]], exact=True))
+check("non-square rejected", raises(det_batch, [[[1, 2, 3], [4, 5, 6]]], exact=True))
+check("empty stack rejected", raises(det_batch, [], exact=True))
+check("float batch unchanged", abs(det_batch([[[1, 2], [3, 4]]])[0] + 2) < 1e-12)
+
+print("\n4. Performance")
+print("-" * 70)
+A = random_int_matrix(40, 10 ** 6)
+start = time.perf_counter()
+slow = bareiss_det(A)
+bareiss = time.perf_counter() - start
+start = time.perf_counter()
+fast = det(A, exact=True)
+elapsed = time.perf_counter() - start
+print(f"  40x40 entries 1e6 ({slow.bit_length()}-bit det): det {elapsed:.4f}s, Bareiss {bareiss:.4f}s")
+check("exact det at 40x40", fast == slow)
+
+print("\n" + "=" * 70)
+print("MULTI-MODULAR DETERMINANT TESTS COMPLETE")
+print("=" * 70)
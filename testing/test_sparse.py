@@ -0,0 +1,125 @@
+"""
+Test the sparse matrix type and the Markowitz-ordered sparse elimination
+"""
+import random
+import time
+from main import (
+    SparseMatrix, rref, rank, null_space, solve_system, factorize, det,
+    matrix_times_vector, transpose, set_backend
+)
+
+def close(a, b, tol=1e-6):
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) <= tol * max(1.0, abs(b))
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args):
+    try:
+        func(*args)
+        return False
+    except ValueError:
+        return True
+
+def random_sparse(num_rows, num_cols, per_row, diagonal=0.0):
+    rows, cols, values = [], [], []
+    for i in range(num_rows):
+        for j in random.sample(range(num_cols), per_row):
+            rows.append(i)
+            cols.append(j)
+            values.append(float(random.randint(-4, 4) or 1))
+        if diagonal and i < num_cols:
+            rows.append(i)
+            cols.append(i)
+            values.append(diagonal)
+    return SparseMatrix.from_coo(rows, cols, values, (num_rows, num_cols))
+
+random.seed(17)
+set_backend("python")
+
+print("=" * 70)
+print("SPARSE MATRIX TESTS")
+print("=" * 70)
+
+print("\n1. Storage")
+print("-" * 70)
+dense = [[0, 2, 0, 0], [1, 0, 0, 3], [0, 0, 0, 0]]
+S = SparseMatrix.from_dense(dense)
+check("only nonzeros stored", S.nnz == 3)
+check("round trip to dense", S.tolist() == dense)
+check("element access", S[1, 3] == 3 and S[2, 2] == 0.0)
+check("duplicates summed in COO input", SparseMatrix.from_coo([0, 0], [1, 1], [2.0, 3.0], (1, 2)).tolist() == [[0.0, 5.0]])
+check("out-of-range COO entry raises", raises(SparseMatrix.from_coo, [0], [4], [1.0], (2, 2)))
+check("COO round trip", SparseMatrix.from_coo(*S.to_coo(), S.shape) == S)
+check("transpose", transpose(S).tolist() == transpose(dense))
+check("matrix_times_vector", matrix_times_vector(S, [1, 2, 3, 4]) == [4.0, 13.0, 0.0])
+
+print("\n2. Agreement with dense elimination")
+print("-" * 70)
+for trial in range(4):
+    S = random_sparse(12, 15, 2)
+    D = S.tolist()
+    check(f"rref matches dense (trial {trial + 1})", close(rref(S).tolist(), rref(D)))
+    check(f"rank matches dense (trial {trial + 1})", rank(S) == rank(D))
+    basis = null_space(S).tolist()
+    check(f"null space size and A v = 0 (trial {trial + 1})",
+          len(basis) == 15 - rank(D) and all(close(matrix_times_vector(D, v), [0.0] * 12) for v in basis))
+deficient = SparseMatrix.from_dense([[1, 2, 0], [2, 4, 0], [0, 0, 1]])
+check("rank-deficient rank", rank(deficient) == 2)
+check("full-rank null space is the zero vector", null_space(SparseMatrix.from_dense([[1, 0], [0, 2]])).tolist() == [[0.0, 0.0]])
+A = random_sparse(20, 20, 3, diagonal=10.0)
+b = [random.uniform(-1, 1) for _ in range(20)]
+check("solve matches dense", close(solve_system(A, b), solve_system(A.tolist(), b)))
+check("det matches dense", close(factorize(A).det(), det(A.tolist()), 1e-8))
+check("singular solve raises", raises(solve_system, deficient, [1, 2, 3]))
+check("non-square solve raises", raises(solve_system, SparseMatrix.from_dense([[1, 2, 3]]), [1]))
+
+print("\n3. Fill-reducing order")
+print("-" * 70)
+n = 400
+rows, cols, values = [], [], []
+for i in range(n):
+    rows.append(i); cols.append(i); values.append(4.0)
+    if i:
+        rows += [0, i]; cols += [i, 0]; values += [1.0, 1.0]
+arrow = SparseMatrix.from_coo(rows, cols, values, (n, n))
+F = factorize(arrow)
+stored = sum(len(U_row) for _, _, U_row, _ in F.steps)
+print(f"  arrow matrix: {arrow.nnz} nonzeros in A, {stored} in U")
+check("arrow matrix factors without fill", stored <= arrow.nnz)
+x = F.solve([1.0] * n)
+check("arrow solve residual", close(matrix_times_vector(arrow, x), [1.0] * n))
+
+print("\n4. Large systems")
+print("-" * 70)
+k = 50
+rows, cols, values = [], [], []
+for a in range(k):
+    for c in range(k):
+        i = a * k + c
+        rows.append(i); cols.append(i); values.append(4.0)
+        for da, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if 0 <= a + da < k and 0 <= c + dc < k:
+                rows.append(i); cols.append((a + da) * k + c + dc); values.append(-1.0)
+grid = SparseMatrix.from_coo(rows, cols, values, (k * k, k * k))
+rhs = [1.0] * (k * k)
+start = time.perf_counter()
+x = solve_system(grid, rhs)
+elapsed = time.perf_counter() - start
+print(f"  2500x2500 grid Laplacian with {grid.nnz} nonzeros: solve {elapsed:.3f}s")
+check("grid Laplacian solve residual", close(matrix_times_vector(grid, x), rhs))
+wide = random_sparse(1500, 4000, 3)
+start = time.perf_counter()
+r = rank(wide)
+reduced = rref(wide)
+elapsed = time.perf_counter() - start
+print(f"  1500x4000 rank and rref: {elapsed:.3f}s, rank {r}, {reduced.nnz} nonzeros in rref")
+check("rank agrees with rref pivots", r == sum(1 for i in range(1500) if reduced.indptr[i + 1] > reduced.indptr[i]))
+
+set_backend("auto")
+print("\n" + "=" * 70)
+print("SPARSE MATRIX TESTS COMPLETE")
+print("=" * 70)
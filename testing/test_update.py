@@ -0,0 +1,124 @@
+"""
+Test Sherman-Morrison-Woodbury inverse updates and Bennett LU updates
+"""
+import random
+import time
+from fractions import Fraction
+from main import update, factorize, inverse, solve_system, det, Matrix, set_backend, get_backend
+import main
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+def raises(func, *args):
+    try:
+        func(*args)
+        return False
+    except ValueError:
+        return True
+
+def close(a, b, tol=1e-8):
+    if isinstance(a, list):
+        return len(a) == len(b) and all(close(x, y, tol) for x, y in zip(a, b))
+    return abs(a - b) <= tol * max(1.0, abs(b))
+
+def random_matrix(n, m):
+    return [[random.uniform(-1, 1) for _ in range(m)] for _ in range(n)]
+
+def plus_outer(A, U, V):
+    # A + U V^T for n x k U and V
+    k = len(U[0])
+    return [[a + sum(U[i][t] * V[j][t] for t in range(k)) for j, a in enumerate(row)] for i, row in enumerate(A)]
+
+def column(u):
+    return [[x] for x in u]
+
+random.seed(24)
+
+print("=" * 70)
+print("LOW-RANK UPDATE TESTS")
+print("=" * 70)
+
+print("\n1. Rank-one LU updates")
+print("-" * 70)
+n = 30
+A = random_matrix(n, n)
+u = [random.uniform(-1, 1) for _ in range(n)]
+v = [random.uniform(-1, 1) for _ in range(n)]
+b = [random.uniform(-1, 1) for _ in range(n)]
+A1 = plus_outer(A, column(u), column(v))
+F = factorize(A)
+G = update(F, u, v)
+check("factors rebuild A", close(main._lu_product(F), A))
+check("updated solve", close(G.solve(b), solve_system(A1, b)))
+check("updated det", close(G.det(), det(A1)))
+check("updated inverse", close(G.inverse(), inverse(A1)))
+check("original factorization untouched", close(F.solve(b), solve_system(A, b)))
+H = F
+for _ in range(5):
+    u = [random.uniform(-1, 1) for _ in range(n)]
+    v = [random.uniform(-1, 1) for _ in range(n)]
+    A = plus_outer(A, column(u), column(v))
+    H = update(H, u, v)
+check("five successive updates", close(H.solve(b), solve_system(A, b)))
+G = update(factorize([[1.0, 0.0], [0.0, 1.0]]), [1.0, 1.0], [-1.0, 1.0])
+check("vanishing pivot refactors", close(G.solve([1.0, 1.0]), solve_system([[0.0, 1.0], [-1.0, 2.0]], [1.0, 1.0])))
+check("singular result raises", raises(update, factorize([[1.0, 0.0], [0.0, 1.0]]), [1.0, 0.0], [-1.0, 1.0]))
+
+print("\n2. Rank-k LU updates")
+print("-" * 70)
+A = random_matrix(n, n)
+U, V = random_matrix(n, 3), random_matrix(n, 3)
+G = update(factorize(A), U, V)
+check("rank-3 solve", close(G.solve(b), solve_system(plus_outer(A, U, V), b)))
+check("rank-3 det", close(G.det(), det(plus_outer(A, U, V))))
+
+print("\n3. Sherman-Morrison-Woodbury inverse updates")
+print("-" * 70)
+backend = get_backend()
+for name in ["python", "numpy"] if backend == "numpy" else ["python"]:
+    set_backend(name)
+    A = random_matrix(n, n)
+    B = inverse(A)
+    u = [random.uniform(-1, 1) for _ in range(n)]
+    v = [random.uniform(-1, 1) for _ in range(n)]
+    check(f"{name} rank-one inverse", close(update(B, u, v), inverse(plus_outer(A, column(u), column(v)))))
+    U, V = random_matrix(n, 4), random_matrix(n, 4)
+    check(f"{name} rank-4 inverse", close(update(B, U, V), inverse(plus_outer(A, U, V))))
+    check(f"{name} packed Matrix stays packed", isinstance(update(Matrix(B), u, v), Matrix))
+set_backend(backend)
+e0 = [1.0, 0.0]
+check("row replacement", close(update([[1.0, 0.0], [0.0, 1.0]], e0, [1.0, 2.0]), inverse([[2.0, 2.0], [0.0, 1.0]])))
+check("singular update raises", raises(update, [[1.0, 0.0], [0.0, 1.0]], e0, [-1.0, 0.0]))
+B = inverse([[Fraction(2), Fraction(1)], [Fraction(1), Fraction(3)]])
+exact = update(B, [Fraction(1), Fraction(0)], [Fraction(0), Fraction(1)])
+check("Fraction inverse stays exact", exact == inverse([[Fraction(2), Fraction(2)], [Fraction(1), Fraction(3)]]))
+
+print("\n4. Input validation")
+print("-" * 70)
+F = factorize([[2.0, 1.0], [1.0, 3.0]])
+check("wrong vector length", raises(update, F, [1.0], [1.0, 2.0]))
+check("column count mismatch", raises(update, F, [[1.0, 0.0], [0.0, 1.0]], [[1.0], [1.0]]))
+check("non-square inverse", raises(update, [[1.0, 2.0, 3.0]], [1.0], [1.0, 2.0, 3.0]))
+check("banded factorization rejected", raises(update, factorize(main.BandMatrix.tridiagonal([1.0], [2.0, 2.0], [1.0])), [1.0, 0.0], [0.0, 1.0]))
+
+print("\n5. Performance")
+print("-" * 70)
+n = 200
+A = random_matrix(n, n)
+u = [random.uniform(-1, 1) for _ in range(n)]
+v = [random.uniform(-1, 1) for _ in range(n)]
+B = inverse(A)
+start = time.perf_counter()
+fresh = inverse(plus_outer(A, column(u), column(v)))
+full = time.perf_counter() - start
+start = time.perf_counter()
+refreshed = update(B, u, v)
+rank_one = time.perf_counter() - start
+print(f"  200x200: inverse {full:.4f}s, update {rank_one:.4f}s")
+check("refreshed inverse matches", close(refreshed, fresh, 1e-6))
+
+print("\n" + "=" * 70)
+print("LOW-RANK UPDATE TESTS COMPLETE")
+print("=" * 70)
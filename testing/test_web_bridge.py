@@ -0,0 +1,52 @@
+"""
+Test the Pyodide bridge: results must survive the JSON round trip the web terminal does
+"""
+import json
+import os
+import re
+import main
+
+def check(name, condition):
+    print(f"{'✓' if condition else '✗'} {name}")
+    return condition
+
+# the snippet src/utils/parser.js appends to the workspace assignments, run the way Pyodide runs it:
+# in the namespace linalg.py was loaded into, with the last line's value as the result
+parser = open(os.path.join(os.path.dirname(__file__), "..", "src", "utils", "parser.js")).read()
+template = re.search(r"pythonCode \+= `\n(.*?)`;", parser, re.S).group(1)
+
+def bridge(func_name, *args):
+    namespace = dict(vars(main))
+    code = ""
+    names = []
+    for idx, arg in enumerate(args):
+        code += f"_temp_{idx} = {json.dumps(arg)}\n"
+        names.append(f"_temp_{idx}")
+    code += template.replace("${funcName}", func_name).replace("${pythonArgs}", ", ".join(names))
+    *body, last = code.strip().split("\n")
+    exec("\n".join(body), namespace)
+    return json.loads(eval(last, namespace))
+
+print("=" * 70)
+print("WEB BRIDGE TESTS")
+print("=" * 70)
+
+print("\n1. Real results are unchanged")
+print("-" * 70)
+check("det", bridge("det", [[4, 7], [2, 6]]) == main.det([[4, 7], [2, 6]]))
+check("inverse", bridge("inverse", [[4, 7], [2, 6]]) == main.inverse([[4, 7], [2, 6]]))
+check("lu tuple becomes a list", bridge("lu", [[4, 3], [6, 3]]) == [list(part) for part in main.lu([[4, 3], [6, 3]])])
+check("symmetric eigenvalues", bridge("eigenvalues", [[2, 1], [1, 2]]) == main.eigenvalues([[2, 1], [1, 2]]))
+
+print("\n2. Complex results")
+print("-" * 70)
+values = bridge("eigenvalues", [[1, 2], [-2, 1]])
+check("rotation eigenvalues serialize", all(isinstance(v, str) for v in values))
+check("written as a+bi", sorted(values) == sorted(["1.0+2.0i", "1.0-2.0i"]))
+pairs = bridge("eigenvectors", [[0, -1], [1, 0]])
+check("complex eigenvectors serialize", sorted(lam for lam, _ in pairs) == ["0.0+1.0i", "0.0-1.0i"] and all(isinstance(v[0], str) for _, basis in pairs for v in basis))
+check("Fraction written as p/q", main.to_json([main.Fraction(1, 3)]) == '["1/3"]')
+
+print("\n" + "=" * 70)
+print("WEB BRIDGE TESTS COMPLETE")
+print("=" * 70)